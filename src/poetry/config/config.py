@@ -107,6 +107,10 @@ _default_config: Config | None = None
 class Config:
     default_config: ClassVar[dict[str, Any]] = {
         "cache-dir": str(DEFAULT_CACHE_DIR),
+        "cache": {
+            "max-size": None,
+            "max-age": None,
+        },
         "virtualenvs": {
             "create": True,
             "in-project": None,
@@ -128,6 +132,7 @@ class Config:
             "max-workers": None,
             "no-binary": None,
             "only-binary": None,
+            "link-mode": "copy",
         },
         "solver": {
             "lazy-wheel": True,
@@ -212,10 +217,22 @@ class Config:
     def repository_cache_directory(self) -> Path:
         return Path(self.get("cache-dir")).expanduser() / "cache" / "repositories"
 
+    @property
+    def package_info_cache_directory(self) -> Path:
+        return Path(self.get("cache-dir")).expanduser() / "cache" / "package-info"
+
     @property
     def artifacts_cache_directory(self) -> Path:
         return Path(self.get("cache-dir")).expanduser() / "artifacts"
 
+    @property
+    def unpacked_wheels_cache_directory(self) -> Path:
+        return Path(self.get("cache-dir")).expanduser() / "unpacked"
+
+    @property
+    def build_environments_cache_directory(self) -> Path:
+        return Path(self.get("cache-dir")).expanduser() / "build-environments"
+
     @property
     def virtualenvs_path(self) -> Path:
         path = self.get("virtualenvs.path")
@@ -310,6 +327,8 @@ class Config:
             return lambda val: str(Path(val))
 
         if name in {
+            "cache.max-size",
+            "cache.max-age",
             "installer.max-workers",
             "requests.max-retries",
         }:
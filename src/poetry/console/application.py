@@ -75,6 +75,7 @@ COMMANDS = [
     # Cache commands
     "cache clear",
     "cache list",
+    "cache prune",
     # Debug commands
     "debug info",
     "debug resolve",
@@ -389,6 +390,7 @@ class Application(BaseApplication):
             poetry.config,
             disable_cache=poetry.disable_cache,
         )
+        installer.prune_caches()
         command.set_installer(installer)
 
     def _load_plugins(self, io: IO) -> None:
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from typing import ClassVar
+
+from cleo.helpers import option
+
+from poetry.config.config import Config
+from poetry.console.commands.command import Command
+from poetry.utils.cache import prune_caches
+from poetry.utils.helpers import pluralize
+
+
+if TYPE_CHECKING:
+    from cleo.io.inputs.option import Option
+
+
+class CachePruneCommand(Command):
+    name = "cache prune"
+    description = "Removes the least recently used entries of Poetry's caches."
+
+    options: ClassVar[list[Option]] = [
+        option(
+            "max-size",
+            description=(
+                "The maximum size of the caches in megabytes."
+                " Defaults to the <comment>cache.max-size</comment> setting."
+            ),
+            flag=False,
+        ),
+        option(
+            "max-age",
+            description=(
+                "The maximum number of days since the last use of cache entries."
+                " Defaults to the <comment>cache.max-age</comment> setting."
+            ),
+            flag=False,
+        ),
+    ]
+
+    def handle(self) -> int:
+        try:
+            max_size = self._get_limit("max-size")
+            max_age = self._get_limit("max-age")
+        except ValueError as e:
+            self.line_error(f"<error>{e}</error>")
+            return 1
+
+        config = Config.create()
+        if (
+            max_size is None
+            and max_age is None
+            and config.get("cache.max-size") is None
+            and config.get("cache.max-age") is None
+        ):
+            self.line_error(
+                "<error>No cache limits configured. Pass --max-size or --max-age"
+                " or set cache.max-size or cache.max-age.</error>"
+            )
+            return 1
+
+        removed = prune_caches(config, max_size=max_size, max_age=max_age)
+
+        count = len(removed)
+        size = sum(entry.size for entry in removed) / 1024**2
+        self.line(
+            f"Removed <info>{count}</> cache item{pluralize(count)}"
+            f" (<info>{size:.1f} MB</>)"
+        )
+
+        return 0
+
+    def _get_limit(self, name: str) -> int | None:
+        value = self.option(name)
+        if value is None:
+            return None
+
+        try:
+            limit = int(value)
+        except ValueError:
+            limit = -1
+
+        if limit < 0:
+            raise ValueError(
+                f"The --{name} option must be a non-negative integer, got {value!r}."
+            )
+
+        return limit
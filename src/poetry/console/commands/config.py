@@ -72,6 +72,8 @@ To remove a repository (repo is a short alias for repositories):
     def unique_config_values(self) -> dict[str, tuple[Any, Any]]:
         unique_config_values = {
             "cache-dir": (str, lambda val: str(Path(val))),
+            "cache.max-size": (lambda val: int(val) > 0, int_normalizer),
+            "cache.max-age": (lambda val: int(val) > 0, int_normalizer),
             "virtualenvs.create": (boolean_validator, boolean_normalizer),
             "virtualenvs.in-project": (boolean_validator, boolean_normalizer),
             "virtualenvs.options.always-copy": (boolean_validator, boolean_normalizer),
@@ -96,6 +98,7 @@ To remove a repository (repo is a short alias for repositories):
                 PackageFilterPolicy.validator,
                 PackageFilterPolicy.normalize,
             ),
+            "installer.link-mode": (lambda val: val in {"copy", "hardlink"}, str),
             "solver.lazy-wheel": (boolean_validator, boolean_normalizer),
             "keyring.enabled": (boolean_validator, boolean_normalizer),
         }
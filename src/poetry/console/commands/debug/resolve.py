@@ -35,6 +35,12 @@ class DebugResolveCommand(InitCommand):
         option("python", None, "Python version(s) to use for resolution.", flag=False),
         option("tree", None, "Display the dependency tree."),
         option("install", None, "Show what would be installed for the current system."),
+        option(
+            "profile",
+            None,
+            "Profile the dependency resolution and write the results to"
+            " <comment>poetry-profile.json</> and <comment>poetry-profile.folded</>.",
+        ),
     ]
 
     loggers: ClassVar[list[str]] = [
@@ -47,6 +53,7 @@ class DebugResolveCommand(InitCommand):
         from poetry.core.packages.project_package import ProjectPackage
 
         from poetry.factory import Factory
+        from poetry.puzzle.profiler import Profiler
         from poetry.puzzle.solver import Solver
         from poetry.repositories.repository import Repository
         from poetry.repositories.repository_pool import RepositoryPool
@@ -91,7 +98,13 @@ class DebugResolveCommand(InitCommand):
 
         solver = Solver(package, pool, [], [], self.io)
 
-        ops = solver.solve().calculate_operations()
+        profiler = Profiler() if self.option("profile") else None
+        try:
+            with solver.provider.use_profiler(profiler):
+                ops = solver.solve().calculate_operations()
+        finally:
+            if profiler is not None:
+                profiler.display(self.io, self.poetry.pyproject_path.parent)
 
         self.line("")
         self.line("Resolution results:")
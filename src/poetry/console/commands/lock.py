@@ -1,21 +1,40 @@
 from __future__ import annotations
 
+from pathlib import Path
 from typing import TYPE_CHECKING
 from typing import ClassVar
 
+from cleo.helpers import argument
 from cleo.helpers import option
 
 from poetry.console.commands.installer_command import InstallerCommand
 
 
 if TYPE_CHECKING:
+    from cleo.io.buffered_io import BufferedIO
+    from cleo.io.inputs.argument import Argument
     from cleo.io.inputs.option import Option
+    from cleo.io.io import IO
+
+    from poetry.installation.installer import Installer
+    from poetry.poetry import Poetry
+    from poetry.repositories.repository import Repository
+    from poetry.utils.env import Env
 
 
 class LockCommand(InstallerCommand):
     name = "lock"
     description = "Locks the project dependencies."
 
+    arguments: ClassVar[list[Argument]] = [
+        argument(
+            "projects",
+            "Directories of further projects to lock together with the current"
+            " project.",
+            optional=True,
+            multiple=True,
+        )
+    ]
     options: ClassVar[list[Option]] = [
         option(
             "regenerate",
@@ -23,6 +42,12 @@ class LockCommand(InstallerCommand):
             "Ignore existing lock file"
             " and overwrite it with a new lock file created from scratch.",
         ),
+        option(
+            "profile",
+            None,
+            "Profile the dependency resolution and write the results to"
+            " <comment>poetry-profile.json</> and <comment>poetry-profile.folded</>.",
+        ),
     ]
 
     help = """
@@ -34,11 +59,123 @@ By default, packages that have already been added to the lock file before
 will not be updated.
 
 <info>poetry lock</info>
+
+If the directories of further projects are given, these projects are locked
+at the same time. All projects share the metadata of their common repositories.
+
+<info>poetry lock ../other-project</info>
 """
 
     loggers: ClassVar[list[str]] = ["poetry.repositories.pypi_repository"]
 
     def handle(self) -> int:
-        self.installer.lock(update=self.option("regenerate"))
+        projects = self.argument("projects")
+        if projects:
+            return self._lock_projects([Path(project) for project in projects])
+
+        return self._lock(self.installer, self.io, self.poetry)
+
+    def _lock(self, installer: Installer, io: IO, poetry: Poetry) -> int:
+        from poetry.puzzle.profiler import Profiler
+
+        profiler = Profiler() if self.option("profile") else None
+        installer.lock(update=self.option("regenerate"))
+        installer.profile(profiler)
+
+        try:
+            return installer.run()
+        finally:
+            if profiler is not None:
+                profiler.display(io, poetry.pyproject_path.parent)
+
+    def _lock_projects(self, paths: list[Path]) -> int:
+        """
+        Lock the current project and the given projects at the same time.
+
+        The projects are locked on worker threads. Repositories with the same
+        name and url are shared between the projects, so that their metadata
+        is only fetched once. The environments of the further projects are only
+        looked up, but never created. The output of the further projects is
+        displayed after they have been locked.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+        from concurrent.futures import as_completed
+
+        from cleo.io.buffered_io import BufferedIO
+
+        from poetry.factory import Factory
+        from poetry.utils.env import EnvManager
+
+        repositories: dict[tuple[object, ...], Repository] = {}
+        self._share_repositories(self.poetry, repositories)
+
+        disable_plugins = self.io.input.has_parameter_option("--no-plugins")
+        projects = []
+        for path in paths:
+            io = BufferedIO()
+            io.set_verbosity(self.io.output.verbosity)
+            poetry = Factory().create_poetry(
+                path,
+                io=io,
+                disable_plugins=disable_plugins,
+                disable_cache=self.poetry.disable_cache,
+            )
+            self._share_repositories(poetry, repositories)
+            env = EnvManager(poetry, io=io).get()
+            projects.append((poetry, env, io))
+
+        max_workers = min(len(projects), self.poetry.config.installer_max_workers)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self._lock_project, poetry, env, io): (poetry, io)
+                for poetry, env, io in projects
+            }
+
+            # The current project is locked in the meantime.
+            exit_code = self._lock(self.installer, self.io, self.poetry)
+
+            for future in as_completed(futures):
+                poetry, io = futures[future]
+                self.line("")
+                self.line(f"<info>Locking</> <c1>{poetry.pyproject_path.parent}</>")
+                self.io.write(io.fetch_output())
+                self.io.write_error(io.fetch_error())
+
+                exit_code = max(exit_code, future.result())
+
+        return exit_code
+
+    def _lock_project(self, poetry: Poetry, env: Env, io: BufferedIO) -> int:
+        from poetry.installation.installer import Installer
+
+        installer = Installer(
+            io,
+            env,
+            poetry.package,
+            poetry.locker,
+            poetry.pool,
+            poetry.config,
+            disable_cache=poetry.disable_cache,
+        )
+
+        return self._lock(installer, io, poetry)
+
+    @staticmethod
+    def _share_repositories(
+        poetry: Poetry, repositories: dict[tuple[object, ...], Repository]
+    ) -> None:
+        from poetry.repositories.repository_pool import RepositoryPool
+
+        pool = RepositoryPool(config=poetry.config)
+        for repository in poetry.pool.all_repositories:
+            key = (
+                type(repository),
+                repository.name.lower(),
+                getattr(repository, "url", None),
+            )
+            pool.add_repository(
+                repositories.setdefault(key, repository),
+                priority=poetry.pool.get_priority(repository.name),
+            )
 
-        return self.installer.run()
+        poetry.set_pool(pool)
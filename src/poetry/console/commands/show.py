@@ -12,6 +12,9 @@ from poetry.console.commands.group_command import GroupCommand
 
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from collections.abc import Iterator
+
     from cleo.io.inputs.argument import Argument
     from cleo.io.inputs.option import Option
     from cleo.io.io import IO
@@ -21,6 +24,7 @@ if TYPE_CHECKING:
     from poetry.core.packages.package import Package
     from poetry.core.packages.project_package import ProjectPackage
 
+    from poetry.puzzle.provider import Provider
     from poetry.repositories.repository import Repository
 
 
@@ -235,6 +239,23 @@ lists all packages available."""
         latest_statuses = {}
         installed_repo = InstalledRepository.load(self.env)
 
+        if show_latest:
+            for locked, latest in self.find_latest_packages(
+                (
+                    locked
+                    for locked in locked_packages
+                    if locked in required_locked_packages or show_all
+                ),
+                root,
+            ):
+                if not latest:
+                    latest = locked
+
+                latest_packages[locked.pretty_name] = latest
+                latest_statuses[locked.pretty_name] = self.get_update_status(
+                    latest, locked
+                )
+
         # Computing widths
         for locked in locked_packages:
             if locked not in required_locked_packages and not show_all:
@@ -250,14 +271,8 @@ lists all packages available."""
                     current_length += 4
 
             if show_latest:
-                latest = self.find_latest_package(locked, root)
-                if not latest:
-                    latest = locked
-
-                latest_packages[locked.pretty_name] = latest
-                update_status = latest_statuses[locked.pretty_name] = (
-                    self.get_update_status(latest, locked)
-                )
+                latest = latest_packages[locked.pretty_name]
+                update_status = latest_statuses[locked.pretty_name]
 
                 if not self.option("outdated") or update_status != "up-to-date":
                     name_length = max(name_length, current_length)
@@ -530,8 +545,57 @@ lists all packages available."""
             io.output.formatter.set_style(color, style)
             io.error_output.formatter.set_style(color, style)
 
+    def find_latest_packages(
+        self, packages: Iterable[Package], root: ProjectPackage
+    ) -> Iterator[tuple[Package, Package | None]]:
+        """
+        Find the latest versions of the given packages.
+
+        Lookups in the pool are run concurrently and yielded as soon as they
+        are done. Direct origin packages are searched for one after the other
+        by a single provider while the other lookups are running.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+        from concurrent.futures import as_completed
+
+        from cleo.io.null_io import NullIO
+
+        from poetry.puzzle.provider import Provider
+
+        packages = list(packages)
+        if not packages:
+            return
+
+        max_workers = min(len(packages), self.poetry.config.installer_max_workers)
+        provider: Provider | None = None
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {}
+            direct_origin_packages = []
+            for package in packages:
+                if package.is_direct_origin():
+                    direct_origin_packages.append(package)
+                    continue
+
+                future = executor.submit(self.find_latest_package, package, root)
+                futures[future] = package
+
+            for package in direct_origin_packages:
+                if provider is None:
+                    provider = Provider(root, self.poetry.pool, NullIO())
+
+                yield (
+                    package,
+                    self.find_latest_package(package, root, provider=provider),
+                )
+
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+
     def find_latest_package(
-        self, package: Package, root: ProjectPackage
+        self,
+        package: Package,
+        root: ProjectPackage,
+        provider: Provider | None = None,
     ) -> Package | None:
         from cleo.io.null_io import NullIO
 
@@ -543,7 +607,8 @@ lists all packages available."""
         if package.is_direct_origin():
             for dep in requires:
                 if dep.name == package.name and dep.source_type == package.source_type:
-                    provider = Provider(root, self.poetry.pool, NullIO())
+                    if provider is None:
+                        provider = Provider(root, self.poetry.pool, NullIO())
                     return provider.search_for_direct_origin_dependency(dep)
 
         allow_prereleases: bool | None = None
@@ -38,11 +38,19 @@ class UpdateCommand(InstallerCommand):
             "(implicitly enables --verbose).",
         ),
         option("lock", None, "Do not perform operations (only update the lockfile)."),
+        option(
+            "profile",
+            None,
+            "Profile the dependency resolution and write the results to"
+            " <comment>poetry-profile.json</> and <comment>poetry-profile.folded</>.",
+        ),
     ]
 
     loggers: ClassVar[list[str]] = ["poetry.repositories.pypi_repository"]
 
     def handle(self) -> int:
+        from poetry.puzzle.profiler import Profiler
+
         packages = self.argument("packages")
         if packages:
             self.installer.whitelist({name: "*" for name in packages})
@@ -52,7 +60,14 @@ class UpdateCommand(InstallerCommand):
         self.installer.requires_synchronization(self.option("sync"))
         self.installer.execute_operations(not self.option("lock"))
 
+        profiler = Profiler() if self.option("profile") else None
+        self.installer.profile(profiler)
+
         # Force update
         self.installer.update(True)
 
-        return self.installer.run()
+        try:
+            return self.installer.run()
+        finally:
+            if profiler is not None:
+                profiler.display(self.io, self.poetry.pyproject_path.parent)
@@ -3,6 +3,7 @@ from __future__ import annotations
 import contextlib
 import functools
 import glob
+import json
 import logging
 import tempfile
 
@@ -22,7 +23,10 @@ from poetry.core.utils.helpers import temporary_directory
 from poetry.core.version.markers import InvalidMarkerError
 from poetry.core.version.requirements import InvalidRequirementError
 
+from poetry.utils.cache import FileCache
+from poetry.utils.cache import get_directory_fingerprint
 from poetry.utils.helpers import extractall
+from poetry.utils.helpers import get_file_hash
 from poetry.utils.isolated_build import IsolatedBuildBackendError
 from poetry.utils.isolated_build import isolated_builder
 
@@ -41,6 +45,12 @@ logger = logging.getLogger(__name__)
 
 DYNAMIC_METADATA_VERSION = Version.parse("2.2")
 
+METADATA_CACHE_VERSION = 3
+
+REQUIREMENT_CACHE_SIZE = 2**14
+
+BUILD_CONFIGURATION_FILES = ("pyproject.toml", "setup.cfg", "PKG-INFO")
+
 
 class PackageInfoError(ValueError):
     def __init__(self, path: Path, *reasons: BaseException | str) -> None:
@@ -177,7 +187,7 @@ class PackageInfo:
         for req in self.requires_dist or []:
             try:
                 # Attempt to parse the PEP-508 requirement string
-                dependency = Dependency.create_from_pep_508(req, relative_to=root_dir)
+                dependency = _parse_requirement(req, root_dir)
             except InvalidMarkerError:
                 # Invalid marker, We strip the markers hoping for the best
                 logger.warning(
@@ -187,7 +197,7 @@ class PackageInfo:
                     package.version,
                 )
                 req = req.split(";")[0]
-                dependency = Dependency.create_from_pep_508(req, relative_to=root_dir)
+                dependency = _parse_requirement(req, root_dir)
             except InvalidRequirementError:
                 # Unable to parse requirement so we skip it
                 logger.warning(
@@ -316,24 +326,35 @@ class PackageInfo:
         elif not zip:
             suffix = ".tar.gz"
 
-        with temporary_directory() as tmp_str:
-            tmp = Path(tmp_str)
-            extractall(source=path, dest=tmp, zip=zip)
+        # The information of an sdist never changes,
+        # so it is cached by the hash of the archive.
+        cache = _get_metadata_cache()
+        key = _get_metadata_cache_key("sdist", get_file_hash(path))
+        data = cache.get(key)
+        if data is not None:
+            new_info = cls.load(data)
+        else:
+            with temporary_directory() as tmp_str:
+                tmp = Path(tmp_str)
+                extractall(source=path, dest=tmp, zip=zip)
+
+                # a little bit of guess work to determine the directory we care about
+                elements = list(tmp.glob("*"))
 
-            # a little bit of guess work to determine the directory we care about
-            elements = list(tmp.glob("*"))
+                if len(elements) == 1 and elements[0].is_dir():
+                    sdist_dir = elements[0]
+                else:
+                    sdist_dir = tmp / path.name.rstrip(suffix)
+                    if not sdist_dir.is_dir():
+                        sdist_dir = tmp
+
+                # now this is an unpacked directory we know how to deal with
+                new_info = cls.from_directory(path=sdist_dir)
 
-            if len(elements) == 1 and elements[0].is_dir():
-                sdist_dir = elements[0]
-            else:
-                sdist_dir = tmp / path.name.rstrip(suffix)
-                if not sdist_dir.is_dir():
-                    sdist_dir = tmp
+            cache.put(key, new_info.asdict())
 
-            # now this is an unpacked directory we know how to deal with
-            new_info = cls.from_directory(path=sdist_dir)
-            new_info._source_type = "file"
-            new_info._source_url = path.resolve().as_posix()
+        new_info._source_type = "file"
+        new_info._source_url = path.resolve().as_posix()
 
         if not info:
             return new_info
@@ -523,13 +544,107 @@ class PackageInfo:
             return cls.from_sdist(path=path)
 
 
+@functools.lru_cache(maxsize=REQUIREMENT_CACHE_SIZE)
+def _create_dependency_from_pep_508(
+    requirement: str, relative_to: Path | None
+) -> Dependency:
+    return Dependency.create_from_pep_508(requirement, relative_to=relative_to)
+
+
+def _parse_requirement(requirement: str, relative_to: Path | None) -> Dependency:
+    """
+    Parse a PEP 508 requirement string.
+
+    Parsing requirements is expensive and the same requirement strings are parsed
+    over and over again when the solver completes many releases of a package,
+    so the most recently parsed requirements are cached. Since dependencies
+    are mutable, the cached instance is never returned but a copy of it.
+    """
+    return _create_dependency_from_pep_508(requirement, relative_to).clone()
+
+
+def _get_metadata_cache() -> FileCache[dict[str, Any]]:
+    from poetry.config.config import Config
+
+    return FileCache(path=Config.create().package_info_cache_directory)
+
+
+def _get_metadata_cache_key(kind: str, fingerprint: str) -> str:
+    from poetry.utils.env import EnvManager
+
+    # The metadata of a build might depend on the interpreter the build
+    # environment is created with, whose mtime changes if it is upgraded in place.
+    python_executable = EnvManager.get_system_env(naive=True).python
+    try:
+        mtime = python_executable.stat().st_mtime_ns
+    except OSError:
+        mtime = None
+
+    return json.dumps(
+        [METADATA_CACHE_VERSION, kind, fingerprint, str(python_executable), mtime]
+    )
+
+
+def _get_directory_fingerprint(path: Path) -> str | None:
+    """
+    Return a fingerprint of the location and the source files of a directory,
+    or None if the files the metadata of the directory is built from cannot
+    be determined.
+    """
+    pyproject = PyProjectTOML(path / "pyproject.toml")
+    if pyproject.data.get("project", {}).get("dynamic"):
+        return None
+
+    fingerprint = get_directory_fingerprint(path)
+    if fingerprint is None:
+        # Outside of a Git work tree, only the build configuration is considered,
+        # which is only sufficient if it does not refer to other files.
+        if (path / "setup.py").exists() or _setup_cfg_refers_to_files(path):
+            return None
+
+        fingerprint = get_directory_fingerprint(
+            path, [path.resolve() / name for name in BUILD_CONFIGURATION_FILES]
+        )
+
+    return fingerprint
+
+
+def _setup_cfg_refers_to_files(path: Path) -> bool:
+    try:
+        content = (path / "setup.cfg").read_text(encoding="utf-8")
+    except OSError:
+        return False
+
+    return "attr:" in content or "file:" in content
+
+
 @functools.cache
 def get_pep517_metadata(path: Path) -> PackageInfo:
     """
     Helper method to use PEP-517 library to build and read package metadata.
 
+    The metadata is cached persistently by a fingerprint of the source files
+    of the package so that it is not built again.
+
     :param path: Path to package source to build and read metadata for.
     """
+    fingerprint = _get_directory_fingerprint(path)
+    if fingerprint is None:
+        return _build_pep517_metadata(path)
+
+    cache = _get_metadata_cache()
+    key = _get_metadata_cache_key("directory", fingerprint)
+    data = cache.get(key)
+    if data is not None:
+        return PackageInfo.load(data)
+
+    info = _build_pep517_metadata(path)
+    cache.put(key, info.asdict())
+
+    return info
+
+
+def _build_pep517_metadata(path: Path) -> PackageInfo:
     info = None
 
     with tempfile.TemporaryDirectory() as dist:
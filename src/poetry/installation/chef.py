@@ -14,6 +14,7 @@ from poetry.utils.isolated_build import isolated_builder
 if TYPE_CHECKING:
     from build import DistributionType
 
+    from poetry.config.config import Config
     from poetry.repositories import RepositoryPool
     from poetry.utils.cache import ArtifactCache
     from poetry.utils.env import Env
@@ -24,11 +25,16 @@ class ChefError(Exception): ...
 
 class Chef:
     def __init__(
-        self, artifact_cache: ArtifactCache, env: Env, pool: RepositoryPool
+        self,
+        artifact_cache: ArtifactCache,
+        env: Env,
+        pool: RepositoryPool,
+        config: Config | None = None,
     ) -> None:
         self._env = env
         self._pool = pool
         self._artifact_cache = artifact_cache
+        self._config = config
 
     def prepare(
         self, archive: Path, output_dir: Path | None = None, *, editable: bool = False
@@ -51,6 +57,7 @@ class Chef:
             distribution=distribution,
             python_executable=self._env.python,
             pool=self._pool,
+            config=self._config,
         ) as builder:
             return Path(
                 builder.build(
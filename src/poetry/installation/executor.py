@@ -4,15 +4,19 @@ import csv
 import functools
 import itertools
 import json
+import os
 import threading
 
 from collections import defaultdict
+from concurrent.futures import Future
 from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import as_completed
 from concurrent.futures import wait
 from pathlib import Path
 from subprocess import CalledProcessError
 from typing import TYPE_CHECKING
 from typing import Any
+from typing import ClassVar
 
 from poetry.core.packages.utils.link import Link
 
@@ -54,6 +58,8 @@ def _package_get_name(package: Package) -> str | None:
 
 
 class Executor:
+    BYTECODE_BATCH_SIZE: ClassVar[int] = 100
+
     def __init__(
         self,
         env: Env,
@@ -68,7 +74,14 @@ class Executor:
         self._dry_run = False
         self._enabled = True
         self._verbose = False
-        self._wheel_installer = WheelInstaller(self._env)
+        self._wheel_installer = WheelInstaller(
+            self._env,
+            store=(
+                config.unpacked_wheels_cache_directory
+                if config.get("installer.link-mode") == "hardlink"
+                else None
+            ),
+        )
 
         if parallel is None:
             parallel = config.get("installer.parallel", True)
@@ -82,10 +95,18 @@ class Executor:
         self._authenticator = Authenticator(
             config, self._io, disable_cache=disable_cache, pool_size=self._max_workers
         )
-        self._chef = Chef(self._artifact_cache, self._env, pool)
+        self._chef = Chef(self._artifact_cache, self._env, pool, config)
         self._chooser = Chooser(pool, self._env, config)
 
         self._executor = ThreadPoolExecutor(max_workers=self._max_workers)
+        try:
+            cpu_count = os.cpu_count() or 1
+        except NotImplementedError:
+            cpu_count = 1
+        self._build_slots = threading.BoundedSemaphore(
+            min(self._max_workers, cpu_count)
+        )
+        self._archives: dict[int, Future[Path]] = {}
         self._executed = {"install": 0, "update": 0, "uninstall": 0}
         self._skipped = {"install": 0, "update": 0, "uninstall": 0}
         self._sections: dict[int, SectionOutput] = {}
@@ -147,6 +168,13 @@ class Executor:
         self._sections = {}
         self._yanked_warnings = []
 
+        # Archives are fetched in a separate stage, so that downloads (and sdist
+        # builds) of later operations can run while earlier operations are still
+        # being installed.
+        self._download_executor = ThreadPoolExecutor(max_workers=self._max_workers)
+        if self._enabled and not self._dry_run:
+            self._prefetch_archives(operations)
+
         # We group operations by priority
         groups = itertools.groupby(operations, key=lambda o: -o.priority)
         for _, group in groups:
@@ -210,8 +238,20 @@ class Executor:
 
             if self._shutdown:
                 self._executor.shutdown(wait=True, cancel_futures=True)
+                self._download_executor.shutdown(wait=True, cancel_futures=True)
                 break
 
+        # Do not leave archives of operations that have not been executed
+        # (e.g. because of an error) being fetched in the background.
+        for future in self._archives.values():
+            future.cancel()
+        wait(self._archives.values())
+        self._archives.clear()
+        self._download_executor.shutdown(wait=True)
+
+        if not self._shutdown:
+            self._compile_bytecode()
+
         for warning in self._yanked_warnings:
             self._io.write_error_line(f"<warning>Warning: {warning}</warning>")
         for path, issues in self._wheel_installer.invalid_wheels.items():
@@ -225,21 +265,104 @@ class Executor:
 
         return 1 if self._shutdown else 0
 
+    def _compile_bytecode(self) -> None:
+        """
+        Compile the bytecode of all installed wheels at once,
+        in batches that are processed in parallel.
+        """
+        files = self._wheel_installer.bytecode_files.copy()
+        self._wheel_installer.bytecode_files.clear()
+        if not files:
+            return
+
+        batches = [
+            files[i : i + self.BYTECODE_BATCH_SIZE]
+            for i in range(0, len(files), self.BYTECODE_BATCH_SIZE)
+        ]
+        tasks = {
+            self._executor.submit(self._wheel_installer.compile_bytecode, batch): len(
+                batch
+            )
+            for batch in batches
+        }
+
+        self._io.write_line("")
+        progress = None
+        if self.supports_fancy_output():
+            from cleo.ui.progress_bar import ProgressBar
+
+            progress = ProgressBar(self._io.section(), max=len(files))
+            progress.set_format(
+                "<b>Compiling bytecode</b>: <info>%current%/%max%</info> files"
+            )
+            progress.start()
+
+        for task in as_completed(tasks):
+            task.result()
+            if progress:
+                progress.advance(tasks[task])
+
+        if progress:
+            progress.clear()
+
+        self._io.write_line(
+            f"<b>Compiled bytecode</b> of <info>{len(files)}</> file{pluralize(len(files))}"
+        )
+
+    def _prefetch_archives(self, operations: list[Operation]) -> None:
+        """
+        Start fetching the archives of all install and update operations,
+        regardless of their priority group.
+
+        Archives of directory, file and git dependencies are not prefetched
+        since preparing them may depend on the state of the environment.
+        """
+        for operation in operations:
+            if (
+                operation.skipped
+                or operation.job_type == "uninstall"
+                or operation.package.source_type in {"directory", "file", "git"}
+            ):
+                continue
+
+            assert isinstance(operation, (Install, Update))
+            # The section is created right away,
+            # so that the progress of the download can be shown.
+            if self.supports_fancy_output() and self._should_write_operation(operation):
+                self._get_section(operation)
+            self._archives[id(operation)] = self._download_executor.submit(
+                self._fetch_archive, operation
+            )
+
+    def _get_section(self, operation: Operation) -> SectionOutput:
+        """
+        Return the output section of an operation, which is created
+        with a pending message if it does not exist yet.
+        """
+        with self._lock:
+            section = self._sections.get(id(operation))
+            if section is None:
+                section = self._sections[id(operation)] = self._io.section()
+                section.write_line(
+                    f"  <fg=blue;options=bold>-</> {self.get_operation_message(operation)}:"
+                    " <fg=blue>Pending...</>"
+                )
+
+            return section
+
     def _write(self, operation: Operation, line: str) -> None:
         if not self.supports_fancy_output() or not self._should_write_operation(
             operation
         ):
             return
 
-        if self._io.is_debug():
-            with self._lock:
-                section = self._sections[id(operation)]
+        section = self._get_section(operation)
+        with self._lock:
+            if self._io.is_debug():
                 section.write_line(line)
 
-            return
+                return
 
-        with self._lock:
-            section = self._sections[id(operation)]
             section.clear()
             section.write(line)
 
@@ -247,15 +370,8 @@ class Executor:
         try:
             op_message = self.get_operation_message(operation)
             if self.supports_fancy_output():
-                if id(operation) not in self._sections and self._should_write_operation(
-                    operation
-                ):
-                    with self._lock:
-                        self._sections[id(operation)] = self._io.section()
-                        self._sections[id(operation)].write_line(
-                            f"  <fg=blue;options=bold>-</> {op_message}:"
-                            " <fg=blue>Pending...</>"
-                        )
+                if self._should_write_operation(operation):
+                    self._get_section(operation)
             else:
                 if self._should_write_operation(operation):
                     if not operation.skipped:
@@ -536,13 +652,17 @@ class Executor:
         elif package.source_type == "file":
             archive = self._prepare_archive(operation)
         elif package.source_type == "directory":
-            archive = self._prepare_archive(operation)
-            cleanup_archive = True
-        elif package.source_type == "url":
-            assert package.source_url is not None
-            archive = self._download_link(operation, Link(package.source_url))
+            archive, cleanup_archive = self._prepare_directory_archive(operation)
+        elif (future := self._archives.pop(id(operation), None)) is not None:
+            if not future.done():
+                message = (
+                    f"  <fg=blue;options=bold>-</> {self.get_operation_message(operation)}:"
+                    " <info>Downloading...</>"
+                )
+                self._write(operation, message)
+            archive = future.result()
         else:
-            archive = self._download(operation)
+            archive = self._fetch_archive(operation)
 
         operation_message = self.get_operation_message(operation)
         message = (
@@ -559,7 +679,12 @@ class Executor:
                 assert isinstance(operation, Update)
                 self._remove(operation.initial_package)
 
-            self._wheel_installer.install(archive)
+            sha256 = None
+            if self._wheel_installer.uses_store:
+                # Wheels are looked up in the store by their hash,
+                # which has usually been recorded when fetching the archive.
+                sha256 = self._get_archive_hash(archive, "sha256")
+            self._wheel_installer.install(archive, sha256=sha256)
         finally:
             if cleanup_archive:
                 archive.unlink()
@@ -596,6 +721,42 @@ class Executor:
         )
         self._write(operation, message)
 
+        archive = self._get_archive_path(package)
+        self._populate_hashes_dict(archive, package)
+
+        return self._chef.prepare(
+            archive, editable=package.develop, output_dir=output_dir
+        )
+
+    def _prepare_directory_archive(
+        self, operation: Install | Update
+    ) -> tuple[Path, bool]:
+        """
+        Prepare the archive of a directory dependency and return it along with
+        whether it is temporary. Archives are cached by the content of the
+        directory unless the directory is installed in develop mode.
+        """
+        package = operation.package
+
+        output_dir = None
+        if not package.develop:
+            directory = self._get_archive_path(package)
+            cached_archive = self._artifact_cache.get_cached_archive_for_directory(
+                directory, env=self._env
+            )
+            if cached_archive is not None:
+                return cached_archive, False
+
+            output_dir = self._artifact_cache.get_cache_directory_for_directory(
+                directory
+            )
+
+        archive = self._prepare_archive(operation, output_dir=output_dir)
+
+        return archive, output_dir is None
+
+    @staticmethod
+    def _get_archive_path(package: Package) -> Path:
         assert package.source_url is not None
         archive = Path(package.source_url)
         if package.source_subdirectory:
@@ -603,11 +764,7 @@ class Executor:
         if not Path(package.source_url).is_absolute() and package.root_dir:
             archive = package.root_dir / archive
 
-        self._populate_hashes_dict(archive, package)
-
-        return self._chef.prepare(
-            archive, editable=package.develop, output_dir=output_dir
-        )
+        return archive
 
     def _prepare_git_archive(self, operation: Install | Update) -> Path:
         package = operation.package
@@ -649,6 +806,20 @@ class Executor:
                 package.source_resolved_reference,
                 package.source_subdirectory,
             )
+        elif not package.develop:
+            # Without a precise reference hash,
+            # the archive is cached by the content of the checkout.
+            directory = self._get_archive_path(package)
+            cached_archive = self._artifact_cache.get_cached_archive_for_directory(
+                directory, env=self._env
+            )
+            if cached_archive is not None:
+                package._source_url = original_url
+                return cached_archive
+
+            output_dir = self._artifact_cache.get_cache_directory_for_directory(
+                directory
+            )
 
         archive = self._prepare_archive(operation, output_dir=output_dir)
         if not package.develop:
@@ -661,6 +832,14 @@ class Executor:
 
         return archive
 
+    def _fetch_archive(self, operation: Install | Update) -> Path:
+        package = operation.package
+        if package.source_type == "url":
+            assert package.source_url is not None
+            return self._download_link(operation, Link(package.source_url))
+
+        return self._download(operation)
+
     def _download(self, operation: Install | Update) -> Path:
         link = self._chooser.choose_for(operation.package)
 
@@ -711,7 +890,10 @@ class Executor:
             )
             self._write(operation, message)
 
-            archive = self._chef.prepare(archive, output_dir=original_archive.parent)
+            with self._build_slots:
+                archive = self._chef.prepare(
+                    archive, output_dir=original_archive.parent
+                )
 
         # Use the original archive to provide the correct hash.
         self._populate_hashes_dict(original_archive, package)
@@ -723,8 +905,7 @@ class Executor:
             archive_hash = self._validate_archive_hash(archive, package)
             self._hashes[package.name] = archive_hash
 
-    @staticmethod
-    def _validate_archive_hash(archive: Path, package: Package) -> str:
+    def _validate_archive_hash(self, archive: Path, package: Package) -> str:
         known_hashes = {f["hash"] for f in package.files if f["file"] == archive.name}
         hash_types = {t.split(":")[0] for t in known_hashes}
         hash_type = get_highest_priority_hash_type(hash_types, archive.name)
@@ -735,7 +916,7 @@ class Executor:
                 f" {archive.name} found (known hashes: {known_hashes!s})"
             )
 
-        archive_hash = f"{hash_type}:{get_file_hash(archive, hash_type)}"
+        archive_hash = f"{hash_type}:{self._get_archive_hash(archive, hash_type)}"
 
         if archive_hash not in known_hashes:
             raise RuntimeError(
@@ -745,14 +926,34 @@ class Executor:
 
         return archive_hash
 
+    def _get_archive_hash(self, archive: Path, hash_name: str) -> str:
+        archive_hash = self._artifact_cache.get_archive_hash(archive, hash_name)
+        if archive_hash is None:
+            archive_hash = get_file_hash(archive, hash_name)
+            self._artifact_cache.record_archive_hash(archive, hash_name, archive_hash)
+
+        return archive_hash
+
     def _download_archive(
         self,
         operation: Install | Update,
         url: str,
         dest: Path,
     ) -> None:
+        # Compute the hash that will be required to validate the archive
+        # while downloading it, so that it does not have to be read again.
+        hash_types = {
+            f["hash"].split(":")[0]
+            for f in operation.package.files
+            if f["file"] == dest.name
+        }
+        hash_name = get_highest_priority_hash_type(hash_types, dest.name) or "sha256"
         downloader = Downloader(
-            url, dest, self._authenticator, max_retries=self._max_retries
+            url,
+            dest,
+            self._authenticator,
+            max_retries=self._max_retries,
+            hash_name=hash_name,
         )
         wheel_size = downloader.total_size
 
@@ -761,23 +962,25 @@ class Executor:
             f"  <fg=blue;options=bold>-</> {operation_message}: <info>Downloading...</>"
         )
         progress = None
-        if self.supports_fancy_output():
+        section = self._sections.get(id(operation))
+        if self.supports_fancy_output() and section is not None:
             if wheel_size is None:
                 self._write(operation, message)
             else:
                 from cleo.ui.progress_bar import ProgressBar
 
-                progress = ProgressBar(
-                    self._sections[id(operation)], max=int(wheel_size)
-                )
+                progress = ProgressBar(section, max=int(wheel_size))
                 progress.set_format(message + " <b>%percent%%</b>")
 
         if progress:
+            assert section is not None
             with self._lock:
-                self._sections[id(operation)].clear()
+                section.clear()
                 progress.start()
 
-        for fetched_size in downloader.download_with_progress(chunk_size=4096):
+        for fetched_size in downloader.download_with_progress(
+            chunk_size=downloader.chunk_size
+        ):
             if progress:
                 with self._lock:
                     progress.set_progress(fetched_size)
@@ -786,6 +989,9 @@ class Executor:
             with self._lock:
                 progress.finish()
 
+        assert downloader.hash is not None
+        self._artifact_cache.record_archive_hash(dest, hash_name, downloader.hash)
+
     def _should_write_operation(self, operation: Operation) -> bool:
         return (
             not operation.skipped or self._dry_run or self._verbose or not self._enabled
@@ -1,21 +1,30 @@
 from __future__ import annotations
 
+import contextlib
+import json
+import os
+import time
+
+from hashlib import sha256
 from typing import TYPE_CHECKING
 from typing import cast
 
 from cleo.io.null_io import NullIO
 from packaging.utils import canonicalize_name
 
+from poetry.__version__ import __version__
 from poetry.installation.executor import Executor
 from poetry.puzzle.transaction import Transaction
 from poetry.repositories import Repository
 from poetry.repositories import RepositoryPool
 from poetry.repositories.installed_repository import InstalledRepository
 from poetry.repositories.lockfile_repository import LockfileRepository
+from poetry.utils.cache import prune_caches
 
 
 if TYPE_CHECKING:
     from collections.abc import Iterable
+    from pathlib import Path
 
     from cleo.io.io import IO
     from packaging.utils import NormalizedName
@@ -27,6 +36,7 @@ if TYPE_CHECKING:
     from poetry.installation.operations.operation import Operation
     from poetry.packages import Locker
     from poetry.packages.transitive_package_info import TransitivePackageInfo
+    from poetry.puzzle.profiler import Profiler
     from poetry.utils.env import Env
 
 
@@ -57,6 +67,8 @@ class Installer:
         self._groups: Iterable[str] | None = None
         self._skip_directory = False
         self._lock = False
+        self._prune_caches = False
+        self._profiler: Profiler | None = None
 
         self._whitelist: list[NormalizedName] = []
 
@@ -69,15 +81,26 @@ class Installer:
 
         self._executor = executor
 
-        if installed is None:
-            installed = self._get_installed()
-
-        self._installed_repository = installed
+        self._installed = installed
+        # If the installed packages have been passed explicitly,
+        # they do not necessarily reflect the environment,
+        # so the fingerprint of the environment cannot be trusted.
+        self._track_install_state = installed is None
 
     @property
     def executor(self) -> Executor:
         return self._executor
 
+    @property
+    def _installed_repository(self) -> InstalledRepository:
+        # The installed packages are loaded lazily so that
+        # the scan of the environment can be skipped entirely
+        # if nothing has changed since the last installation.
+        if self._installed is None:
+            self._installed = self._get_installed()
+
+        return self._installed
+
     def set_package(self, package: ProjectPackage) -> Installer:
         self._package = package
 
@@ -100,6 +123,13 @@ class Installer:
         if self.is_dry_run():
             self.verbose(True)
 
+        if self._is_up_to_date():
+            self._io.write_line("<info>Installing dependencies from lock file</>")
+            self._io.write_line("")
+            self._io.write_line("No dependencies to install or update")
+
+            return 0
+
         return self._do_install()
 
     def dry_run(self, dry_run: bool = True) -> Installer:
@@ -152,6 +182,15 @@ class Installer:
 
         return self
 
+    def prune_caches(self, prune: bool = True) -> Installer:
+        """
+        Enforce the cache limits after a successful run. Only installers of
+        top-level commands prune the caches, not those of build environments.
+        """
+        self._prune_caches = prune
+
+        return self
+
     def is_updating(self) -> bool:
         return self._update
 
@@ -171,6 +210,14 @@ class Installer:
 
         return self
 
+    def profile(self, profiler: Profiler | None) -> Installer:
+        """
+        Record the dependency resolution with the given profiler.
+        """
+        self._profiler = profiler
+
+        return self
+
     def _do_refresh(self) -> int:
         from poetry.puzzle.solver import Solver
 
@@ -194,8 +241,9 @@ class Installer:
             p.name for p in locked_repository.packages if p.source_type == "directory"
         ]
 
-        with solver.provider.use_source_root(
-            source_root=self._env.path.joinpath("src")
+        with (
+            solver.provider.use_source_root(source_root=self._env.path.joinpath("src")),
+            solver.provider.use_profiler(self._profiler),
         ):
             solved_packages = solver.solve(use_latest=use_latest).get_solved_packages()
 
@@ -235,8 +283,11 @@ class Installer:
                 self._io,
             )
 
-            with solver.provider.use_source_root(
-                source_root=self._env.path.joinpath("src")
+            with (
+                solver.provider.use_source_root(
+                    source_root=self._env.path.joinpath("src")
+                ),
+                solver.provider.use_profiler(self._profiler),
             ):
                 solved_packages = solver.solve(
                     use_latest=self._whitelist
@@ -310,7 +361,10 @@ class Installer:
             # to load deferred dependencies (i.e. VCS, URL and path dependencies)
             solver.provider.load_deferred(False)
 
-            with solver.use_environment(self._env):
+            with (
+                solver.use_environment(self._env),
+                solver.provider.use_profiler(self._profiler),
+            ):
                 transaction = solver.solve(use_latest=self._whitelist)
 
         else:
@@ -351,6 +405,11 @@ class Installer:
             # Only write lock file when installation is success
             self._write_lock_file(solved_packages)
 
+        if status == 0:
+            self._save_install_state()
+            if self._prune_caches:
+                self._prune_caches_if_due()
+
         return status
 
     def _write_lock_file(
@@ -365,6 +424,120 @@ class Installer:
                 self._io.write_line("")
                 self._io.write_line("<info>Writing lock file</>")
 
+    def _supports_install_state(self) -> bool:
+        return (
+            self._track_install_state
+            and self._executor.enabled
+            and not self._dry_run
+            and not self._lock
+        )
+
+    def _install_state_file(self) -> Path:
+        key = sha256(str(self._env.path).encode()).hexdigest()
+
+        return self._config.repository_cache_directory.parent / "installs" / key
+
+    def _get_install_fingerprint(self) -> str | None:
+        """
+        Computes a fingerprint of everything an installation depends on:
+        the lock file, the target environment, the selected groups and extras
+        and the distributions currently present in the environment.
+        """
+        if not self._locker.is_locked():
+            return None
+
+        state = {
+            "poetry": __version__,
+            "lock": sha256(self._locker.lock.read_bytes()).hexdigest(),
+            "marker-env": self._env.marker_env,
+            "groups": sorted(self._groups) if self._groups is not None else None,
+            "extras": sorted(self._extras),
+            "synchronize": self._requires_synchronization,
+            "skip-directory": self._skip_directory,
+            "distributions": self._get_distribution_names(),
+        }
+
+        return sha256(
+            json.dumps(state, sort_keys=True, default=str).encode()
+        ).hexdigest()
+
+    def _get_distribution_names(self) -> list[str]:
+        # Listing the metadata directories is much cheaper than loading
+        # the installed repository, but it is sufficient to notice
+        # distributions that have been added, removed or changed versions.
+        # The root package is ignored because it is installed
+        # after the dependencies.
+        names = []
+        for entry in self._env.sys_path:
+            try:
+                entries = os.listdir(entry)
+            except OSError:
+                continue
+
+            for name in entries:
+                if not name.endswith((".dist-info", ".egg-info")):
+                    continue
+
+                distribution = name.rsplit(".", 1)[0].split("-", 1)[0]
+                if canonicalize_name(distribution) == self._package.name:
+                    continue
+
+                names.append(os.path.join(entry, name))
+
+        return sorted(names)
+
+    def _is_up_to_date(self) -> bool:
+        if self._update or not self._supports_install_state():
+            return False
+
+        state_file = self._install_state_file()
+        if not state_file.exists():
+            return False
+
+        # The fingerprint does not cover pyproject.toml,
+        # so the usual error must be raised if the lock file is outdated.
+        if not self._locker.is_fresh():
+            return False
+
+        fingerprint = self._get_install_fingerprint()
+
+        return fingerprint is not None and state_file.read_text() == fingerprint
+
+    def _save_install_state(self) -> None:
+        if not self._supports_install_state():
+            return
+
+        state_file = self._install_state_file()
+        fingerprint = self._get_install_fingerprint()
+        if fingerprint is None:
+            state_file.unlink(missing_ok=True)
+            return
+
+        state_file.parent.mkdir(parents=True, exist_ok=True)
+        state_file.write_text(fingerprint)
+
+    def _prune_caches_if_due(self) -> None:
+        if (
+            self._dry_run
+            or not self._executor.enabled
+            or (
+                self._config.get("cache.max-size") is None
+                and self._config.get("cache.max-age") is None
+            )
+        ):
+            return
+
+        # Enforcing the cache limits requires scanning the caches,
+        # so it is done at most once a day.
+        stamp = self._config.repository_cache_directory.parent / "last-prune"
+        with contextlib.suppress(OSError):
+            if stamp.stat().st_mtime > time.time() - 24 * 60 * 60:
+                return
+
+        stamp.parent.mkdir(parents=True, exist_ok=True)
+        stamp.touch()
+        prune_caches(self._config)
+
     def _execute(self, operations: list[Operation]) -> int:
         return self._executor.execute(operations)
 
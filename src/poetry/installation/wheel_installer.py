@@ -1,11 +1,22 @@
 from __future__ import annotations
 
+import io
+import json
 import logging
+import os
 import platform
+import shutil
 import sys
+import tempfile
+import time
+import zipfile
 
+from contextlib import contextmanager
+from contextlib import suppress
 from pathlib import Path
 from typing import TYPE_CHECKING
+from typing import Any
+from typing import cast
 
 from installer import install
 from installer.destinations import SchemeDictionaryDestination
@@ -14,14 +25,22 @@ from installer.sources import _WheelFileValidationError
 
 from poetry.__version__ import __version__
 from poetry.utils._compat import WINDOWS
+from poetry.utils.cache import LAST_USED_RESOLUTION
+from poetry.utils.cache import CacheEntry
+from poetry.utils.env import EnvCommandError
+from poetry.utils.helpers import get_file_hash
 
 
 logger = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
     from collections.abc import Collection
+    from collections.abc import Iterable
+    from collections.abc import Iterator
+    from contextlib import AbstractContextManager
     from typing import BinaryIO
 
+    from installer.records import Hash
     from installer.records import RecordEntry
     from installer.scripts import LauncherKind
     from installer.utils import Scheme
@@ -29,9 +48,160 @@ if TYPE_CHECKING:
     from poetry.utils.env import Env
 
 
+class StoredFile(io.FileIO):
+    """
+    A file of a wheel that has been unpacked into a store,
+    along with its hash and size.
+    """
+
+    def __init__(self, path: Path, hash_: Hash, size: int) -> None:
+        super().__init__(path, "rb")
+        self.path = path
+        self.hash = hash_
+        self.size = size
+
+
+class UnpackedWheelFile(WheelFile):
+    """
+    A wheel whose contents are read from a copy that has been unpacked
+    into a content-addressed store.
+
+    Each wheel is unpacked only once per store, which allows to link its files
+    into any number of environments instead of extracting them again.
+    """
+
+    MANIFEST = "manifest.json"
+
+    def __init__(self, f: zipfile.ZipFile, directory: Path) -> None:
+        super().__init__(f)
+
+        self._files = directory / "files"
+        manifest = json.loads((directory / self.MANIFEST).read_text(encoding="utf-8"))
+        self._manifest: list[tuple[str, str, str, int, bool]] = manifest["files"]
+
+    @classmethod
+    @contextmanager
+    def open_from_store(
+        cls, path: Path, store: Path, *, sha256: str | None = None
+    ) -> Iterator[UnpackedWheelFile]:
+        """
+        :param sha256: The hash of the wheel, if it is already known.
+        """
+        digest = sha256 or get_file_hash(path)
+        directory = store.joinpath(digest[:2], digest[2:4], digest[4:])
+
+        with zipfile.ZipFile(path) as f:
+            if not cls._is_unpacked(directory):
+                # Remove what is left of an incomplete copy, e.g. after pruning
+                # has been interrupted, so that the wheel can be unpacked again.
+                shutil.rmtree(directory, ignore_errors=True)
+                cls._unpack(WheelFile(f), directory)
+
+            yield cls(f, directory)
+
+    @classmethod
+    def get_store_entries(cls, store: Path) -> list[CacheEntry]:
+        """
+        Return the unpacked wheels of a store as evictable entries.
+        """
+        entries = []
+        for manifest_path in store.glob(f"*/*/*/{cls.MANIFEST}"):
+            try:
+                last_used = manifest_path.stat().st_mtime
+                manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                continue
+
+            size = sum(file[3] for file in manifest["files"])
+            # The manifest is removed first,
+            # so that the wheel is never used while it is being removed.
+            entries.append(
+                CacheEntry((manifest_path, manifest_path.parent), size, last_used)
+            )
+
+        return entries
+
+    @classmethod
+    def _is_unpacked(cls, directory: Path) -> bool:
+        manifest_path = directory / cls.MANIFEST
+        try:
+            last_used = manifest_path.stat().st_mtime
+            manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return False
+
+        files = directory / "files"
+        if not all((files / file[0]).is_file() for file in manifest["files"]):
+            return False
+
+        if last_used < time.time() - LAST_USED_RESOLUTION:
+            # The modification time tracks the last use of the wheel,
+            # so that the least recently used wheels can be evicted.
+            with suppress(OSError):
+                os.utime(manifest_path)
+
+        return True
+
+    @classmethod
+    def _unpack(cls, source: WheelFile, directory: Path) -> None:
+        from installer.utils import copyfileobj_with_hashing
+        from installer.utils import make_file_executable
+
+        directory.parent.mkdir(parents=True, exist_ok=True)
+        tmp_dir = Path(tempfile.mkdtemp(prefix=".tmp-", dir=directory.parent))
+        try:
+            files = tmp_dir / "files"
+            manifest = []
+            for (path, _, _), stream, is_executable in source.get_contents():
+                target_path = files / path
+                if ".." in Path(path).parts or not target_path.is_relative_to(files):
+                    raise ValueError(f"Invalid path in wheel: {path}")
+
+                target_path.parent.mkdir(parents=True, exist_ok=True)
+                with target_path.open("wb") as f:
+                    hash_, size = copyfileobj_with_hashing(stream, f, "sha256")
+
+                if is_executable:
+                    make_file_executable(target_path)
+
+                manifest.append((path, "sha256", hash_, size, is_executable))
+
+            (tmp_dir / cls.MANIFEST).write_text(
+                json.dumps({"files": manifest}), encoding="utf-8"
+            )
+
+            try:
+                tmp_dir.rename(directory)
+            except OSError:
+                # The wheel has been unpacked concurrently by another process.
+                if not (directory / cls.MANIFEST).exists():
+                    raise
+        finally:
+            if tmp_dir.exists():
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    def get_contents(self) -> Iterator[tuple[tuple[str, str, str], BinaryIO, bool]]:
+        from installer.records import Hash
+        from installer.records import parse_record_file
+
+        record_lines = self.read_dist_info("RECORD").splitlines()
+        records = {record[0]: record for record in parse_record_file(record_lines)}
+
+        for path, hash_name, hash_value, size, is_executable in self._manifest:
+            record = records.pop(path, (path, "", ""))
+            with StoredFile(
+                self._files / path, Hash(hash_name, hash_value), size
+            ) as stream:
+                yield record, cast("BinaryIO", stream), is_executable
+
+
 class WheelDestination(SchemeDictionaryDestination):
     """ """
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.python_files: list[Path] = []
+
     def write_to_fs(
         self,
         scheme: Scheme,
@@ -49,6 +219,9 @@ class WheelDestination(SchemeDictionaryDestination):
             # Contrary to the base library we don't raise an error here since it can
             # break pkgutil-style and pkg_resource-style namespace packages.
             logger.warning(f"Installing {target_path} over existing file")
+            # The existing file may be linked to a store,
+            # so it must not be written to in place.
+            target_path.unlink()
 
         parent_folder = target_path.parent
         if not parent_folder.exists():
@@ -56,6 +229,15 @@ class WheelDestination(SchemeDictionaryDestination):
             # that two threads try to create the directory.
             parent_folder.mkdir(parents=True, exist_ok=True)
 
+        if isinstance(stream, StoredFile) and stream.hash.name == self.hash_algorithm:
+            try:
+                os.link(stream.path, target_path)
+            except OSError:
+                # E.g. the store is on another file system, fall back to copying.
+                pass
+            else:
+                return RecordEntry(path, stream.hash, stream.size)
+
         with target_path.open("wb") as f:
             hash_, size = copyfileobj_with_hashing(stream, f, self.hash_algorithm)
 
@@ -64,10 +246,30 @@ class WheelDestination(SchemeDictionaryDestination):
 
         return RecordEntry(path, Hash(self.hash_algorithm, hash_), size)
 
+    def finalize_installation(
+        self,
+        scheme: Scheme,
+        record_file_path: str,
+        records: Iterable[tuple[Scheme, RecordEntry]],
+    ) -> None:
+        record_list = list(records)
+        super().finalize_installation(scheme, record_file_path, record_list)
+
+        self.python_files.extend(
+            Path(self.scheme_dict[file_scheme]) / record.path
+            for file_scheme, record in record_list
+            if file_scheme in ("purelib", "platlib") and record.path.endswith(".py")
+        )
+
 
 class WheelInstaller:
-    def __init__(self, env: Env) -> None:
+    def __init__(self, env: Env, *, store: Path | None = None) -> None:
+        """
+        :param store: If set, wheels are unpacked into this directory once
+            and their files are hardlinked into the environment.
+        """
         self._env = env
+        self._store = store
 
         script_kind: LauncherKind
         if not WINDOWS:
@@ -79,14 +281,45 @@ class WheelInstaller:
                 script_kind = "win-amd64" if sys.maxsize > 2**32 else "win-ia32"
         self._script_kind = script_kind
 
-        self._bytecode_optimization_levels: Collection[int] = ()
+        self._bytecode_compilation = False
         self.invalid_wheels: dict[Path, list[str]] = {}
+        # Python files of installed wheels, whose bytecode has not been compiled yet.
+        self.bytecode_files: list[Path] = []
 
     def enable_bytecode_compilation(self, enable: bool = True) -> None:
-        self._bytecode_optimization_levels = (-1,) if enable else ()
+        """
+        Collect the Python files of installed wheels in `bytecode_files`,
+        so that their bytecode can be compiled via `compile_bytecode()`.
+        """
+        self._bytecode_compilation = enable
 
-    def install(self, wheel: Path) -> None:
-        with WheelFile.open(wheel) as source:
+    def compile_bytecode(self, files: Collection[Path]) -> None:
+        try:
+            self._env.run(
+                "python",
+                "-I",
+                "-m",
+                "compileall",
+                "-q",
+                "-i",
+                "-",
+                input="\n".join(str(file) for file in files),
+            )
+        except EnvCommandError as e:
+            # Files that cannot be compiled (e.g. because of syntax errors)
+            # are skipped by compileall, which only affects its exit code.
+            logger.debug("Failed to compile bytecode: %s", e)
+
+    @property
+    def uses_store(self) -> bool:
+        return self._store is not None
+
+    def install(self, wheel: Path, *, sha256: str | None = None) -> None:
+        """
+        :param sha256: The hash of the wheel, if it is already known.
+            Only used to look up the wheel in the store.
+        """
+        with self._open(wheel, sha256) as source:
             try:
                 # Content validation is temporarily disabled because of
                 # pypa/installer's out of memory issues with big wheels. See
@@ -103,7 +336,6 @@ class WheelInstaller:
                 scheme_dict,
                 interpreter=str(self._env.python),
                 script_kind=self._script_kind,
-                bytecode_optimization_levels=self._bytecode_optimization_levels,
             )
 
             install(
@@ -114,3 +346,14 @@ class WheelInstaller:
                     "INSTALLER": f"Poetry {__version__}".encode(),
                 },
             )
+
+        if self._bytecode_compilation:
+            self.bytecode_files.extend(destination.python_files)
+
+    def _open(
+        self, wheel: Path, sha256: str | None
+    ) -> AbstractContextManager[WheelFile]:
+        if self._store is not None:
+            return UnpackedWheelFile.open_from_store(wheel, self._store, sha256=sha256)
+
+        return WheelFile.open(wheel)
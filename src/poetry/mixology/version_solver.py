@@ -209,7 +209,8 @@ class VersionSolver:
                     # It also backjumps to a point in the solution
                     # where that incompatibility will allow us to derive new assignments
                     # that avoid the conflict.
-                    root_cause = self._resolve_conflict(incompatibility)
+                    with self._provider.profile("resolve_conflict"):
+                        root_cause = self._resolve_conflict(incompatibility)
 
                     # Back jumping erases all the assignments we did at the previous
                     # decision level, so we clear [changed] and refill it with the
@@ -373,6 +374,9 @@ class VersionSolver:
                     self._dependency_cache.clear_level(level)
 
                 self._solution.backtrack(previous_satisfier_level)
+                self._provider.profile_event(
+                    "backtrack", most_recent_satisfier.dependency.complete_name
+                )
                 if new_incompatibility:
                     self._add_incompatibility(incompatibility)
 
@@ -511,10 +515,14 @@ class VersionSolver:
         else:
             package = locked
 
-        package = self._provider.complete_package(package)
+        with self._provider.profile("complete_package", package.package.name):
+            package = self._provider.complete_package(package)
+
+        with self._provider.profile("incompatibilities_for", package.package.name):
+            incompatibilities = self._provider.incompatibilities_for(package)
 
         conflict = False
-        for incompatibility in self._provider.incompatibilities_for(package):
+        for incompatibility in incompatibilities:
             self._add_incompatibility(incompatibility)
 
             # If an incompatibility is already satisfied, then selecting version
@@ -0,0 +1,92 @@
+"""
+Memoized marker operations.
+
+Resolving the dependencies of large projects performs the same operations
+on equal markers over and over again. The functions of this module keep
+their results in bounded caches. Since equal inputs result in the same
+marker objects, the results of previous operations are effectively interned
+and can be looked up quickly when they are passed to the next operation.
+"""
+
+from __future__ import annotations
+
+import functools
+
+from typing import TYPE_CHECKING
+from typing import Any
+
+from poetry.core.packages.utils.utils import get_python_constraint_from_marker
+
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from poetry.core.constraints.version import VersionConstraint
+    from poetry.core.version.markers import BaseMarker
+
+
+MARKER_CACHE_SIZE = 2**14
+
+
+@functools.lru_cache(maxsize=MARKER_CACHE_SIZE)
+def intersect_markers(marker: BaseMarker, other: BaseMarker) -> BaseMarker:
+    return marker.intersect(other)
+
+
+@functools.lru_cache(maxsize=MARKER_CACHE_SIZE)
+def union_markers(marker: BaseMarker, other: BaseMarker) -> BaseMarker:
+    return marker.union(other)
+
+
+@functools.lru_cache(maxsize=MARKER_CACHE_SIZE)
+def invert_marker(marker: BaseMarker) -> BaseMarker:
+    return marker.invert()
+
+
+@functools.lru_cache(maxsize=MARKER_CACHE_SIZE)
+def get_python_constraint(marker: BaseMarker) -> VersionConstraint:
+    return get_python_constraint_from_marker(marker)
+
+
+def validate_marker(marker: BaseMarker, environment: Mapping[str, Any]) -> bool:
+    return _validate_marker(
+        marker, tuple((key, _freeze(value)) for key, value in environment.items())
+    )
+
+
+@functools.lru_cache(maxsize=MARKER_CACHE_SIZE)
+def _validate_marker(
+    marker: BaseMarker, environment: tuple[tuple[str, Any], ...]
+) -> bool:
+    return marker.validate(dict(environment))
+
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+
+    if isinstance(value, (set, frozenset)):
+        return frozenset(value)
+
+    return value
+
+
+_CACHED_OPERATIONS = {
+    "intersect": intersect_markers,
+    "union": union_markers,
+    "invert": invert_marker,
+    "validate": _validate_marker,
+    "python constraint": get_python_constraint,
+}
+
+
+def get_marker_cache_stats() -> dict[str, tuple[int, int]]:
+    """
+    Return the number of cache hits and misses of each marker operation.
+    """
+    stats = {}
+    for name, operation in _CACHED_OPERATIONS.items():
+        info = operation.cache_info()
+        stats[name] = (info.hits, info.misses)
+
+    return stats
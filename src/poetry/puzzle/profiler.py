@@ -0,0 +1,190 @@
+"""
+Profiling of the dependency resolution.
+
+The profiler measures the time spent in the phases of a resolution. Phases
+can be nested, and the time of a phase does not include the time of its
+nested phases. Each measurement is attributed to the package it has been
+made for, so that the packages that make a resolution slow can be found.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+
+from collections import Counter
+from collections import defaultdict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from dataclasses import field
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import ClassVar
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+    from cleo.io.io import IO
+
+
+@dataclass
+class ProfilerFrame:
+    phase: str
+    package: str | None
+    start: float = field(default_factory=time.perf_counter)
+    children: float = 0.0
+
+    @property
+    def label(self) -> str:
+        if self.package is None:
+            return self.phase
+
+        return f"{self.phase}:{self.package}"
+
+
+class Profiler:
+    REPORT_FILE: ClassVar[str] = "poetry-profile.json"
+    STACKS_FILE: ClassVar[str] = "poetry-profile.folded"
+    TOP_PACKAGES: ClassVar[int] = 10
+
+    def __init__(self) -> None:
+        self._frames: list[ProfilerFrame] = []
+        self._total = 0.0
+        self._phases: defaultdict[str, float] = defaultdict(float)
+        self._phase_counts: Counter[str] = Counter()
+        self._packages: defaultdict[str, defaultdict[str, float]] = defaultdict(
+            lambda: defaultdict(float)
+        )
+        self._stacks: defaultdict[tuple[str, ...], float] = defaultdict(float)
+        self._events: Counter[str] = Counter()
+        self._package_events: defaultdict[str, Counter[str]] = defaultdict(Counter)
+
+    @contextmanager
+    def measure(
+        self, phase: str, package: str | None = None
+    ) -> Iterator[ProfilerFrame]:
+        """
+        Measure the time of a phase.
+
+        If no package is given, the time is attributed
+        to the package of the enclosing phase.
+        """
+        if package is None and self._frames:
+            package = self._frames[-1].package
+
+        frame = ProfilerFrame(phase, package)
+        self._frames.append(frame)
+        try:
+            yield frame
+        finally:
+            self._frames.pop()
+            elapsed = time.perf_counter() - frame.start
+            own = elapsed - frame.children
+
+            if self._frames:
+                self._frames[-1].children += elapsed
+            else:
+                self._total += elapsed
+
+            self._phases[frame.phase] += own
+            self._phase_counts[frame.phase] += 1
+            if frame.package is not None:
+                self._packages[frame.package][frame.phase] += own
+
+            stack = (*(f.label for f in self._frames), frame.label)
+            self._stacks[stack] += own
+
+    def count(self, event: str, package: str | None = None) -> None:
+        """
+        Count the occurrence of an event, e.g. a backtrack.
+        """
+        self._events[event] += 1
+        if package is not None:
+            self._package_events[package][event] += 1
+
+    def report(self, top: int | None = None) -> dict[str, Any]:
+        """
+        Return the measurements with the most expensive packages first.
+        """
+        if top is None:
+            top = self.TOP_PACKAGES
+
+        packages = sorted(
+            self._packages.items(), key=lambda item: sum(item[1].values()), reverse=True
+        )
+
+        return {
+            "total": round(self._total, 6),
+            "phases": {
+                phase: {
+                    "time": round(self._phases[phase], 6),
+                    "count": self._phase_counts[phase],
+                }
+                for phase in sorted(self._phases, key=self._phases.__getitem__)[::-1]
+            },
+            "events": dict(self._events),
+            "packages": [
+                {
+                    "name": name,
+                    "time": round(sum(phases.values()), 6),
+                    "phases": {phase: round(t, 6) for phase, t in phases.items()},
+                    "events": dict(self._package_events[name]),
+                }
+                for name, phases in packages[:top]
+            ],
+        }
+
+    def stacks(self) -> list[str]:
+        """
+        Return the measurements as folded stacks, which can be
+        used to render flame graphs. Times are given in microseconds.
+        """
+        return [
+            f"{';'.join(stack)} {round(own * 1_000_000)}"
+            for stack, own in self._stacks.items()
+        ]
+
+    def write(self, directory: Path) -> tuple[Path, Path]:
+        """
+        Write the report and the folded stacks to the given directory.
+        """
+        report_path = directory / self.REPORT_FILE
+        report_path.write_text(
+            json.dumps(self.report(), indent=2) + "\n", encoding="utf-8"
+        )
+
+        stacks_path = directory / self.STACKS_FILE
+        stacks_path.write_text("\n".join([*self.stacks(), ""]), encoding="utf-8")
+
+        return report_path, stacks_path
+
+    def display(self, io: IO, directory: Path) -> None:
+        """
+        Write the profile to the given directory and
+        display the most expensive packages.
+        """
+        report = self.report()
+        report_path, stacks_path = self.write(directory)
+
+        io.write_line("")
+        io.write_line(
+            f"<info>Dependency resolution took <c1>{report['total']:.3f}</>"
+            f" seconds with <c1>{report['events'].get('backtrack', 0)}</>"
+            " backtracks</>"
+        )
+        for package in report["packages"]:
+            phases = ", ".join(
+                f"{phase} {t:.3f}s"
+                for phase, t in sorted(
+                    package["phases"].items(), key=lambda item: item[1], reverse=True
+                )
+            )
+            io.write_line(
+                f"  - <c1>{package['name']}</>: <b>{package['time']:.3f}s</> ({phases})"
+            )
+
+        io.write_line("")
+        io.write_line(f"Profile written to <comment>{report_path}</>")
+        io.write_line(f"Stacks written to <comment>{stacks_path}</>")
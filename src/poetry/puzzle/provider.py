@@ -6,6 +6,8 @@ import re
 import time
 
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
 from contextlib import contextmanager
 from typing import TYPE_CHECKING
 from typing import ClassVar
@@ -15,7 +17,7 @@ from cleo.ui.progress_indicator import ProgressIndicator
 from poetry.core.constraints.version import EmptyConstraint
 from poetry.core.constraints.version import Version
 from poetry.core.constraints.version import VersionRange
-from poetry.core.packages.utils.utils import get_python_constraint_from_marker
+from poetry.core.packages.dependency import Dependency
 from poetry.core.version.markers import AnyMarker
 from poetry.core.version.markers import union as marker_union
 
@@ -27,6 +29,12 @@ from poetry.packages import DependencyPackage
 from poetry.packages.direct_origin import DirectOrigin
 from poetry.packages.package_collection import PackageCollection
 from poetry.puzzle.exceptions import OverrideNeededError
+from poetry.puzzle.markers import get_python_constraint
+from poetry.puzzle.markers import intersect_markers
+from poetry.puzzle.markers import invert_marker
+from poetry.puzzle.markers import validate_marker
+from poetry.repositories.cached_repository import CachedRepository
+from poetry.repositories.legacy_repository import LegacyRepository
 from poetry.utils.helpers import get_file_hash
 
 
@@ -35,12 +43,12 @@ if TYPE_CHECKING:
     from collections.abc import Collection
     from collections.abc import Iterable
     from collections.abc import Iterator
+    from concurrent.futures import Future
     from pathlib import Path
 
     from cleo.io.io import IO
     from packaging.utils import NormalizedName
     from poetry.core.constraints.version import VersionConstraint
-    from poetry.core.packages.dependency import Dependency
     from poetry.core.packages.directory_dependency import DirectoryDependency
     from poetry.core.packages.file_dependency import FileDependency
     from poetry.core.packages.package import Package
@@ -48,6 +56,8 @@ if TYPE_CHECKING:
     from poetry.core.packages.vcs_dependency import VCSDependency
     from poetry.core.version.markers import BaseMarker
 
+    from poetry.puzzle.profiler import Profiler
+    from poetry.puzzle.profiler import ProfilerFrame
     from poetry.repositories import RepositoryPool
     from poetry.utils.env import Env
 
@@ -108,6 +118,11 @@ class Indicator(ProgressIndicator):
 class Provider:
     UNSAFE_PACKAGES: ClassVar[set[str]] = set()
 
+    # Number of candidates returned by search_for() whose metadata
+    # is fetched speculatively and the number of threads used for it.
+    PREFETCH_CANDIDATES: ClassVar[int] = 2
+    PREFETCH_MAX_WORKERS: ClassVar[int] = 8
+
     def __init__(
         self,
         package: Package,
@@ -130,6 +145,22 @@ class Provider:
         self._direct_origin_packages: dict[str, Package] = {}
         self._locked: dict[NormalizedName, list[DependencyPackage]] = defaultdict(list)
         self._use_latest: Collection[NormalizedName] = []
+        self._prefetch_executor: ThreadPoolExecutor | None = None
+        self._prefetched: dict[
+            tuple[NormalizedName, Version, str | None], Future[Package]
+        ] = {}
+        self._releases: dict[tuple[NormalizedName, str | None], list[Package]] = {}
+        self._requirements: dict[
+            tuple[NormalizedName, Version, str | None], tuple[object, ...]
+        ] = {}
+        # Search results and completed packages are kept for the lifetime
+        # of the provider so that the solver can reuse them when it has to
+        # solve again with overrides.
+        self._search_results: dict[
+            tuple[NormalizedName, str | None, str, bool | None], list[Package]
+        ] = {}
+        self._completed: dict[tuple[object, ...], tuple[Package, list[Dependency]]] = {}
+        self._profiler: Profiler | None = None
 
         self._explicit_sources: dict[str, str] = {}
         for package in locked or []:
@@ -158,6 +189,7 @@ class Provider:
 
     def load_deferred(self, load_deferred: bool) -> None:
         self._load_deferred = load_deferred
+        self._completed.clear()
 
     @contextmanager
     def use_source_root(self, source_root: Path) -> Iterator[Provider]:
@@ -175,12 +207,42 @@ class Provider:
 
         self._env = env
         self._python_constraint = Version.parse(env.marker_env["python_full_version"])
+        self._completed.clear()
 
         try:
             yield self
         finally:
             self._env = None
             self._python_constraint = original_python_constraint
+            self._completed.clear()
+
+    @contextmanager
+    def use_profiler(self, profiler: Profiler | None) -> Iterator[Provider]:
+        original_profiler = self._profiler
+        self._profiler = profiler
+
+        try:
+            yield self
+        finally:
+            self._profiler = original_profiler
+
+    @contextmanager
+    def profile(
+        self, phase: str, package: str | None = None
+    ) -> Iterator[ProfilerFrame | None]:
+        """
+        Measure the time of a phase of the resolution if a profiler is used.
+        """
+        if self._profiler is None:
+            yield None
+            return
+
+        with self._profiler.measure(phase, package) as frame:
+            yield frame
+
+    def profile_event(self, event: str, package: str | None = None) -> None:
+        if self._profiler is not None:
+            self._profiler.count(event, package)
 
     @contextmanager
     def use_latest_for(self, names: Collection[NormalizedName]) -> Iterator[Provider]:
@@ -191,6 +253,62 @@ class Provider:
         finally:
             self._use_latest = []
 
+    @contextmanager
+    def prefetching(self) -> Iterator[Provider]:
+        """
+        Fetch the metadata of likely candidates in background threads
+        while the solver is busy, so that the metadata is already available
+        when a package has to be completed.
+
+        Prefetching is only done for repositories that cache metadata.
+        """
+        if self._prefetch_executor is not None or not self._has_cached_repositories():
+            yield self
+            return
+
+        self._prefetch_executor = ThreadPoolExecutor(
+            max_workers=self.PREFETCH_MAX_WORKERS
+        )
+        try:
+            yield self
+        finally:
+            self._prefetch_executor.shutdown(wait=True, cancel_futures=True)
+            self._prefetch_executor = None
+            self._prefetched.clear()
+
+    def _has_cached_repositories(self) -> bool:
+        return any(
+            isinstance(repository, CachedRepository)
+            for repository in self._pool.all_repositories
+        )
+
+    def _prefetch(self, dependency: Dependency, packages: Iterable[Package]) -> None:
+        if self._prefetch_executor is None:
+            return
+
+        for package in packages:
+            key = (package.name, package.version, dependency.source_name)
+            if key in self._prefetched:
+                continue
+
+            self._prefetched[key] = self._prefetch_executor.submit(
+                self._pool.package,
+                package.pretty_name,
+                package.version,
+                repository_name=dependency.source_name,
+            )
+
+    def _wait_for_prefetch(self, package: Package, dependency: Dependency) -> None:
+        # If the metadata is currently being fetched in the background,
+        # we wait for it instead of fetching it a second time.
+        # Errors are ignored here because they will be raised
+        # when the metadata is requested again.
+        future = self._prefetched.get(
+            (package.name, package.version, dependency.source_name)
+        )
+        if future is not None:
+            wait([future])
+
     @staticmethod
     def validate_package_for_dependency(
         dependency: Dependency, package: Package
@@ -251,7 +369,8 @@ class Provider:
             return PackageCollection(dependency, [self._package])
 
         if dependency.is_direct_origin():
-            package = self.search_for_direct_origin_dependency(dependency)
+            with self.profile("direct_origin", dependency.name):
+                package = self.search_for_direct_origin_dependency(dependency)
             self._direct_origin_packages[dependency.name] = package
             return PackageCollection(dependency, [package])
 
@@ -264,16 +383,28 @@ class Provider:
             packages = [direct_origin_package]
             return PackageCollection(dependency, packages)
 
-        packages = self._pool.find_packages(dependency)
-
-        packages.sort(
-            key=lambda p: (
-                not p.yanked,
-                not p.is_prerelease() and not dependency.allows_prereleases(),
-                p.version,
-            ),
-            reverse=True,
+        key = (
+            dependency.name,
+            dependency.source_name,
+            str(dependency.constraint),
+            dependency.allows_prereleases(),
         )
+        if key not in self._search_results:
+            with self.profile("find_packages", dependency.name):
+                packages = self._pool.find_packages(dependency)
+
+            packages.sort(
+                key=lambda p: (
+                    not p.yanked,
+                    not p.is_prerelease() and not dependency.allows_prereleases(),
+                    p.version,
+                ),
+                reverse=True,
+            )
+            self._search_results[key] = packages
+
+        packages = list(self._search_results[key])
+        self._prefetch(dependency, packages[: self.PREFETCH_CANDIDATES])
 
         return PackageCollection(dependency, packages)
 
@@ -388,7 +519,7 @@ class Provider:
             dependencies = package.requires
 
             if not package.python_constraint.allows_all(self._python_constraint):
-                transitive_python_constraint = get_python_constraint_from_marker(
+                transitive_python_constraint = get_python_constraint(
                     dependency_package.dependency.transitive_marker
                 )
                 intersection = package.python_constraint.intersect(
@@ -421,24 +552,137 @@ class Provider:
             for dep in dependencies
             if dep.name not in self.UNSAFE_PACKAGES
             and self._python_constraint.allows_any(dep.python_constraint)
-            and (not self._env or dep.marker.validate(self._env.marker_env))
+            and (not self._env or validate_marker(dep.marker, self._env.marker_env))
         ]
         dependencies = self._get_dependencies_with_overrides(_dependencies, package)
 
+        package_dependency = package.to_dependency()
+        constraint = self._get_versions_with_same_requirements(dependency_package)
+        if constraint is not None:
+            package_dependency = package_dependency.with_constraint(constraint)
+
         return [
             Incompatibility(
-                [Term(package.to_dependency(), True), Term(dep, False)],
+                [Term(package_dependency, True), Term(dep, False)],
                 DependencyCauseError(),
             )
             for dep in dependencies
         ]
 
+    def _get_versions_with_same_requirements(
+        self, dependency_package: DependencyPackage
+    ) -> VersionConstraint | None:
+        """
+        Return the largest range of consecutive releases around the given one
+        that have the same requirements, so that the solver can reject
+        all of them at once instead of one release at a time.
+
+        Only releases whose metadata is available without another request
+        (in-memory repositories or prefetched metadata) are considered.
+        """
+        package = dependency_package.package
+        dependency = dependency_package.dependency
+        if (
+            package.is_root()
+            or package.is_direct_origin()
+            or any(p.name == package.name for p in self._overrides)
+        ):
+            return None
+
+        releases = self._get_releases(dependency)
+        versions = [release.version for release in releases]
+        try:
+            index = versions.index(package.version)
+        except ValueError:
+            return None
+
+        requirements = self._get_requirements(
+            releases[index], dependency, available=True
+        )
+        low = high = index
+        while low > 0 and (
+            self._get_requirements(releases[low - 1], dependency) == requirements
+        ):
+            low -= 1
+        while high < len(releases) - 1 and (
+            self._get_requirements(releases[high + 1], dependency) == requirements
+        ):
+            high += 1
+
+        # If the solver has to backtrack, it will most likely try older releases
+        # next, so their metadata is fetched in advance to widen the range.
+        self._prefetch(
+            dependency, reversed(releases[max(low - self.PREFETCH_CANDIDATES, 0) : low])
+        )
+
+        if low == high:
+            return None
+
+        return VersionRange(
+            versions[low], versions[high], include_min=True, include_max=True
+        )
+
+    def _get_releases(self, dependency: Dependency) -> list[Package]:
+        key = (dependency.name, dependency.source_name)
+        if key not in self._releases:
+            any_dependency = Dependency(dependency.name, "*", allows_prereleases=True)
+            any_dependency.source_name = dependency.source_name
+            releases = {
+                package.version: package
+                for package in reversed(self._pool.find_packages(any_dependency))
+            }
+            self._releases[key] = sorted(releases.values(), key=lambda p: p.version)
+
+        return self._releases[key]
+
+    def _get_requirements(
+        self, package: Package, dependency: Dependency, *, available: bool = False
+    ) -> tuple[object, ...] | None:
+        key = (package.name, package.version, dependency.source_name)
+        if key in self._requirements:
+            return self._requirements[key]
+
+        future = self._prefetched.get(key)
+        if future is not None and future.done() and future.exception() is None:
+            release = future.result()
+        elif available or not self._has_cached_repositories():
+            release = self._pool.package(
+                package.pretty_name,
+                package.version,
+                repository_name=dependency.source_name,
+            )
+        else:
+            return None
+
+        requirements = self._requirements[key] = self._get_requirements_of(release)
+        return requirements
+
+    @staticmethod
+    def _get_requirements_of(release: Package) -> tuple[object, ...]:
+        return (
+            release.python_versions,
+            sorted(dep.to_pep_508() for dep in release.requires),
+            sorted(
+                (extra, sorted(dep.to_pep_508() for dep in dependencies))
+                for extra, dependencies in release.extras.items()
+            ),
+        )
+
     def complete_package(
         self, dependency_package: DependencyPackage
     ) -> DependencyPackage:
         package = dependency_package.package
         dependency = dependency_package.dependency
 
+        completion_key = self._get_completion_key(dependency_package)
+        if completion_key is not None and completion_key in self._completed:
+            package, dependencies = self._completed[completion_key]
+            package = package.with_dependency_groups([], only=True)
+            for dep in dependencies:
+                package.add_dependency(dep.clone())
+
+            return DependencyPackage(dependency, package)
+
         if package.is_root():
             dependency_package = dependency_package.clone()
             package = dependency_package.package
@@ -447,19 +691,30 @@ class Provider:
         elif package.is_direct_origin():
             requires = package.requires
         else:
-            dependency_package = DependencyPackage(
-                dependency,
-                self._pool.package(
-                    package.pretty_name,
-                    package.version,
-                    extras=list(dependency.extras),
-                    repository_name=dependency.source_name,
-                ),
-            )
+            with self.profile("metadata") as frame:
+                self._wait_for_prefetch(package, dependency)
+                dependency_package = DependencyPackage(
+                    dependency,
+                    self._pool.package(
+                        package.pretty_name,
+                        package.version,
+                        extras=list(dependency.extras),
+                        repository_name=dependency.source_name,
+                    ),
+                )
+                if frame is not None:
+                    frame.phase = (
+                        f"metadata ({self._get_repository_name(dependency_package)})"
+                    )
 
             package = dependency_package.package
             dependency = dependency_package.dependency
             requires = package.requires
+            requirements_key = (package.name, package.version, dependency.source_name)
+            if requirements_key not in self._requirements:
+                self._requirements[requirements_key] = self._get_requirements_of(
+                    package
+                )
 
         optional_dependencies = []
         _dependencies = []
@@ -497,7 +752,7 @@ class Provider:
             if dep.name in self.UNSAFE_PACKAGES:
                 continue
 
-            if self._env and not dep.marker.validate(self._env.marker_env):
+            if self._env and not validate_marker(dep.marker, self._env.marker_env):
                 continue
 
             if not package.is_root() and (
@@ -521,7 +776,8 @@ class Provider:
                     # do not analyze it again: nothing could have changed.
                     if locked is not None and locked.package.is_same_package_as(dep):
                         continue
-                    self.search_for_direct_origin_dependency(dep)
+                    with self.profile("direct_origin", dep.name):
+                        self.search_for_direct_origin_dependency(dep)
 
         dependencies = self._get_dependencies_with_overrides(_dependencies, package)
 
@@ -548,6 +804,7 @@ class Provider:
             duplicates[dep.complete_name].append(dep)
 
         dependencies = []
+        uses_all_overrides = False
         for dep_name, deps in duplicates.items():
             if len(deps) == 1:
                 dependencies.append(deps[0])
@@ -558,7 +815,8 @@ class Provider:
             # For dependency resolution, markers of duplicate dependencies must be
             # mutually exclusive.
             active_extras = None if package.is_root() else dependency.extras
-            deps = self._resolve_overlapping_markers(package, deps, active_extras)
+            with self.profile("markers"):
+                deps = self._resolve_overlapping_markers(package, deps, active_extras)
 
             if len(deps) == 1:
                 self.debug(f"<debug>Merging requirements for {dep_name}</debug>")
@@ -594,11 +852,13 @@ class Provider:
             overrides_marker_intersection: BaseMarker = AnyMarker()
             for dep_overrides in self._overrides.values():
                 for dep in dep_overrides.values():
-                    overrides_marker_intersection = (
-                        overrides_marker_intersection.intersect(dep.marker)
+                    overrides_marker_intersection = intersect_markers(
+                        overrides_marker_intersection, dep.marker
                     )
             for dep in deps:
-                if not overrides_marker_intersection.intersect(dep.marker).is_empty():
+                if not intersect_markers(
+                    overrides_marker_intersection, dep.marker
+                ).is_empty():
                     current_overrides = self._overrides.copy()
                     package_overrides = current_overrides.get(package, {}).copy()
                     package_overrides.update({dep.name: dep})
@@ -608,14 +868,17 @@ class Provider:
             if overrides:
                 raise OverrideNeededError(*overrides)
 
+            # The dependencies are dropped because of the overrides
+            # of other packages.
+            uses_all_overrides = True
+
         # Modifying dependencies as needed
         clean_dependencies = []
         for dep in dependencies:
             if not dependency.transitive_marker.without_extras().is_any():
-                transitive_marker_intersection = (
-                    dependency.transitive_marker.without_extras().intersect(
-                        dep.marker.without_extras()
-                    )
+                transitive_marker_intersection = intersect_markers(
+                    dependency.transitive_marker.without_extras(),
+                    dep.marker.without_extras(),
                 )
                 if transitive_marker_intersection.is_empty():
                     # The dependency is not needed, since the markers specified
@@ -635,6 +898,12 @@ class Provider:
 
             clean_dependencies.append(dep)
 
+        if completion_key is not None and not uses_all_overrides:
+            self._completed[completion_key] = (
+                package,
+                [dep.clone() for dep in clean_dependencies],
+            )
+
         package = package.with_dependency_groups([], only=True)
         dependency_package = DependencyPackage(dependency, package)
 
@@ -653,6 +922,56 @@ class Provider:
 
         return dependency_package
 
+    def _get_repository_name(self, dependency_package: DependencyPackage) -> str:
+        if dependency_package.dependency.source_name:
+            return dependency_package.dependency.source_name
+
+        package = dependency_package.package
+        if package.source_type == "legacy":
+            return package.source_reference or "unknown"
+
+        if package.source_type:
+            # file, directory, url or vcs dependencies
+            return package.source_type
+
+        # Only packages of repositories that are not legacy repositories
+        # (e.g. PyPI) have no source type, so the repository is only known
+        # if there is a single one of them.
+        names = {
+            repository.name
+            for repository in self._pool.all_repositories
+            if not isinstance(repository, LegacyRepository)
+        }
+        if len(names) == 1:
+            return names.pop()
+
+        return "unknown"
+
+    def _get_completion_key(
+        self, dependency_package: DependencyPackage
+    ) -> tuple[object, ...] | None:
+        package = dependency_package.package
+        dependency = dependency_package.dependency
+        if package.is_root() or package.is_direct_origin():
+            return None
+
+        overrides = sorted(
+            (name, str(dep.constraint), str(dep.marker))
+            for overridden, deps in self._overrides.items()
+            if overridden.name == package.name and overridden.version == package.version
+            for name, dep in deps.items()
+        )
+
+        return (
+            package.name,
+            package.version,
+            dependency.source_name,
+            frozenset(dependency.extras),
+            str(dependency.transitive_marker),
+            str(dependency.python_constraint),
+            tuple(overrides),
+        )
+
     def get_locked(self, dependency: Dependency) -> DependencyPackage | None:
         if dependency.name in self._use_latest:
             return None
@@ -663,6 +982,8 @@ class Provider:
             if package.satisfies(dependency):
                 if explicit_source := self._explicit_sources.get(dependency.name):
                     dependency.source_name = explicit_source
+                if not package.is_direct_origin():
+                    self._prefetch(dependency, [package])
                 return DependencyPackage(dependency, package)
         return None
 
@@ -812,11 +1133,12 @@ class Provider:
         """
         return (
             not marker.is_empty()
-            and self._python_constraint.allows_any(
-                get_python_constraint_from_marker(marker)
+            and self._python_constraint.allows_any(get_python_constraint(marker))
+            and (
+                active_extras is None
+                or validate_marker(marker, {"extra": active_extras})
             )
-            and (active_extras is None or marker.validate({"extra": active_extras}))
-            and (not self._env or marker.validate(self._env.marker_env))
+            and (not self._env or validate_marker(marker, self._env.marker_env))
         )
 
     def _resolve_overlapping_markers(
@@ -829,33 +1151,48 @@ class Provider:
         Convert duplicate dependencies with potentially overlapping markers
         into duplicate dependencies with mutually exclusive markers.
 
-        Therefore, the intersections of all combinations of markers and inverted markers
-        have to be calculated. If such an intersection is relevant (not empty, etc.),
-        the intersection of all constraints, whose markers were not inverted is built
-        and a new dependency with the calculated version constraint and marker is added.
-        (The marker of such a dependency does not overlap with the marker
+        Therefore, the marker space is partitioned into regions in which
+        the same dependencies apply. For each relevant region (not empty, etc.),
+        the intersection of the constraints of these dependencies is built
+        and a new dependency with the calculated version constraint and marker
+        is added. (The marker of such a dependency does not overlap with the marker
         of any other new dependency.)
         """
         # In order to reduce the number of intersections,
         # we merge duplicate dependencies by constraint.
         dependencies = self._merge_dependencies_by_constraint(dependencies)
 
+        # Each dependency splits the regions found so far into the part
+        # covered by its marker and the rest. Empty parts are dropped right away
+        # so that only regions that actually exist are refined further
+        # instead of all 2^n combinations of markers and inverted markers.
+        inverted_markers = [invert_marker(dep.marker) for dep in dependencies]
+        regions: list[tuple[list[bool], BaseMarker]] = [([], AnyMarker())]
+        for dep, inverted_marker in zip(dependencies, inverted_markers):
+            refined_regions = []
+            for uses, marker in regions:
+                for use, dep_marker in ((True, dep.marker), (False, inverted_marker)):
+                    intersection = intersect_markers(marker, dep_marker)
+                    if not intersection.is_empty():
+                        refined_regions.append(([*uses, use], intersection))
+            regions = refined_regions
+
         new_dependencies = []
-        for uses in itertools.product([True, False], repeat=len(dependencies)):
-            # intersection of markers
-            # For performance optimization, we don't just intersect all markers at once,
-            # but intersect them one after the other to get empty markers early.
-            # Further, we intersect the inverted markers at last because
-            # they are more likely to overlap than the non-inverted ones.
-            markers = (
-                dep.marker if use else dep.marker.invert()
-                for use, dep in sorted(
-                    zip(uses, dependencies), key=lambda ud: ud[0], reverse=True
-                )
-            )
+        for uses, _ in regions:
+            # The marker of the region is built again from the markers
+            # of the used dependencies followed by the inverted markers
+            # of the other dependencies, which results in simpler markers
+            # than the order in which the regions have been refined.
+            markers = [dep.marker for use, dep in zip(uses, dependencies) if use] + [
+                inverted_marker
+                for use, inverted_marker in zip(uses, inverted_markers)
+                if not use
+            ]
             used_marker_intersection: BaseMarker = AnyMarker()
             for m in markers:
-                used_marker_intersection = used_marker_intersection.intersect(m)
+                used_marker_intersection = intersect_markers(
+                    used_marker_intersection, m
+                )
             if not self._is_relevant_marker(used_marker_intersection, active_extras):
                 continue
 
@@ -16,6 +16,9 @@ from poetry.mixology.failure import SolveFailureError
 from poetry.packages.transitive_package_info import TransitivePackageInfo
 from poetry.puzzle.exceptions import OverrideNeededError
 from poetry.puzzle.exceptions import SolverProblemError
+from poetry.puzzle.markers import get_marker_cache_stats
+from poetry.puzzle.markers import intersect_markers
+from poetry.puzzle.markers import union_markers
 from poetry.puzzle.provider import Indicator
 from poetry.puzzle.provider import Provider
 
@@ -73,15 +76,22 @@ class Solver:
     ) -> Transaction:
         from poetry.puzzle.transaction import Transaction
 
-        with self._progress(), self._provider.use_latest_for(use_latest or []):
+        with (
+            self._progress(),
+            self._provider.use_latest_for(use_latest or []),
+            self._provider.prefetching(),
+            self._provider.profile("solve"),
+        ):
             start = time.time()
+            marker_cache_stats = get_marker_cache_stats()
             packages = self._solve()
             # simplify markers by removing redundant information
-            for transitive_info in packages.values():
-                for group, marker in transitive_info.markers.items():
-                    transitive_info.markers[group] = simplify_marker(
-                        marker, self._package.python_constraint
-                    )
+            with self._provider.profile("markers"):
+                for transitive_info in packages.values():
+                    for group, marker in transitive_info.markers.items():
+                        transitive_info.markers[group] = simplify_marker(
+                            marker, self._package.python_constraint
+                        )
             end = time.time()
 
             if len(self._overrides) > 1:
@@ -96,6 +106,14 @@ class Solver:
                     f" {', '.join(f'({b})' for b in self._overrides)}"
                 )
 
+            if self._provider.is_debugging():
+                stats = [
+                    f"{name} {hits - marker_cache_stats[name][0]} hits"
+                    f" / {misses - marker_cache_stats[name][1]} misses"
+                    for name, (hits, misses) in get_marker_cache_stats().items()
+                ]
+                self._provider.debug(f"Marker cache: {', '.join(stats)}")
+
         for p in packages:
             if p.yanked:
                 message = (
@@ -164,11 +182,12 @@ class Solver:
     def _aggregate_solved_packages(
         self, packages: list[Package]
     ) -> dict[Package, TransitivePackageInfo]:
-        combined_nodes, markers = depth_first_search(
-            PackageNode(self._package, packages)
-        )
-        results = dict(aggregate_package_nodes(nodes) for nodes in combined_nodes)
-        calculate_markers(results, markers)
+        with self._provider.profile("markers"):
+            combined_nodes, markers = depth_first_search(
+                PackageNode(self._package, packages)
+            )
+            results = dict(aggregate_package_nodes(nodes) for nodes in combined_nodes)
+            calculate_markers(results, markers)
 
         # Merging feature packages with base packages
         solved_packages = {}
@@ -257,10 +276,11 @@ def dfs_visit(
     for out_neighbor in node.reachable():
         back_edges[out_neighbor.id].append(node)
         marker = markers[out_neighbor.package][node.package]
-        markers[out_neighbor.package][node.package] = marker.union(
+        markers[out_neighbor.package][node.package] = union_markers(
+            marker,
             out_neighbor.marker
             if node.package.is_root()
-            else out_neighbor.marker.without_extras()
+            else out_neighbor.marker.without_extras(),
         )
         dfs_visit(out_neighbor, back_edges, visited, sorted_nodes, markers)
     sorted_nodes.insert(0, node)
@@ -390,12 +410,15 @@ def calculate_markers(
                             has_incomplete_markers = True
                             continue
                         for group in parent_info.groups:
-                            transitive_marker[group] = transitive_marker[group].union(
-                                parent_info.markers[group].intersect(m)
+                            transitive_marker[group] = union_markers(
+                                transitive_marker[group],
+                                intersect_markers(parent_info.markers[group], m),
                             )
                     else:
                         for group in transitive_info.groups:
-                            transitive_marker[group] = transitive_marker[group].union(m)
+                            transitive_marker[group] = union_markers(
+                                transitive_marker[group], m
+                            )
                 transitive_info.markers = transitive_marker
 
 
@@ -407,16 +430,19 @@ def merge_packages_from_override(
     override_marker: BaseMarker = AnyMarker()
     for deps in override.values():
         for dep in deps.values():
-            override_marker = override_marker.intersect(dep.marker.without_extras())
+            override_marker = intersect_markers(
+                override_marker, dep.marker.without_extras()
+            )
     for new_package, new_package_info in new_packages.items():
         if package_info := packages.get(new_package):
             # update existing package
             package_info.depth = max(package_info.depth, new_package_info.depth)
             package_info.groups.update(new_package_info.groups)
             for group, marker in new_package_info.markers.items():
-                package_info.markers[group] = package_info.markers.get(
-                    group, EmptyMarker()
-                ).union(override_marker.intersect(marker))
+                package_info.markers[group] = union_markers(
+                    package_info.markers.get(group, EmptyMarker()),
+                    intersect_markers(override_marker, marker),
+                )
             for package in packages:
                 if package == new_package:
                     for dep in new_package.requires:
@@ -425,7 +451,9 @@ def merge_packages_from_override(
 
         else:
             for group, marker in new_package_info.markers.items():
-                new_package_info.markers[group] = override_marker.intersect(marker)
+                new_package_info.markers[group] = intersect_markers(
+                    override_marker, marker
+                )
             packages[new_package] = new_package_info
 
 
@@ -4,6 +4,7 @@ from collections import defaultdict
 from typing import TYPE_CHECKING
 from typing import Any
 
+from poetry.puzzle.markers import validate_marker
 from poetry.utils.extras import get_extra_package_names
 
 
@@ -86,9 +87,9 @@ class Transaction:
                 assert isinstance(self._result_packages, dict)
                 info = self._result_packages[result_package]
 
-                if info.groups & self._groups and info.get_marker(
-                    self._groups
-                ).validate(marker_env_with_extras):
+                if info.groups & self._groups and validate_marker(
+                    info.get_marker(self._groups), marker_env_with_extras
+                ):
                     relevant_result_packages.add(result_package.name)
                 elif result_package.optional:
                     is_unsolicited_extra = True
@@ -11,6 +11,7 @@ from poetry.core.constraints.version import parse_constraint
 from poetry.config.config import Config
 from poetry.repositories.repository import Repository
 from poetry.utils.cache import FileCache
+from poetry.utils.helpers import synchronized_lru_cache
 
 
 if TYPE_CHECKING:
@@ -23,6 +24,7 @@ if TYPE_CHECKING:
 
 class CachedRepository(Repository, ABC):
     CACHE_VERSION = parse_constraint("2.0.0")
+    RELEASE_INFO_CACHE_SIZE = 1024
 
     def __init__(
         self, name: str, *, disable_cache: bool = False, config: Config | None = None
@@ -31,6 +33,14 @@ class CachedRepository(Repository, ABC):
         self._disable_cache = disable_cache
         self._cache_dir = (config or Config.create()).repository_cache_directory / name
         self._release_cache: FileCache[dict[str, Any]] = FileCache(path=self._cache_dir)
+        # The solver completes the same release several times
+        # (after backtracking or when solving with overrides), so the release
+        # information of the most recently used releases is additionally kept
+        # in memory to avoid reading and decoding the cache file again.
+        # The repository may be shared by solvers on several threads.
+        self._get_cached_release_info = synchronized_lru_cache(
+            self._load_cached_release_info, maxsize=self.RELEASE_INFO_CACHE_SIZE
+        )
 
     @abstractmethod
     def _get_release_info(
@@ -49,6 +59,12 @@ class CachedRepository(Repository, ABC):
         if self._disable_cache:
             return PackageInfo.load(self._get_release_info(name, version))
 
+        # PackageInfo.load() consumes the passed dict, so we pass a copy.
+        return PackageInfo.load(dict(self._get_cached_release_info(name, version)))
+
+    def _load_cached_release_info(
+        self, name: NormalizedName, version: Version
+    ) -> dict[str, Any]:
         cached = self._release_cache.remember(
             f"{name}:{version}", lambda: self._get_release_info(name, version)
         )
@@ -64,7 +80,7 @@ class CachedRepository(Repository, ABC):
 
             self._release_cache.put(f"{name}:{version}", cached)
 
-        return PackageInfo.load(cached)
+        return cached
 
     def package(
         self,
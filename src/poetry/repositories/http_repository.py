@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-import functools
 import hashlib
 
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from contextlib import suppress
 from pathlib import Path
@@ -31,6 +31,7 @@ from poetry.utils.constants import REQUESTS_TIMEOUT
 from poetry.utils.helpers import HTTPRangeRequestSupportedError
 from poetry.utils.helpers import download_file
 from poetry.utils.helpers import get_highest_priority_hash_type
+from poetry.utils.helpers import synchronized_lru_cache
 from poetry.utils.patterns import wheel_file_re
 
 
@@ -65,7 +66,12 @@ class HTTPRepository(CachedRepository):
             pool_size=pool_size,
         )
         self._authenticator.add_repository(name, url)
-        self.get_page = functools.lru_cache(maxsize=None)(self._get_page)
+        # Independent requests (e.g. for metadata of several files of a release)
+        # are sent concurrently, but never with more threads than connections.
+        # Only requests that do not send further requests concurrently
+        # are submitted to the pool, so that they never wait for each other.
+        self._executor = ThreadPoolExecutor(max_workers=pool_size)
+        self.get_page = synchronized_lru_cache(self._get_page, maxsize=None)
 
         self._lazy_wheel = config.get("solver.lazy-wheel", True)
         self._max_retries = config.get("requests.max-retries", 0)
@@ -199,6 +205,9 @@ class HTTPRepository(CachedRepository):
 
         return None
 
+    def _get_info_from_metadata_or_wheel(self, link: Link) -> PackageInfo:
+        return self._get_info_from_metadata(link) or self._get_info_from_wheel(link)
+
     def _get_info_from_links(
         self, links: list[Link], *, ignore_yanked: bool
     ) -> PackageInfo:
@@ -252,19 +261,17 @@ class HTTPRepository(CachedRepository):
                     platform_specific_wheels.append(wheel)
 
             if universal_wheel is not None:
-                return self._get_info_from_metadata(
-                    universal_wheel
-                ) or self._get_info_from_wheel(universal_wheel)
+                return self._get_info_from_metadata_or_wheel(universal_wheel)
 
             info = None
             if universal_python2_wheel and universal_python3_wheel:
-                info = self._get_info_from_metadata(
-                    universal_python2_wheel
-                ) or self._get_info_from_wheel(universal_python2_wheel)
-
-                py3_info = self._get_info_from_metadata(
-                    universal_python3_wheel
-                ) or self._get_info_from_wheel(universal_python3_wheel)
+                # The metadata of both wheels is required,
+                # so we fetch it concurrently.
+                py3_future = self._executor.submit(
+                    self._get_info_from_metadata_or_wheel, universal_python3_wheel
+                )
+                info = self._get_info_from_metadata_or_wheel(universal_python2_wheel)
+                py3_info = py3_future.result()
 
                 if info.requires_python or py3_info.requires_python:
                     info.requires_python = str(
@@ -314,20 +321,15 @@ class HTTPRepository(CachedRepository):
 
             # Prefer non platform specific wheels
             if universal_python3_wheel:
-                return self._get_info_from_metadata(
-                    universal_python3_wheel
-                ) or self._get_info_from_wheel(universal_python3_wheel)
+                return self._get_info_from_metadata_or_wheel(universal_python3_wheel)
 
             if universal_python2_wheel:
-                return self._get_info_from_metadata(
-                    universal_python2_wheel
-                ) or self._get_info_from_wheel(universal_python2_wheel)
+                return self._get_info_from_metadata_or_wheel(universal_python2_wheel)
 
             if platform_specific_wheels:
-                first_wheel = platform_specific_wheels[0]
-                return self._get_info_from_metadata(
-                    first_wheel
-                ) or self._get_info_from_wheel(first_wheel)
+                return self._get_info_from_metadata_or_wheel(
+                    platform_specific_wheels[0]
+                )
 
         return self._get_info_from_metadata(sdists[0]) or self._get_info_from_sdist(
             sdists[0]
@@ -340,19 +342,37 @@ class HTTPRepository(CachedRepository):
                 f' "{data.version}"'
             )
 
-        files: list[dict[str, Any]] = []
-        for link in links:
-            if link.yanked and not data.yanked:
-                # drop yanked files unless the entire release is yanked
-                continue
+        files_links = [
+            link
+            for link in links
+            # drop yanked files unless the entire release is yanked
+            if not link.yanked or data.yanked
+        ]
+        # Files without a secure hash have to be downloaded to calculate one.
+        # These downloads do not depend on each other or on the retrieval
+        # of the metadata, so all requests are sent concurrently.
+        missing_hash_links = [
+            link
+            for link in files_links
+            if not any(
+                hash_name in link.hashes for hash_name in ("sha512", "sha384", "sha256")
+            )
+        ]
+        calculated_hashes = {
+            link: self._executor.submit(self.calculate_sha256, link)
+            for link in missing_hash_links
+        }
+        info = self._get_info_from_links(links, ignore_yanked=not data.yanked)
 
+        files: list[dict[str, Any]] = []
+        for link in files_links:
             file_hash: str | None
             for hash_name in ("sha512", "sha384", "sha256"):
                 if hash_name in link.hashes:
                     file_hash = f"{hash_name}:{link.hashes[hash_name]}"
                     break
             else:
-                file_hash = self.calculate_sha256(link)
+                file_hash = calculated_hashes[link].result()
 
             if file_hash is None and (
                 hash_type := get_highest_priority_hash_type(link.hashes, link.filename)
@@ -363,9 +383,6 @@ class HTTPRepository(CachedRepository):
 
         data.files = files
 
-        # drop yanked files unless the entire release is yanked
-        info = self._get_info_from_links(links, ignore_yanked=not data.yanked)
-
         data.summary = info.summary
         data.requires_dist = info.requires_dist
         data.requires_python = info.requires_python
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+import contextlib
 import itertools
 import json
 import logging
+import os
 
 from pathlib import Path
 from typing import TYPE_CHECKING
+from typing import Any
+from typing import ClassVar
 
 from packaging.utils import canonicalize_name
 from poetry.core.packages.package import Package
@@ -16,6 +20,7 @@ from poetry.core.utils.helpers import module_name
 from poetry.repositories.repository import Repository
 from poetry.utils._compat import getencoding
 from poetry.utils._compat import metadata
+from poetry.utils.env import GenericEnv
 from poetry.utils.env import VirtualEnv
 
 
@@ -28,6 +33,9 @@ logger = logging.getLogger(__name__)
 
 
 class InstalledRepository(Repository):
+    INDEX_FILE: ClassVar[str] = ".poetry-installed.json"
+    INDEX_VERSION: ClassVar[int] = 2
+
     def __init__(self, packages: Sequence[Package] | None = None) -> None:
         super().__init__("poetry-installed", packages)
         self.system_site_packages: list[Package] = []
@@ -243,6 +251,10 @@ class InstalledRepository(Repository):
     def load(cls, env: Env, with_dependencies: bool = False) -> InstalledRepository:
         """
         Load installed packages.
+
+        Distributions that have already been loaded before are read from an index
+        in the environment, as long as neither their metadata directory nor the
+        files they have been loaded from have been modified in the meantime.
         """
         from poetry.core.packages.dependency import Dependency
 
@@ -256,6 +268,10 @@ class InstalledRepository(Repository):
             else None
         )
 
+        index_path = cls._get_index_path(env)
+        index = cls._read_index(index_path)
+        new_index: dict[str, dict[str, Any]] = {}
+
         for entry in env.sys_path:
             if not entry.strip():
                 logger.debug(
@@ -273,7 +289,18 @@ class InstalledRepository(Repository):
                 if path in skipped:
                     continue
 
-                name = distribution.metadata.get("name")  # type: ignore[attr-defined]
+                index_entry = cls._get_index_entry(index, path, env)
+                if index_entry is None:
+                    name = distribution.metadata.get("name")  # type: ignore[attr-defined]
+                    index_entry = {
+                        "stamp": cls._get_stamp(path, name, env),
+                        "name": name,
+                    }
+
+                if index_entry["stamp"] is not None:
+                    new_index[str(path)] = index_entry
+
+                name = index_entry["name"]
                 if name is None:
                     logger.warning(
                         "Project environment contains an invalid distribution"
@@ -289,10 +316,22 @@ class InstalledRepository(Repository):
                 if name in seen:
                     continue
 
-                package = cls.create_package_from_distribution(distribution, env)
+                if "package" in index_entry:
+                    package = cls._create_package_from_index_entry(index_entry)
+                else:
+                    package = cls.create_package_from_distribution(distribution, env)
+                    if cls._is_indexable(package, path):
+                        index_entry["package"] = cls._create_index_data(
+                            package, distribution
+                        )
 
                 if with_dependencies:
-                    for require in distribution.metadata.get_all("requires-dist", []):
+                    requires = (
+                        index_entry["package"]["requires"]
+                        if "package" in index_entry
+                        else distribution.metadata.get_all("requires-dist", [])
+                    )
+                    for require in requires:
                         dep = Dependency.create_from_pep_508(require)
                         package.add_dependency(dep)
 
@@ -300,11 +339,140 @@ class InstalledRepository(Repository):
                 repo.add_package(
                     package,
                     is_system_site=bool(
-                        base_env
-                        and base_env.is_path_relative_to_lib(
-                            Path(str(distribution._path))  # type: ignore[attr-defined]
-                        )
+                        base_env and base_env.is_path_relative_to_lib(path)
                     ),
                 )
 
+        if new_index != index:
+            cls._write_index(index_path, new_index)
+
         return repo
+
+    @classmethod
+    def _get_index_path(cls, env: Env) -> Path | None:
+        # Only virtual environments managed by Poetry get an index, the prefix
+        # of any other environment does not belong to Poetry.
+        if not isinstance(env, VirtualEnv) or isinstance(env, GenericEnv):
+            return None
+
+        return env.path / cls.INDEX_FILE
+
+    @classmethod
+    def _read_index(cls, path: Path | None) -> dict[str, dict[str, Any]]:
+        if path is None:
+            return {}
+
+        try:
+            index = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+
+        if not isinstance(index, dict) or index.get("version") != cls.INDEX_VERSION:
+            return {}
+
+        distributions: dict[str, dict[str, Any]] = index.get("distributions", {})
+        return distributions
+
+    @classmethod
+    def _write_index(
+        cls, path: Path | None, distributions: dict[str, dict[str, Any]]
+    ) -> None:
+        if path is None:
+            return
+
+        index = {"version": cls.INDEX_VERSION, "distributions": distributions}
+
+        # The environment might not be writable,
+        # in which case the index is not persisted.
+        with contextlib.suppress(OSError):
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}")
+            tmp_path.write_text(json.dumps(index), encoding="utf-8")
+            tmp_path.replace(path)
+
+    @classmethod
+    def _get_index_entry(
+        cls, index: dict[str, dict[str, Any]], path: Path, env: Env
+    ) -> dict[str, Any] | None:
+        entry = index.get(str(path))
+        if entry is None:
+            return None
+
+        stamp = cls._get_stamp(path, entry.get("name"), env)
+        if stamp is None or entry.get("stamp") != stamp:
+            return None
+
+        # copy the entry so that changes can be detected when writing the index
+        return dict(entry)
+
+    @classmethod
+    def _get_stamp(cls, path: Path, name: str | None, env: Env) -> list[Any] | None:
+        """
+        Return the modification times of all files
+        a package is created from, or None if it must not be indexed.
+        """
+        mtime = cls._get_mtime(path)
+        if mtime is None:
+            return None
+
+        # Installers (re)create the metadata directory of a distribution,
+        # so its mtime changes whenever the distribution is reinstalled.
+        # However, the files in it may also be modified in place.
+        files = [path / "METADATA", path / "PKG-INFO", path / "direct_url.json"]
+        if name is not None:
+            # The source of packages without direct_url.json
+            # may be derived from .pth files.
+            files += [
+                lib.joinpath(module).with_suffix(".pth")
+                for lib in sorted({env.purelib, env.platlib})
+                for module in sorted({name, module_name(name)})
+            ]
+
+        return [mtime, *(cls._get_mtime(file) for file in files)]
+
+    @staticmethod
+    def _get_mtime(path: Path) -> int | None:
+        # Distributions inside of zip files are never indexed.
+        try:
+            return os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+
+    @classmethod
+    def _is_indexable(cls, package: Package, path: Path) -> bool:
+        # The revision of a VCS package that has been derived from its source
+        # directory changes without touching the metadata of the distribution.
+        return package.source_type != "git" or path.joinpath("direct_url.json").exists()
+
+    @staticmethod
+    def _create_index_data(
+        package: Package, distribution: metadata.Distribution
+    ) -> dict[str, Any]:
+        return {
+            "name": package.pretty_name,
+            "version": package.pretty_version,
+            "description": package.description,
+            "source_type": package.source_type,
+            "source_url": package.source_url,
+            "source_reference": package.source_reference,
+            "source_resolved_reference": package.source_resolved_reference,
+            "source_subdirectory": package.source_subdirectory,
+            "develop": package.develop,
+            "requires": distribution.metadata.get_all("requires-dist", []),
+        }
+
+    @staticmethod
+    def _create_package_from_index_entry(entry: dict[str, Any]) -> Package:
+        data = entry["package"]
+        package = Package(
+            data["name"],
+            data["version"],
+            source_type=data["source_type"],
+            source_url=data["source_url"],
+            source_reference=data["source_reference"],
+            source_resolved_reference=data["source_resolved_reference"],
+            source_subdirectory=data["source_subdirectory"],
+            develop=data["develop"],
+        )
+        package.description = data["description"]
+
+        return package
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import contextlib
 import dataclasses
 import functools
+import hashlib
 import logging
+import os
 import time
 import urllib.parse
 
@@ -31,6 +34,8 @@ from poetry.utils.password_manager import PasswordManager
 
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from cleo.io.io import IO
 
 
@@ -226,16 +231,19 @@ class Authenticator:
 
         while True:
             is_last_attempt = attempt >= 5
-            try:
-                resp = session.send(prepared_request, **send_kwargs)
-            except (requests.exceptions.ConnectionError, OSError) as e:
-                if is_last_attempt:
-                    raise e
-            else:
-                if resp.status_code not in STATUS_FORCELIST or is_last_attempt:
-                    if raise_for_status:
-                        resp.raise_for_status()
-                    return resp
+            # The lock is only held for one attempt, so that other requests
+            # of the same url do not wait while this one is backing off.
+            with self._coalesce(prepared_request, stream, send_kwargs["timeout"]):
+                try:
+                    resp = session.send(prepared_request, **send_kwargs)
+                except (requests.exceptions.ConnectionError, OSError) as e:
+                    if is_last_attempt:
+                        raise e
+                else:
+                    if resp.status_code not in STATUS_FORCELIST or is_last_attempt:
+                        if raise_for_status:
+                            resp.raise_for_status()
+                        return resp
 
             if not is_last_attempt:
                 attempt += 1
@@ -247,6 +255,54 @@ class Authenticator:
         # this should never really be hit under any sane circumstance
         raise PoetryError("Failed HTTP {} request", method.upper())
 
+    @contextlib.contextmanager
+    def _coalesce(
+        self, request: requests.PreparedRequest, stream: bool | None, timeout: float
+    ) -> Iterator[None]:
+        """
+        Serialize cacheable requests of the same url, even across processes.
+
+        Only the first request is sent to the server. Subsequent requests wait
+        until its response has been stored, and are then answered from the cache
+        or revalidated by the cache with a conditional request. If the lock
+        cannot be acquired within the timeout of the request, the request
+        is sent without waiting any longer.
+        """
+        if (
+            self._cache_control is None
+            or request.method != "GET"
+            or request.url is None
+            or stream
+        ):
+            yield
+            return
+
+        lock_path = (
+            Path(self._cache_control.directory)
+            / "_locks"
+            / f"{hashlib.sha256(request.url.encode()).hexdigest()}.lock"
+        )
+        lock = self._cache_control.lock_class(str(lock_path), timeout=timeout)
+        try:
+            lock_path.parent.mkdir(parents=True, exist_ok=True)
+            lock.acquire()
+        except (OSError, TimeoutError):
+            logger.debug("Could not lock %s, requesting without lock.", request.url)
+            yield
+            return
+
+        # Lock files are not removed on release, since another process might be
+        # waiting for the same file. Instead, they are evicted with the other
+        # items of the HTTP cache when the caches are pruned. Touching them marks
+        # them as used, so that locks that are in use are never evicted.
+        with contextlib.suppress(OSError):
+            os.utime(lock_path)
+
+        try:
+            yield
+        finally:
+            lock.release()
+
     def _get_backoff(self, response: requests.Response | None, attempt: int) -> float:
         if response is not None:
             retry_after = response.headers.get(RETRY_AFTER_HEADER, "")
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import contextlib
 import dataclasses
 import hashlib
 import json
 import logging
+import os
 import shutil
 import threading
 import time
@@ -16,6 +18,8 @@ from typing import Generic
 from typing import TypeVar
 from typing import overload
 
+from packaging.tags import Tag
+
 from poetry.utils._compat import decode
 from poetry.utils._compat import encode
 from poetry.utils.helpers import get_highest_priority_hash_type
@@ -25,14 +29,19 @@ from poetry.utils.wheel import Wheel
 
 if TYPE_CHECKING:
     from collections.abc import Callable
+    from collections.abc import Iterable
 
     from poetry.core.packages.utils.link import Link
 
+    from poetry.config.config import Config
     from poetry.utils.env import Env
 
 
 # Used by FileCache for items that do not expire.
 MAX_DATE = 9999999999
+# The last use of cache entries is only updated if the recorded last use
+# is older than this (in seconds), to avoid writing on every access.
+LAST_USED_RESOLUTION = 60 * 60
 T = TypeVar("T")
 
 logger = logging.getLogger(__name__)
@@ -71,6 +80,49 @@ class CacheItem(Generic[T]):
         return self.expires is not None and time.time() >= self.expires
 
 
+@dataclasses.dataclass(frozen=True)
+class CacheEntry:
+    """
+    An entry of a cache that can be evicted, consisting of one or more paths.
+
+    If a lock file is given, the entry is in use as long as the lock is held
+    and is only removed if the lock can be acquired immediately.
+    """
+
+    paths: tuple[Path, ...]
+    size: int
+    last_used: float
+    lock: Path | None = None
+
+    def remove(self) -> bool:
+        """
+        Remove the entry, unless it is in use.
+
+        :returns: Whether the entry has been removed.
+        """
+        if self.lock is None:
+            self._remove()
+            return True
+
+        from filelock import FileLock
+        from filelock import Timeout
+
+        try:
+            with FileLock(self.lock, timeout=0):
+                self._remove()
+        except Timeout:
+            return False
+
+        return True
+
+    def _remove(self) -> None:
+        for path in self.paths:
+            if path.is_dir():
+                shutil.rmtree(path, ignore_errors=True)
+            else:
+                path.unlink(missing_ok=True)
+
+
 @dataclasses.dataclass(frozen=True)
 class FileCache(Generic[T]):
     """
@@ -113,8 +165,16 @@ class FileCache(Generic[T]):
         )
         path = self._path(key)
         path.parent.mkdir(parents=True, exist_ok=True)
-        with path.open("wb") as f:
-            f.write(self._serialize(payload))
+        # Write to a temporary file first, so that concurrent readers
+        # never see a partially written item.
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}")
+        try:
+            with tmp_path.open("wb") as f:
+                f.write(self._serialize(payload))
+            tmp_path.replace(path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
 
     def forget(self, key: str) -> None:
         """
@@ -132,6 +192,23 @@ class FileCache(Generic[T]):
         """
         shutil.rmtree(self.path)
 
+    def get_entries(self) -> list[CacheEntry]:
+        """
+        Return all items of the cache as evictable entries.
+        """
+        entries = []
+        for root, _, files in os.walk(self.path):
+            for name in files:
+                path = Path(root, name)
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+
+                entries.append(CacheEntry((path,), stat.st_size, stat.st_mtime))
+
+        return entries
+
     def remember(
         self, key: str, callback: T | Callable[[], T], minutes: int | None = None
     ) -> T:
@@ -151,7 +228,9 @@ class FileCache(Generic[T]):
     def _get_payload(self, key: str) -> T | None:
         path = self._path(key)
 
-        if not path.exists():
+        try:
+            last_used = path.stat().st_mtime
+        except FileNotFoundError:
             return None
 
         with path.open("rb") as f:
@@ -167,8 +246,14 @@ class FileCache(Generic[T]):
         if payload.expired:
             self.forget(key)
             return None
-        else:
-            return payload.data
+
+        if last_used < time.time() - LAST_USED_RESOLUTION:
+            # The modification time tracks the last use of the item,
+            # so that the least recently used items can be evicted.
+            with contextlib.suppress(OSError):
+                os.utime(path)
+
+        return payload.data
 
     def _path(self, key: str) -> Path:
         hash_type, parts_count = _HASHES[self.hash_type]
@@ -194,6 +279,10 @@ class ArtifactCache:
         self._archive_locks: defaultdict[Path, threading.Lock] = defaultdict(
             threading.Lock
         )
+        self._index_locks: defaultdict[Path, threading.Lock] = defaultdict(
+            threading.Lock
+        )
+        self._indexes: dict[Path, dict[str, Any]] = {}
 
     def get_cache_directory_for_link(self, link: Link) -> Path:
         key_parts = {"url": link.url_without_fragment}
@@ -225,6 +314,17 @@ class ArtifactCache:
 
         return self._get_directory_from_hash(key_parts)
 
+    def get_cache_directory_for_directory(self, directory: Path) -> Path | None:
+        """
+        Return the cache directory for archives built from the content
+        of a directory or None if its content cannot be determined.
+        """
+        fingerprint = get_directory_fingerprint(directory)
+        if fingerprint is None:
+            return None
+
+        return self._get_directory_from_hash({"directory": fingerprint})
+
     @overload
     def get_cached_archive_for_link(
         self,
@@ -281,6 +381,15 @@ class ArtifactCache:
 
         return self._get_cached_archive(cache_dir, strict=False, env=env)
 
+    def get_cached_archive_for_directory(
+        self, directory: Path, env: Env
+    ) -> Path | None:
+        cache_dir = self.get_cache_directory_for_directory(directory)
+        if cache_dir is None:
+            return None
+
+        return self._get_cached_archive(cache_dir, strict=False, env=env)
+
     def _get_cached_archive(
         self,
         cache_dir: Path,
@@ -305,6 +414,7 @@ class ArtifactCache:
                 # in strict mode return the original cached archive instead of the
                 # prioritized archive type.
                 if filename == archive.name:
+                    self._mark_used(cache_dir)
                     return archive
                 continue
 
@@ -314,27 +424,328 @@ class ArtifactCache:
                 candidates.append((float("inf"), archive))
                 continue
 
-            try:
-                wheel = Wheel(archive.name)
-            except InvalidWheelNameError:
+            tags = self._get_wheel_tags(archive)
+            indexes = [
+                index for index, tag in enumerate(env.supported_tags) if tag in tags
+            ]
+            if not indexes:
                 continue
 
-            if not wheel.is_supported_by_environment(env):
+            candidates.append((min(indexes), archive))
+
+        if not candidates:
+            return None
+
+        self._mark_used(cache_dir)
+        return min(candidates)[1]
+
+    def get_entries(self) -> list[CacheEntry]:
+        """
+        Return the directories of the cache, along with their indexes,
+        as evictable entries.
+        """
+        entries = []
+        for cache_dir in self._cache_dir.glob("*/*/*/*"):
+            index = self._get_index(cache_dir) if cache_dir.is_dir() else None
+            if index is None:
                 continue
 
-            candidates.append(
-                (wheel.get_minimum_supported_index(env.supported_tags), archive),
+            with self._index_locks[cache_dir]:
+                size = sum(entry["stat"][0] for entry in index["archives"].values())
+
+            entries.append(
+                CacheEntry(
+                    (cache_dir, self._get_index_path(cache_dir)),
+                    size,
+                    index.get("used", index["mtime"] / 1e9),
+                )
             )
 
-        if not candidates:
+        return entries
+
+    def _mark_used(self, cache_dir: Path) -> None:
+        index = self._get_index(cache_dir)
+        if index is None:
+            return
+
+        now = time.time()
+        if index.get("used", 0) < now - LAST_USED_RESOLUTION:
+            with self._index_locks[cache_dir]:
+                index["used"] = now
+                self._write_index(cache_dir, index)
+
+    def get_archive_hash(self, archive: Path, hash_name: str) -> str | None:
+        """
+        Return the recorded hash of a cached archive,
+        unless the archive has been modified since it has been recorded.
+        """
+        index = self._get_index(archive.parent)
+        if index is None:
             return None
 
-        return min(candidates)[1]
+        entry = index["archives"].get(archive.name)
+        if entry is None or entry["stat"] != self._get_stat(archive):
+            return None
+
+        hash_value: str | None = entry["hashes"].get(hash_name)
+        return hash_value
+
+    def record_archive_hash(self, archive: Path, hash_name: str, value: str) -> None:
+        """
+        Record the hash of a cached archive, so that it does not have to be
+        computed again. Archives outside of the cache are ignored.
+        """
+        cache_dir = archive.parent
+        index = self._get_index(cache_dir)
+        if index is None:
+            return
+
+        with self._index_locks[cache_dir]:
+            stat = self._get_stat(archive)
+            entry = index["archives"].get(archive.name)
+            if entry is None or entry["stat"] != stat:
+                entry = index["archives"][archive.name] = self._create_index_entry(
+                    archive
+                )
+            entry["hashes"][hash_name] = value
+            self._write_index(cache_dir, index)
+
+    def _get_wheel_tags(self, archive: Path) -> set[Tag]:
+        index = self._get_index(archive.parent)
+        if index is not None and archive.name in index["archives"]:
+            return {
+                Tag(*tag.split("-")) for tag in index["archives"][archive.name]["tags"]
+            }
+
+        try:
+            return Wheel(archive.name).tags
+        except InvalidWheelNameError:
+            return set()
 
     def _get_cached_archives(self, cache_dir: Path) -> list[Path]:
+        index = self._get_index(cache_dir)
+        if index is None:
+            return self._find_archives(cache_dir)
+
+        # The index may be updated concurrently, e.g. when a hash is recorded.
+        with self._index_locks[cache_dir]:
+            names = list(index["archives"])
+
+        return [cache_dir / name for name in names]
+
+    @staticmethod
+    def _find_archives(cache_dir: Path) -> list[Path]:
         archive_types = ["whl", "tar.gz", "tar.bz2", "bz2", "zip"]
         paths: list[Path] = []
         for archive_type in archive_types:
             paths += cache_dir.glob(f"*.{archive_type}")
 
         return paths
+
+    def _get_index(self, cache_dir: Path) -> dict[str, Any] | None:
+        """
+        Return the index of the archives in a cache directory.
+
+        The index records the name, size, tags and known hashes of each archive.
+        It is valid as long as the modification time of the directory does not
+        change, i.e. as long as no archive is added or removed.
+        Directories outside of the cache and missing directories are not indexed.
+        """
+        if (
+            not cache_dir.is_relative_to(self._cache_dir)
+            or cache_dir == self._cache_dir
+        ):
+            return None
+
+        try:
+            mtime = cache_dir.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+        with self._index_locks[cache_dir]:
+            index = self._indexes.get(cache_dir)
+            if index is None or index.get("mtime") != mtime:
+                index = self._read_index(cache_dir)
+
+            if index is None or index.get("mtime") != mtime:
+                previous = index["archives"] if index is not None else {}
+                archives = {}
+                for archive in self._find_archives(cache_dir):
+                    entry = self._create_index_entry(archive)
+                    if (
+                        archive.name in previous
+                        and previous[archive.name]["stat"] == entry["stat"]
+                    ):
+                        entry["hashes"] = previous[archive.name]["hashes"]
+                    archives[archive.name] = entry
+
+                index = {"mtime": mtime, "archives": archives}
+                self._write_index(cache_dir, index)
+
+            self._indexes[cache_dir] = index
+
+        return index
+
+    def _create_index_entry(self, archive: Path) -> dict[str, Any]:
+        tags: list[str] = []
+        if archive.suffix == ".whl":
+            with contextlib.suppress(InvalidWheelNameError):
+                tags = sorted(str(tag) for tag in Wheel(archive.name).tags)
+
+        return {"stat": self._get_stat(archive), "tags": tags, "hashes": {}}
+
+    @staticmethod
+    def _get_stat(archive: Path) -> list[int]:
+        stat = archive.stat()
+        return [stat.st_size, stat.st_mtime_ns]
+
+    @staticmethod
+    def _get_index_path(cache_dir: Path) -> Path:
+        # The index is stored next to the directory, so that writing it
+        # does not change the modification time of the directory.
+        return cache_dir.with_name(f"{cache_dir.name}.json")
+
+    def _read_index(self, cache_dir: Path) -> dict[str, Any] | None:
+        try:
+            index: dict[str, Any] = json.loads(
+                self._get_index_path(cache_dir).read_text(encoding="utf-8")
+            )
+        except (OSError, ValueError):
+            return None
+
+        return index
+
+    def _write_index(self, cache_dir: Path, index: dict[str, Any]) -> None:
+        # Write to a temporary file first, so that concurrent readers
+        # never see a partially written index.
+        path = self._get_index_path(cache_dir)
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}")
+        tmp_path.write_text(json.dumps(index), encoding="utf-8")
+        tmp_path.replace(path)
+
+
+def get_directory_fingerprint(
+    directory: Path, files: Iterable[Path] | None = None
+) -> str | None:
+    """
+    Return a fingerprint of the location of a directory and the content
+    of its files.
+
+    Unless the files are given, the tracked and not ignored files of the
+    Git work tree the directory is in are considered, since other files
+    (e.g. build artifacts) do not identify the content. If the directory is
+    not in a work tree, is ignored or is empty, None is returned.
+    """
+    from poetry.vcs.git import Git
+
+    if files is None:
+        files = Git.get_source_files(directory)
+        if files is None:
+            return None
+
+    # Distributions built from a directory (e.g. with relative path
+    # dependencies) might depend on its location.
+    directory = directory.resolve()
+    fingerprint = hashlib.sha256(f"{directory.as_posix()}\n".encode())
+    for file in files:
+        try:
+            content = file.read_bytes()
+        except OSError:
+            continue
+
+        name = file.relative_to(directory).as_posix()
+        fingerprint.update(f"{name}:{len(content)}:".encode())
+        fingerprint.update(content)
+
+    return fingerprint.hexdigest()
+
+
+def prune_cache_entries(
+    entries: Iterable[CacheEntry],
+    *,
+    max_size: int | None = None,
+    max_age: float | None = None,
+) -> list[CacheEntry]:
+    """
+    Remove entries that have not been used for more than `max_age` seconds
+    and the least recently used entries until the total size of the entries
+    does not exceed `max_size` bytes. Entries that are in use are skipped.
+
+    :returns: The removed entries.
+    """
+    sorted_entries = sorted(entries, key=lambda entry: entry.last_used)
+    total_size = sum(entry.size for entry in sorted_entries)
+    now = time.time()
+    removed = []
+    for entry in sorted_entries:
+        if not (
+            (max_age is not None and entry.last_used < now - max_age)
+            or (max_size is not None and total_size > max_size)
+        ):
+            break
+
+        if not entry.remove():
+            continue
+
+        total_size -= entry.size
+        removed.append(entry)
+
+    return removed
+
+
+def prune_caches(
+    config: Config, *, max_size: int | None = None, max_age: int | None = None
+) -> list[CacheEntry]:
+    """
+    Enforce a size limit (in megabytes) and an age limit (in days)
+    on the repository, package information, artifact, build environment,
+    unpacked wheel and Git mirror caches.
+    Limits that are not passed are taken from the configuration.
+
+    :returns: The removed entries.
+    """
+    if max_size is None:
+        max_size = config.get("cache.max-size")
+    if max_age is None:
+        max_age = config.get("cache.max-age")
+    if max_size is None and max_age is None:
+        return []
+
+    from filelock import FileLock
+    from filelock import Timeout
+
+    from poetry.installation.wheel_installer import UnpackedWheelFile
+    from poetry.utils.isolated_build import BuildEnvironmentCache
+    from poetry.vcs.git import Git
+
+    # Only one process prunes the caches at a time,
+    # others do not wait for it but skip pruning.
+    cache_dir = Path(config.get("cache-dir")).expanduser()
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    try:
+        lock = FileLock(cache_dir / ".prune.lock", timeout=0).acquire()
+    except Timeout:
+        return []
+
+    with lock:
+        entries = ArtifactCache(
+            cache_dir=config.artifacts_cache_directory
+        ).get_entries()
+        if config.repository_cache_directory.exists():
+            for path in config.repository_cache_directory.iterdir():
+                if path.is_dir():
+                    entries += FileCache(path).get_entries()
+        entries += FileCache(config.package_info_cache_directory).get_entries()
+        entries += BuildEnvironmentCache(
+            config.build_environments_cache_directory
+        ).get_entries()
+        entries += UnpackedWheelFile.get_store_entries(
+            config.unpacked_wheels_cache_directory
+        )
+        entries += Git.get_mirror_entries(cache_dir / "git-mirrors")
+
+        return prune_cache_entries(
+            entries,
+            max_size=max_size * 1024**2 if max_size is not None else None,
+            max_age=max_age * 24 * 60 * 60 if max_age is not None else None,
+        )
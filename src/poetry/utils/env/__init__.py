@@ -20,6 +20,7 @@ from poetry.utils.env.null_env import NullEnv
 from poetry.utils.env.script_strings import GET_BASE_PREFIX
 from poetry.utils.env.script_strings import GET_ENV_PATH_ONELINER
 from poetry.utils.env.script_strings import GET_ENVIRONMENT_INFO
+from poetry.utils.env.script_strings import GET_ENVIRONMENT_SNAPSHOT
 from poetry.utils.env.script_strings import GET_PATHS
 from poetry.utils.env.script_strings import GET_PATHS_FOR_GENERIC_ENVS
 from poetry.utils.env.script_strings import GET_PYTHON_VERSION_ONELINER
@@ -82,7 +83,7 @@ def build_environment(
 
             from poetry.utils.isolated_build import IsolatedEnv
 
-            isolated_env = IsolatedEnv(venv, poetry.pool)
+            isolated_env = IsolatedEnv(venv, poetry.pool, poetry.config)
             isolated_env.install(poetry.pyproject.build_system.requires)
 
             yield venv
@@ -93,6 +94,7 @@ def build_environment(
 __all__ = [
     "GET_BASE_PREFIX",
     "GET_ENVIRONMENT_INFO",
+    "GET_ENVIRONMENT_SNAPSHOT",
     "GET_PATHS",
     "GET_SYS_PATH",
     "GET_ENV_PATH_ONELINER",
@@ -77,6 +77,11 @@ class GenericEnv(VirtualEnv):
             if pip_executable:
                 self._pip_executable = pip_executable
 
+    def _get_snapshot_path(self) -> Path | None:
+        # The snapshot of a base interpreter is only kept in memory
+        # since its prefix does not belong to Poetry.
+        return None
+
     def get_paths(self) -> dict[str, str]:
         output = self.run_python_script(GET_PATHS_FOR_GENERIC_ENVS)
 
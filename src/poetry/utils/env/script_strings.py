@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 
-GET_ENVIRONMENT_INFO = """\
+_ENVIRONMENT_INFO = """\
 import json
 import os
 import platform
@@ -62,9 +62,32 @@ env = {
     ),
     "interpreter_version": interpreter_version(),
 }
+"""
+
+GET_ENVIRONMENT_INFO = _ENVIRONMENT_INFO + "\nprint(json.dumps(env))\n"
 
-print(json.dumps(env))
+GET_ENVIRONMENT_SNAPSHOT = (
+    _ENVIRONMENT_INFO
+    + """
+if hasattr(sys, "real_prefix"):
+    base_prefix = sys.real_prefix
+elif hasattr(sys, "base_prefix"):
+    base_prefix = sys.base_prefix
+else:
+    base_prefix = sys.prefix
+
+print(
+    json.dumps(
+        {
+            "base_prefix": base_prefix,
+            "marker_env": env,
+            "paths": sysconfig.get_paths(),
+            "sys_path": sys.path,
+        }
+    )
+)
 """
+)
 
 GET_BASE_PREFIX = """\
 import sys
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import contextlib
 import json
 import os
 import re
+import threading
 
 from contextlib import contextmanager
 from copy import deepcopy
@@ -10,12 +12,10 @@ from functools import cached_property
 from pathlib import Path
 from typing import TYPE_CHECKING
 from typing import Any
+from typing import ClassVar
 
 from poetry.utils.env.base_env import Env
-from poetry.utils.env.script_strings import GET_BASE_PREFIX
-from poetry.utils.env.script_strings import GET_ENVIRONMENT_INFO
-from poetry.utils.env.script_strings import GET_PATHS
-from poetry.utils.env.script_strings import GET_SYS_PATH
+from poetry.utils.env.script_strings import GET_ENVIRONMENT_SNAPSHOT
 
 
 if TYPE_CHECKING:
@@ -29,23 +29,112 @@ class VirtualEnv(Env):
     A virtual Python environment.
     """
 
+    SNAPSHOT_FILE: ClassVar[str] = ".poetry-snapshot.json"
+
     def __init__(self, path: Path, base: Path | None = None) -> None:
         super().__init__(path, base)
 
+        self._snapshot: dict[str, Any] | None = None
+
         # If base is None, it probably means this is
         # a virtualenv created from VIRTUAL_ENV.
         # In this case we need to get sys.base_prefix
         # from inside the virtualenv.
         if base is None:
-            output = self.run_python_script(GET_BASE_PREFIX)
-            self._base = Path(output.strip())
+            self._base = Path(self.get_snapshot()["base_prefix"])
 
     @property
     def sys_path(self) -> list[str]:
-        output = self.run_python_script(GET_SYS_PATH)
-        paths: list[str] = json.loads(output)
+        paths: list[str] = list(self.get_snapshot()["sys_path"])
         return paths
 
+    def get_snapshot(self) -> dict[str, Any]:
+        """
+        Return the base prefix, marker environment, paths and sys.path
+        of the environment.
+
+        They are retrieved with a single run of the interpreter and cached
+        on disk until the interpreter or the site-packages directories change.
+        """
+        key = self._get_snapshot_key()
+        if self._snapshot is not None and self._is_snapshot_valid(self._snapshot, key):
+            return self._snapshot
+
+        snapshot = self._read_snapshot(key)
+        if snapshot is None:
+            snapshot = json.loads(self.run_python_script(GET_ENVIRONMENT_SNAPSHOT))
+            snapshot["key"] = key
+            snapshot["site"] = self._get_site_mtimes(snapshot["paths"])
+            self._write_snapshot(snapshot)
+
+        self._snapshot = snapshot
+        return snapshot
+
+    def _get_snapshot_path(self) -> Path | None:
+        return self._path / self.SNAPSHOT_FILE
+
+    def _get_snapshot_key(self) -> list[Any] | None:
+        python = self.python
+        try:
+            stat = python.stat()
+        except OSError:
+            return None
+
+        return [str(python), stat.st_mtime_ns, stat.st_ino]
+
+    @staticmethod
+    def _get_site_mtimes(paths: dict[str, str]) -> dict[str, int | None]:
+        # Installing or removing distributions changes the mtime of the
+        # site-packages directories and might change sys.path (.pth files).
+        mtimes: dict[str, int | None] = {}
+        for name in ("purelib", "platlib"):
+            if name not in paths:
+                continue
+
+            try:
+                mtimes[name] = os.stat(paths[name]).st_mtime_ns
+            except OSError:
+                mtimes[name] = None
+
+        return mtimes
+
+    def _is_snapshot_valid(
+        self, snapshot: dict[str, Any], key: list[Any] | None
+    ) -> bool:
+        return snapshot.get("key") == key and snapshot.get(
+            "site"
+        ) == self._get_site_mtimes(snapshot.get("paths", {}))
+
+    def _read_snapshot(self, key: list[Any] | None) -> dict[str, Any] | None:
+        path = self._get_snapshot_path()
+        if key is None or path is None:
+            return None
+
+        try:
+            snapshot = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+        if not isinstance(snapshot, dict) or not self._is_snapshot_valid(snapshot, key):
+            return None
+
+        return snapshot
+
+    def _write_snapshot(self, snapshot: dict[str, Any]) -> None:
+        path = self._get_snapshot_path()
+        if snapshot["key"] is None or path is None:
+            return
+
+        # The environment might not be writable, in which case
+        # the snapshot is only kept in memory.
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}")
+        try:
+            tmp_path.write_text(json.dumps(snapshot), encoding="utf-8")
+            tmp_path.replace(path)
+        except OSError:
+            with contextlib.suppress(OSError):
+                tmp_path.unlink(missing_ok=True)
+
     def get_supported_tags(self) -> list[Tag]:
         from packaging.tags import compatible_tags
         from packaging.tags import cpython_tags
@@ -68,14 +157,11 @@ class VirtualEnv(Env):
         ]
 
     def get_marker_env(self) -> dict[str, Any]:
-        output = self.run_python_script(GET_ENVIRONMENT_INFO)
-
-        env: dict[str, Any] = json.loads(output)
+        env: dict[str, Any] = deepcopy(self.get_snapshot()["marker_env"])
         return env
 
     def get_paths(self) -> dict[str, str]:
-        output = self.run_python_script(GET_PATHS)
-        paths: dict[str, str] = json.loads(output)
+        paths: dict[str, str] = dict(self.get_snapshot()["paths"])
         return paths
 
     def is_venv(self) -> bool:
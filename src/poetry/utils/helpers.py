@@ -9,15 +9,20 @@ import stat
 import sys
 import tarfile
 import tempfile
+import threading
 import zipfile
 
 from collections.abc import Mapping
 from contextlib import contextmanager
 from contextlib import suppress
 from functools import cached_property
+from functools import lru_cache
+from functools import wraps
 from pathlib import Path
 from typing import TYPE_CHECKING
 from typing import Any
+from typing import ClassVar
+from typing import TypeVar
 from typing import overload
 
 from requests.exceptions import ChunkedEncodingError
@@ -41,6 +46,9 @@ if TYPE_CHECKING:
     from poetry.utils.authenticator import Authenticator
 
 logger = logging.getLogger(__name__)
+T = TypeVar("T")
+
+SYNCHRONIZED_CACHE_LOCKS = 64
 prioritised_hash_types: tuple[str, ...] = tuple(
     t
     for t in [
@@ -167,17 +175,22 @@ def download_file(
 
 
 class Downloader:
+    MIN_CHUNK_SIZE: ClassVar[int] = 4 * 1024
+    MAX_CHUNK_SIZE: ClassVar[int] = 1024 * 1024
+
     def __init__(
         self,
         url: str,
         dest: Path,
         session: Authenticator | Session | None = None,
         max_retries: int = 0,
+        hash_name: str | None = None,
     ):
         self._dest = dest
         self._max_retries = max_retries
         self._session = session or get_default_authenticator()
         self._url = url
+        self._hash = hashlib.new(hash_name) if hash_name else None
         self._response = self._get()
 
     @cached_property
@@ -192,6 +205,24 @@ class Downloader:
                 total_size = int(self._response.headers["Content-Length"])
         return total_size
 
+    @cached_property
+    def chunk_size(self) -> int:
+        """
+        A chunk size that scales with the size of the download,
+        so that big files are not downloaded in tiny chunks.
+        """
+        return max(
+            self.MIN_CHUNK_SIZE, min(self.total_size // 100, self.MAX_CHUNK_SIZE)
+        )
+
+    @property
+    def hash(self) -> str | None:
+        """
+        The hex digest of the content downloaded so far,
+        if a hash name has been passed.
+        """
+        return self._hash.hexdigest() if self._hash is not None else None
+
     def _get(self, start: int = 0) -> Response:
         headers = {"Accept-Encoding": "Identity"}
         if start > 0:
@@ -232,10 +263,34 @@ class Downloader:
             for chunk in self._iter_content_with_resume(chunk_size=chunk_size):
                 if chunk:
                     f.write(chunk)
+                    if self._hash is not None:
+                        self._hash.update(chunk)
                     fetched_size += len(chunk)
                     yield fetched_size
 
 
+def synchronized_lru_cache(
+    func: Callable[..., T], maxsize: int | None = 128
+) -> Callable[..., T]:
+    """
+    Cache the results of a function that is called from several threads.
+
+    Concurrent calls with the same arguments wait for each other, so that
+    the function is only called once for them. The arguments are mapped
+    to a fixed number of locks, so that calls with other arguments
+    are usually not blocked.
+    """
+    cached = lru_cache(maxsize=maxsize)(func)
+    locks = [threading.Lock() for _ in range(SYNCHRONIZED_CACHE_LOCKS)]
+
+    @wraps(func)
+    def wrapper(*args: Any) -> T:
+        with locks[hash(args) % SYNCHRONIZED_CACHE_LOCKS]:
+            return cached(*args)
+
+    return wrapper
+
+
 def get_package_version_display_string(
     package: Package, root: Path | None = None
 ) -> str:
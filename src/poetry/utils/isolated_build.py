@@ -1,20 +1,30 @@
 from __future__ import annotations
 
+import contextlib
+import hashlib
+import itertools
+import json
 import os
+import shutil
 import subprocess
+import time
+import uuid
 
 from contextlib import contextmanager
 from contextlib import redirect_stdout
 from io import StringIO
 from typing import TYPE_CHECKING
+from typing import Any
+from typing import ClassVar
 
 from build import BuildBackendException
 from build.env import IsolatedEnv as BaseIsolatedEnv
 
 from poetry.utils._compat import decode
+from poetry.utils.cache import CacheEntry
 from poetry.utils.env import Env
 from poetry.utils.env import EnvManager
-from poetry.utils.env import ephemeral_environment
+from poetry.utils.env import VirtualEnv
 
 
 if TYPE_CHECKING:
@@ -25,6 +35,7 @@ if TYPE_CHECKING:
     from build import DistributionType
     from build import ProjectBuilder
 
+    from poetry.config.config import Config
     from poetry.repositories import RepositoryPool
 
 
@@ -92,9 +103,16 @@ class IsolatedBuildInstallError(IsolatedBuildBaseError):
 
 
 class IsolatedEnv(BaseIsolatedEnv):
-    def __init__(self, env: Env, pool: RepositoryPool) -> None:
+    def __init__(
+        self, env: Env, pool: RepositoryPool, config: Config | None = None
+    ) -> None:
         self._env = env
         self._pool = pool
+        self._config = config
+
+    @property
+    def path(self) -> Path:
+        return self._env.path
 
     @property
     def python_executable(self) -> str:
@@ -111,7 +129,13 @@ class IsolatedEnv(BaseIsolatedEnv):
             )
         }
 
-    def install(self, requirements: Collection[str]) -> None:
+    def install(
+        self, requirements: Collection[str], *, synchronize: bool = False
+    ) -> None:
+        """
+        Install requirements into the environment. If synchronize is set,
+        packages that are not required any longer are removed.
+        """
         from cleo.io.buffered_io import BufferedIO
         from poetry.core.packages.dependency import Dependency
         from poetry.core.packages.project_package import ProjectPackage
@@ -137,10 +161,11 @@ class IsolatedEnv(BaseIsolatedEnv):
             package,
             Locker(self._env.path.joinpath("poetry.lock"), {}),
             self._pool,
-            Config.create(),
+            self._config or Config.create(),
             InstalledRepository.load(self._env),
         )
         installer.update(True)
+        installer.requires_synchronization(synchronize)
 
         if installer.run() != 0:
             raise IsolatedBuildInstallError(
@@ -148,16 +173,226 @@ class IsolatedEnv(BaseIsolatedEnv):
             )
 
 
+class BuildEnvironmentCache:
+    """
+    Build environments that are reused by all builds with the same build
+    requirements and the same interpreter, even across processes.
+
+    An environment is used by one build at a time, which is guarded by a file
+    lock. Builds that run at the same time use environments in further slots
+    of the same key. The environment a build uses is synchronized with the
+    additional requirements of the build, so that it never sees requirements
+    of other builds. The index of a slot only points to an environment
+    once it is complete. The least recently used environments that are not
+    in use are removed as soon as there are more than MAX_ENVIRONMENTS,
+    environments are recreated after MAX_AGE seconds to pick up new releases
+    of the build requirements.
+    """
+
+    MAX_ENVIRONMENTS: ClassVar[int] = 10
+    MAX_AGE: ClassVar[int] = 7 * 24 * 60 * 60
+    INDEX_FILE: ClassVar[str] = "index.json"
+
+    def __init__(self, cache_dir: Path) -> None:
+        self._cache_dir = cache_dir
+
+    @contextmanager
+    def use(
+        self,
+        python_executable: Path,
+        requirements: Collection[str],
+        pool: RepositoryPool,
+        config: Config | None = None,
+    ) -> Iterator[IsolatedEnv]:
+        """
+        Provide an environment with the given requirements installed,
+        which is created if it does not exist yet.
+
+        The environment is used exclusively until the context is left.
+        """
+        from filelock import FileLock
+        from filelock import Timeout
+
+        key_dir = self._cache_dir / self._get_key(python_executable, requirements)
+        key_dir.mkdir(parents=True, exist_ok=True)
+        for slot in itertools.count():
+            slot_dir = key_dir / str(slot)
+            try:
+                lock = FileLock(self._get_lock_path(slot_dir), timeout=0).acquire()
+            except Timeout:
+                continue
+
+            break
+
+        created = False
+        with lock:
+            slot_dir.mkdir(exist_ok=True)
+            index = self._read_index(slot_dir)
+            if index is not None and time.time() - index["created"] < self.MAX_AGE:
+                env_dir = slot_dir / index["env"]
+                # The last use of an environment is tracked by its index.
+                with contextlib.suppress(OSError):
+                    os.utime(slot_dir / self.INDEX_FILE)
+            else:
+                env_dir = self._create(
+                    slot_dir, python_executable, requirements, pool, config
+                )
+                created = True
+
+            # Remove what is left of environments that have been replaced
+            # or could not be completed.
+            for path in slot_dir.iterdir():
+                if path.is_dir() and path != env_dir:
+                    shutil.rmtree(path, ignore_errors=True)
+
+            yield IsolatedEnv(VirtualEnv(env_dir, env_dir), pool, config)
+
+        if created:
+            self.prune()
+
+    def install(self, env: IsolatedEnv, requirements: Collection[str]) -> None:
+        """
+        Synchronize an environment that is in use with the additional
+        requirements of a build.
+
+        The requirements of the environment are kept, packages that have been
+        installed for additional requirements of previous builds are removed.
+        If the environment already has exactly these requirements,
+        nothing is installed.
+        """
+        slot_dir = env.path.parent
+        index = self._read_index(slot_dir)
+        assert index is not None
+        requirements = sorted(set(index["requirements"]) | set(requirements))
+        if requirements == index["installed"]:
+            return
+
+        # The environment is in an unknown state until it has been synchronized.
+        index["installed"] = None
+        self._write_index(slot_dir, index)
+
+        env.install(requirements, synchronize=True)
+
+        index["installed"] = requirements
+        self._write_index(slot_dir, index)
+
+    def get_entries(self) -> list[CacheEntry]:
+        """
+        Return the environments of all slots as evictable entries.
+        """
+        entries: list[CacheEntry] = []
+        for slot_dir in self._cache_dir.glob("*/*"):
+            if not slot_dir.is_dir():
+                continue
+
+            index = self._read_index(slot_dir)
+            # Slots without an environment are only evicted because of their age.
+            path = slot_dir / self.INDEX_FILE if index is not None else slot_dir
+            try:
+                last_used = path.stat().st_mtime
+            except OSError:
+                continue
+
+            entries.append(
+                CacheEntry(
+                    (slot_dir,),
+                    index["size"] if index is not None else 0,
+                    last_used,
+                    lock=self._get_lock_path(slot_dir),
+                )
+            )
+
+        return entries
+
+    def prune(self) -> None:
+        """
+        Remove the least recently used environments that are not in use.
+        """
+        entries = sorted(
+            self.get_entries(), key=lambda entry: entry.last_used, reverse=True
+        )
+        for entry in entries[self.MAX_ENVIRONMENTS :]:
+            entry.remove()
+
+    def _create(
+        self,
+        slot_dir: Path,
+        python_executable: Path,
+        requirements: Collection[str],
+        pool: RepositoryPool,
+        config: Config | None,
+    ) -> Path:
+        env_dir = slot_dir / uuid.uuid4().hex
+        EnvManager.build_venv(
+            path=env_dir, executable=python_executable, flags={"no-pip": True}
+        )
+        env = IsolatedEnv(VirtualEnv(env_dir, env_dir), pool, config)
+
+        try:
+            env.install(requirements)
+        except BaseException:
+            shutil.rmtree(env_dir, ignore_errors=True)
+            raise
+
+        index = {
+            "env": env_dir.name,
+            "created": time.time(),
+            "python": str(python_executable),
+            "requirements": sorted(requirements),
+            "installed": sorted(requirements),
+            "size": sum(
+                path.stat().st_size for path in env_dir.rglob("*") if path.is_file()
+            ),
+        }
+        self._write_index(slot_dir, index)
+
+        return env_dir
+
+    def _read_index(self, slot_dir: Path) -> dict[str, Any] | None:
+        try:
+            index: dict[str, Any] = json.loads(
+                (slot_dir / self.INDEX_FILE).read_text(encoding="utf-8")
+            )
+        except (OSError, ValueError):
+            return None
+
+        return index
+
+    def _write_index(self, slot_dir: Path, index: dict[str, Any]) -> None:
+        index_path = slot_dir / self.INDEX_FILE
+        tmp_path = index_path.with_name(f"{index_path.name}.{uuid.uuid4().hex}")
+        tmp_path.write_text(json.dumps(index), encoding="utf-8")
+        tmp_path.replace(index_path)
+
+    @staticmethod
+    def _get_lock_path(slot_dir: Path) -> Path:
+        # The lock is kept next to the slot, so that it outlives its removal.
+        return slot_dir.with_name(f"{slot_dir.name}.lock")
+
+    @staticmethod
+    def _get_key(python_executable: Path, requirements: Collection[str]) -> str:
+        # The mtime of the interpreter changes if it is upgraded in place.
+        try:
+            mtime = python_executable.stat().st_mtime_ns
+        except OSError:
+            mtime = None
+
+        key = json.dumps([str(python_executable), mtime, sorted(requirements)])
+        return hashlib.sha256(key.encode()).hexdigest()
+
+
 @contextmanager
 def isolated_builder(
     source: Path,
     distribution: DistributionType = "wheel",
     python_executable: Path | None = None,
     pool: RepositoryPool | None = None,
+    config: Config | None = None,
 ) -> Iterator[ProjectBuilder]:
     from build import ProjectBuilder
     from pyproject_hooks import quiet_subprocess_runner
 
+    from poetry.config.config import Config
     from poetry.factory import Factory
 
     try:
@@ -177,26 +412,21 @@ def isolated_builder(
         python_executable or EnvManager.get_system_env(naive=True).python
     )
 
-    with ephemeral_environment(
-        executable=python_executable,
-        flags={"no-pip": True},
-    ) as venv:
-        env = IsolatedEnv(venv, pool)
-        stdout = StringIO()
-        try:
+    config = config or Config.create()
+    cache = BuildEnvironmentCache(config.build_environments_cache_directory)
+    stdout = StringIO()
+    try:
+        requirements = ProjectBuilder(source).build_system_requires
+
+        with (
+            redirect_stdout(stdout),
+            cache.use(python_executable, requirements, pool, config) as env,
+        ):
             builder = ProjectBuilder.from_isolated_env(
                 env, source, runner=quiet_subprocess_runner
             )
+            cache.install(env, builder.get_requires_for_build(distribution))
 
-            with redirect_stdout(stdout):
-                env.install(builder.build_system_requires)
-
-                # we repeat the build system requirements to avoid poetry installer from removing them
-                env.install(
-                    builder.build_system_requires
-                    | builder.get_requires_for_build(distribution)
-                )
-
-                yield builder
-        except BuildBackendException as e:
-            raise IsolatedBuildBackendError(source, e) from None
+            yield builder
+    except BuildBackendException as e:
+        raise IsolatedBuildBackendError(source, e) from None
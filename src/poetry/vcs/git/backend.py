@@ -1,33 +1,50 @@
 from __future__ import annotations
 
 import dataclasses
+import hashlib
+import json
 import logging
+import os
 import re
-
+import threading
+import time
+
+from collections import defaultdict
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
+from contextlib import contextmanager
 from pathlib import Path
 from subprocess import CalledProcessError
 from typing import TYPE_CHECKING
+from typing import ClassVar
 from urllib.parse import urljoin
 from urllib.parse import urlparse
 from urllib.parse import urlunparse
 
 from dulwich import porcelain
+from dulwich.client import FetchPackResult
 from dulwich.client import HTTPUnauthorized
 from dulwich.client import get_transport_and_path
 from dulwich.config import ConfigFile
 from dulwich.config import parse_submodules
 from dulwich.errors import NotGitRepository
+from dulwich.ignore import IgnoreFilterManager
 from dulwich.index import IndexEntry
 from dulwich.refs import ANNOTATED_TAG_SUFFIX
 from dulwich.repo import Repo
+from filelock import FileLock
 
 from poetry.console.exceptions import PoetryConsoleError
 from poetry.utils.authenticator import get_default_authenticator
+from poetry.utils.cache import CacheEntry
 from poetry.utils.helpers import remove_directory
 
 
 if TYPE_CHECKING:
-    from dulwich.client import FetchPackResult
+    from collections.abc import Iterator
+    from collections.abc import Mapping
+
     from dulwich.client import GitClient
 
 
@@ -147,6 +164,10 @@ class GitRefSpec:
     def is_sha_short(self) -> bool:
         return self.revision is not None and self.is_sha and len(self.revision) < 40
 
+    @property
+    def is_sha_full(self) -> bool:
+        return self.revision is not None and self.is_sha and len(self.revision) == 40
+
 
 @dataclasses.dataclass
 class GitRepoLocalInfo:
@@ -161,6 +182,16 @@ class GitRepoLocalInfo:
 
 
 class Git:
+    # Refs of a mirror that have been fetched less than MIRROR_MAX_AGE seconds ago
+    # are used without fetching them again, e.g. when the same repository is
+    # cloned for several packages during a single resolution.
+    MIRROR_MAX_AGE: ClassVar[int] = 60
+    MIRROR_REFS_FILE: ClassVar[str] = "poetry-refs.json"
+
+    _mirror_locks: ClassVar[defaultdict[str, threading.Lock]] = defaultdict(
+        threading.Lock
+    )
+
     @staticmethod
     def as_repo(repo: Path) -> Repo:
         return Repo(str(repo))
@@ -219,6 +250,131 @@ class Git:
             )
             return result
 
+    @classmethod
+    def _get_mirror_path(cls, url: str) -> Path:
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()[:16]
+        return cls.get_mirror_root() / f"{cls.get_name_from_source_url(url)}-{key}.git"
+
+    @classmethod
+    def _get_mirror(cls, url: str) -> Repo:
+        """
+        Return the bare mirror of a remote repository, which is shared
+        by all clones of the repository.
+        """
+        path = cls._get_mirror_path(url)
+
+        try:
+            return Repo(str(path))
+        except NotGitRepository:
+            path.mkdir(parents=True, exist_ok=True)
+            mirror: Repo = Repo.init_bare(str(path))  # type: ignore[no-untyped-call]
+            return mirror
+
+    @classmethod
+    @contextmanager
+    def _lock_mirror(cls, url: str) -> Iterator[None]:
+        """
+        Lock the mirror of a remote repository against other threads and processes,
+        which fetch into it or prune it.
+        """
+        path = cls._get_mirror_path(url)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        # The lock file is not removed along with the mirror,
+        # since other processes might be waiting for it.
+        with cls._mirror_locks[url], FileLock(cls._get_mirror_lock_path(path)):
+            yield
+
+    @staticmethod
+    def _get_mirror_lock_path(path: Path) -> Path:
+        return path.with_name(f"{path.name}.lock")
+
+    @classmethod
+    def get_mirror_entries(cls, root: Path) -> list[CacheEntry]:
+        """
+        Return the mirrors of remote repositories as evictable entries.
+        """
+        entries = []
+        for path in root.glob("*.git"):
+            if not path.is_dir():
+                continue
+
+            # Mirrors that could not be fetched do not have a refs file.
+            refs_path = path / cls.MIRROR_REFS_FILE
+            try:
+                last_used = (refs_path if refs_path.exists() else path).stat().st_mtime
+            except OSError:
+                continue
+
+            size = sum(
+                file.stat().st_size for file in path.rglob("*") if file.is_file()
+            )
+            entries.append(
+                CacheEntry(
+                    (path,), size, last_used, lock=cls._get_mirror_lock_path(path)
+                )
+            )
+
+        return entries
+
+    @classmethod
+    def _fetch_mirror(
+        cls, url: str, refspec: GitRefSpec
+    ) -> tuple[Repo, FetchPackResult]:
+        """
+        Return the mirror of a remote repository along with the refs of the remote.
+
+        The mirror is only updated if its refs are not fresh enough and it does not
+        contain the requested revision. Only missing objects are fetched.
+        The mirror has to be locked while it is fetched and used.
+        """
+        mirror = cls._get_mirror(url)
+        refs_path = Path(mirror.path) / cls.MIRROR_REFS_FILE
+
+        try:
+            data = json.loads(refs_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            data = None
+
+        if data is not None and (
+            time.time() - data["fetched"] < cls.MIRROR_MAX_AGE
+            or (
+                refspec.is_sha_full
+                and refspec.revision is not None
+                and refspec.revision.encode("utf-8") in mirror.object_store
+            )
+        ):
+            logger.debug("Using refs of <c2>%s</> from mirror", url)
+            # The mtime of the refs file is when the mirror has been used last.
+            os.utime(refs_path)
+            return mirror, FetchPackResult(
+                refs=_decode_refs(data["refs"]),
+                symrefs=_decode_refs(data["symrefs"]),
+                agent=None,
+            )
+
+        remote_refs = cls._fetch_remote_refs(url=url, local=mirror)
+
+        # The refs of the mirror are the haves of the next fetch.
+        refs = mirror.refs.allkeys()  # type: ignore[no-untyped-call]
+        for name in set(refs) - set(remote_refs.refs):
+            if name != b"HEAD":
+                del mirror.refs[name]
+        for name, sha in remote_refs.refs.items():
+            if name != b"HEAD" and not name.endswith(ANNOTATED_TAG_SUFFIX):
+                mirror.refs[name] = sha
+
+        data = {
+            "fetched": time.time(),
+            "refs": _encode_refs(remote_refs.refs),
+            "symrefs": _encode_refs(remote_refs.symrefs),
+        }
+        tmp_path = refs_path.with_name(f"{refs_path.name}.{os.getpid()}")
+        tmp_path.write_text(json.dumps(data), encoding="utf-8")
+        tmp_path.replace(refs_path)
+
+        return mirror, remote_refs
+
     @staticmethod
     def _clone_legacy(url: str, refspec: GitRefSpec, target: Path) -> Repo:
         """
@@ -267,7 +423,23 @@ class Git:
         else:
             local = Repo(str(target))
 
-        remote_refs = cls._fetch_remote_refs(url=url, local=local)
+        with cls._lock_mirror(url):
+            mirror, remote_refs = cls._fetch_mirror(url=url, refspec=refspec)
+
+            # The objects are copied from the mirror, so that the clone
+            # does not depend on it.
+            with mirror, local:
+                wants = set(remote_refs.refs.values())
+                if refspec.is_sha_full and refspec.revision is not None:
+                    revision = refspec.revision.encode("utf-8")
+                    if revision in mirror.object_store:
+                        wants.add(revision)
+
+                wants = {sha for sha in wants if sha not in local.object_store}
+                if wants:
+                    mirror.fetch(  # type: ignore[no-untyped-call]
+                        local, determine_wants=lambda refs, depth=None: list(wants)
+                    )
 
         logger.debug(
             "Cloning <c2>%s</> at '<c2>%s</>' to <c1>%s</>", url, refspec.key, target
@@ -329,20 +501,45 @@ class Git:
     def _clone_submodules(cls, repo: Repo) -> None:
         """
         Helper method to identify configured submodules and clone them recursively.
+
+        Submodules are cloned concurrently, each of them before its own submodules.
         """
-        repo_root = Path(repo.path)
-        for submodule in cls._get_submodules(repo):
-            path_absolute = repo_root / submodule.path
-            source_root = path_absolute.parent
-            source_root.mkdir(parents=True, exist_ok=True)
-            cls.clone(
-                url=submodule.url,
-                source_root=source_root,
-                name=path_absolute.name,
-                revision=submodule.revision,
-                clean=path_absolute.exists()
-                and not path_absolute.joinpath(".git").is_dir(),
-            )
+        from poetry.config.config import Config
+
+        max_workers = Config.create().installer_max_workers
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending = {
+                executor.submit(cls._clone_submodule, repo, submodule)
+                for submodule in cls._get_submodules(repo)
+            }
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    submodule_repo, clone_submodules = future.result()
+                    if clone_submodules:
+                        pending |= {
+                            executor.submit(
+                                cls._clone_submodule, submodule_repo, submodule
+                            )
+                            for submodule in cls._get_submodules(submodule_repo)
+                        }
+
+    @classmethod
+    def _clone_submodule(
+        cls, repo: Repo, submodule: SubmoduleInfo
+    ) -> tuple[Repo, bool]:
+        path_absolute = Path(repo.path) / submodule.path
+        source_root = path_absolute.parent
+        source_root.mkdir(parents=True, exist_ok=True)
+
+        return cls._clone_repository(
+            url=submodule.url,
+            source_root=source_root,
+            name=path_absolute.name,
+            revision=submodule.revision,
+            clean=path_absolute.exists()
+            and not path_absolute.joinpath(".git").is_dir(),
+        )
 
     @classmethod
     def _get_submodules(cls, repo: Repo) -> list[SubmoduleInfo]:
@@ -390,6 +587,56 @@ class Git:
 
         return submodules
 
+    @staticmethod
+    def get_source_files(directory: Path) -> list[Path] | None:
+        """
+        Return the files of a directory in a work tree that are tracked
+        or not ignored, or None if the directory is not in a work tree,
+        is ignored or does not contain any such files.
+        """
+        try:
+            repo = Repo.discover(str(directory))  # type: ignore[no-untyped-call]
+        except NotGitRepository:
+            return None
+
+        with repo:
+            root = Path(repo.path).resolve()
+            directory = directory.resolve()
+            ignore_manager = IgnoreFilterManager.from_repo(repo)
+
+            # The content of an ignored directory is not part of the work tree.
+            parts = directory.relative_to(root).parts
+            for i in range(1, len(parts) + 1):
+                if ignore_manager.is_ignored("/".join(parts[:i]) + "/"):
+                    return None
+
+            files = set()
+
+            # Tracked files are included even if they are ignored.
+            prefix = directory.relative_to(root).as_posix()
+            prefix = "" if prefix == "." else f"{prefix}/"
+            for path in repo.open_index():
+                name = path.decode("utf-8", errors="surrogateescape")
+                if name.startswith(prefix) and (root / name).is_file():
+                    files.add(root / name)
+
+            for dirpath, dirnames, filenames in os.walk(directory):
+                relative = Path(dirpath).relative_to(root).as_posix()
+                relative = "" if relative == "." else f"{relative}/"
+                dirnames[:] = [
+                    name
+                    for name in dirnames
+                    if name != ".git"
+                    and not ignore_manager.is_ignored(f"{relative}{name}/")
+                ]
+                files.update(
+                    Path(dirpath, name)
+                    for name in filenames
+                    if not ignore_manager.is_ignored(f"{relative}{name}")
+                )
+
+        return sorted(files) or None
+
     @staticmethod
     def is_using_legacy_client() -> bool:
         from poetry.config.config import Config
@@ -403,6 +650,12 @@ class Git:
 
         return Path(Config.create().get("cache-dir")) / "src"
 
+    @staticmethod
+    def get_mirror_root() -> Path:
+        from poetry.config.config import Config
+
+        return Path(Config.create().get("cache-dir")) / "git-mirrors"
+
     @classmethod
     def clone(
         cls,
@@ -414,6 +667,35 @@ class Git:
         source_root: Path | None = None,
         clean: bool = False,
     ) -> Repo:
+        repo, clone_submodules = cls._clone_repository(
+            url=url,
+            name=name,
+            branch=branch,
+            tag=tag,
+            revision=revision,
+            source_root=source_root,
+            clean=clean,
+        )
+        if clone_submodules:
+            cls._clone_submodules(repo=repo)
+
+        return repo
+
+    @classmethod
+    def _clone_repository(
+        cls,
+        url: str,
+        name: str | None = None,
+        branch: str | None = None,
+        tag: str | None = None,
+        revision: str | None = None,
+        source_root: Path | None = None,
+        clean: bool = False,
+    ) -> tuple[Repo, bool]:
+        """
+        Clone a repository without its submodules and return it along with
+        whether its submodules still have to be cloned.
+        """
         source_root = source_root or cls.get_default_source_root()
         source_root.mkdir(parents=True, exist_ok=True)
 
@@ -446,13 +728,11 @@ class Git:
                         and current_sha.startswith(refspec.revision)
                     ):
                         # if revision is used short-circuit remote fetch head matches
-                        return current_repo
+                        return current_repo, False
 
         try:
             if not cls.is_using_legacy_client():
-                local = cls._clone(url=url, refspec=refspec, target=target)
-                cls._clone_submodules(repo=local)
-                return local
+                return cls._clone(url=url, refspec=refspec, target=target), True
         except HTTPUnauthorized:
             # we do this here to handle http authenticated repositories as dulwich
             # does not currently support using credentials from git-credential helpers.
@@ -467,8 +747,22 @@ class Git:
                 url,
             )
 
-        # fallback to legacy git client
-        return cls._clone_legacy(url=url, refspec=refspec, target=target)
+        # fallback to legacy git client, which clones submodules itself
+        return cls._clone_legacy(url=url, refspec=refspec, target=target), False
+
+
+def _encode_refs(refs: Mapping[bytes, bytes]) -> dict[str, str]:
+    return {
+        name.decode("utf-8", errors="surrogateescape"): sha.decode("utf-8")
+        for name, sha in refs.items()
+    }
+
+
+def _decode_refs(refs: Mapping[str, str]) -> dict[bytes, bytes]:
+    return {
+        name.encode("utf-8", errors="surrogateescape"): sha.encode("utf-8")
+        for name, sha in refs.items()
+    }
 
 
 def urlpathjoin(base: str, path: str) -> str:
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import os
+import time
+
+from typing import TYPE_CHECKING
+from typing import TypeVar
+
+import pytest
+
+
+if TYPE_CHECKING:
+    from cleo.testers.command_tester import CommandTester
+
+    from poetry.config.config import Config
+    from poetry.utils.cache import FileCache
+    from tests.types import CommandTesterFactory
+
+T = TypeVar("T")
+
+
+@pytest.fixture
+def tester(command_tester_factory: CommandTesterFactory) -> CommandTester:
+    return command_tester_factory("cache prune")
+
+
+def test_cache_prune_removes_old_entries(
+    tester: CommandTester, cache: FileCache[T]
+) -> None:
+    entries = sorted(cache.get_entries(), key=lambda entry: entry.paths)
+    last_used = time.time() - 10 * 24 * 60 * 60
+    os.utime(entries[0].paths[0], (last_used, last_used))
+
+    exit_code = tester.execute("--max-age 7")
+
+    assert exit_code == 0
+    assert tester.io.fetch_output().startswith("Removed 1 cache item (")
+    assert len(cache.get_entries()) == 1
+
+
+def test_cache_prune_uses_configured_limits(
+    tester: CommandTester, cache: FileCache[T], config: Config
+) -> None:
+    config.merge({"cache": {"max-size": 1}})
+
+    exit_code = tester.execute()
+
+    assert exit_code == 0
+    assert tester.io.fetch_output() == "Removed 0 cache items (0.0 MB)\n"
+    assert len(cache.get_entries()) == 2
+
+
+def test_cache_prune_without_limits(tester: CommandTester, cache: FileCache[T]) -> None:
+    exit_code = tester.execute()
+
+    assert exit_code == 1
+    assert "No cache limits configured" in tester.io.fetch_error()
+    assert len(cache.get_entries()) == 2
+
+
+@pytest.mark.parametrize("option", ["--max-size", "--max-age"])
+@pytest.mark.parametrize("value", ["ten", "-1"])
+def test_cache_prune_validates_limits(
+    tester: CommandTester, cache: FileCache[T], option: str, value: str
+) -> None:
+    exit_code = tester.execute(f"{option}={value}")
+
+    assert exit_code == 1
+    assert tester.io.fetch_error() == (
+        f"The {option} option must be a non-negative integer, got '{value}'.\n"
+    )
+    assert len(cache.get_entries()) == 2
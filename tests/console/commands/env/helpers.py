@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 import os
 
 from pathlib import Path
@@ -8,6 +9,8 @@ from typing import Any
 
 from poetry.core.constraints.version import Version
 
+from poetry.utils.env import GET_ENVIRONMENT_SNAPSHOT
+
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -25,6 +28,18 @@ def check_output_wrapper(
     def check_output(cmd: list[str], *args: Any, **kwargs: Any) -> str:
         # cmd is a list, like ["python", "-c", "do stuff"]
         python_cmd = cmd[-1]
+        if python_cmd == GET_ENVIRONMENT_SNAPSHOT:
+            return json.dumps(
+                {
+                    "base_prefix": "/usr",
+                    "marker_env": {
+                        "version_info": [version.major, version.minor, version.patch]
+                    },
+                    "paths": {},
+                    "sys_path": [],
+                }
+            )
+
         if "print(json.dumps(env))" in python_cmd:
             return (
                 f'{{"version_info": [{version.major}, {version.minor},'
@@ -54,7 +54,10 @@ def test_list_displays_default_value_if_not_set(
 
     cache_dir = json.dumps(str(config_cache_dir))
     venv_path = json.dumps(os.path.join("{cache-dir}", "virtualenvs"))
-    expected = f"""cache-dir = {cache_dir}
+    expected = f"""cache.max-age = null
+cache.max-size = null
+cache-dir = {cache_dir}
+installer.link-mode = "copy"
 installer.max-workers = null
 installer.no-binary = null
 installer.only-binary = null
@@ -86,7 +89,10 @@ def test_list_displays_set_get_setting(
 
     cache_dir = json.dumps(str(config_cache_dir))
     venv_path = json.dumps(os.path.join("{cache-dir}", "virtualenvs"))
-    expected = f"""cache-dir = {cache_dir}
+    expected = f"""cache.max-age = null
+cache.max-size = null
+cache-dir = {cache_dir}
+installer.link-mode = "copy"
 installer.max-workers = null
 installer.no-binary = null
 installer.only-binary = null
@@ -139,7 +145,10 @@ def test_unset_setting(
     tester.execute("--list")
     cache_dir = json.dumps(str(config_cache_dir))
     venv_path = json.dumps(os.path.join("{cache-dir}", "virtualenvs"))
-    expected = f"""cache-dir = {cache_dir}
+    expected = f"""cache.max-age = null
+cache.max-size = null
+cache-dir = {cache_dir}
+installer.link-mode = "copy"
 installer.max-workers = null
 installer.no-binary = null
 installer.only-binary = null
@@ -170,7 +179,10 @@ def test_unset_repo_setting(
     tester.execute("--list")
     cache_dir = json.dumps(str(config_cache_dir))
     venv_path = json.dumps(os.path.join("{cache-dir}", "virtualenvs"))
-    expected = f"""cache-dir = {cache_dir}
+    expected = f"""cache.max-age = null
+cache.max-size = null
+cache-dir = {cache_dir}
+installer.link-mode = "copy"
 installer.max-workers = null
 installer.no-binary = null
 installer.only-binary = null
@@ -299,7 +311,10 @@ def test_list_displays_set_get_local_setting(
 
     cache_dir = json.dumps(str(config_cache_dir))
     venv_path = json.dumps(os.path.join("{cache-dir}", "virtualenvs"))
-    expected = f"""cache-dir = {cache_dir}
+    expected = f"""cache.max-age = null
+cache.max-size = null
+cache-dir = {cache_dir}
+installer.link-mode = "copy"
 installer.max-workers = null
 installer.no-binary = null
 installer.only-binary = null
@@ -338,7 +353,10 @@ def test_list_must_not_display_sources_from_pyproject_toml(
 
     cache_dir = json.dumps(str(config_cache_dir))
     venv_path = json.dumps(os.path.join("{cache-dir}", "virtualenvs"))
-    expected = f"""cache-dir = {cache_dir}
+    expected = f"""cache.max-age = null
+cache.max-size = null
+cache-dir = {cache_dir}
+installer.link-mode = "copy"
 installer.max-workers = null
 installer.no-binary = null
 installer.only-binary = null
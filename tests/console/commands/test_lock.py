@@ -1,16 +1,20 @@
 from __future__ import annotations
 
+import json
+
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 import pytest
 
 from poetry.packages import Locker
+from poetry.repositories import RepositoryPool
 from tests.helpers import get_package
 
 
 if TYPE_CHECKING:
     from cleo.testers.command_tester import CommandTester
+    from pytest_mock import MockerFixture
 
     from poetry.poetry import Poetry
     from tests.helpers import TestRepository
@@ -124,6 +128,84 @@ def test_lock_does_not_update_if_not_necessary(
         assert locked_repository.find_packages(package.to_dependency())
 
 
+def test_lock_with_profile(
+    command_tester_factory: CommandTesterFactory,
+    poetry_with_old_lockfile: Poetry,
+    repo: TestRepository,
+) -> None:
+    repo.add_package(get_package("sampleproject", "1.3.1"))
+    repo.add_package(get_package("sampleproject", "2.0.0"))
+
+    tester = command_tester_factory("lock", poetry=poetry_with_old_lockfile)
+    tester.execute("--profile")
+
+    project_path = poetry_with_old_lockfile.pyproject_path.parent
+    report_path = project_path / "poetry-profile.json"
+    stacks_path = project_path / "poetry-profile.folded"
+    assert f"Profile written to {report_path}" in tester.io.fetch_output()
+
+    report = json.loads(report_path.read_text(encoding="utf-8"))
+    assert {"solve", "complete_package", "incompatibilities_for"} <= set(
+        report["phases"]
+    )
+    packages = {package["name"]: package for package in report["packages"]}
+    assert set(packages) == {"foobar", "sampleproject"}
+    assert "complete_package" in packages["sampleproject"]["phases"]
+
+    stacks = stacks_path.read_text(encoding="utf-8").splitlines()
+    assert any(
+        stack.startswith("solve;complete_package:sampleproject ") for stack in stacks
+    )
+
+
+def test_lock_further_projects_with_shared_repositories(
+    command_tester_factory: CommandTesterFactory,
+    project_factory: ProjectFactory,
+    repo: TestRepository,
+    mocker: MockerFixture,
+) -> None:
+    from tests.helpers import TestRepository
+
+    repo.add_package(get_package("sampleproject", "1.3.1"))
+    repo.add_package(get_package("sampleproject", "2.0.0"))
+
+    poetry = project_factory(
+        name="foo", dependencies={"sampleproject": ">=1.3"}, install_deps=False
+    )
+    other_poetry = project_factory(
+        name="bar", dependencies={"sampleproject": "<2.0"}, install_deps=False
+    )
+    other_path = other_poetry.pyproject_path.parent
+
+    # The further project gets an equal but empty repository,
+    # which has to be replaced by the repository of the current project.
+    mocker.patch(
+        "poetry.factory.Factory.create_pool",
+        return_value=RepositoryPool([TestRepository(name="foo")]),
+    )
+    create_venv = mocker.patch("poetry.utils.env.EnvManager.create_venv")
+
+    tester = command_tester_factory("lock", poetry=poetry)
+    assert tester.execute(other_path.as_posix()) == 0
+
+    assert create_venv.call_count == 0
+
+    assert f"Locking {other_path}" in tester.io.fetch_output()
+
+    lock_data = {}
+    for path in (poetry.pyproject_path.parent, other_path):
+        locker = Locker(lock=path / "poetry.lock", pyproject_data={})
+        lock_data[path.name] = [
+            (package.name, package.version.text)
+            for package in locker.locked_repository().packages
+        ]
+
+    assert lock_data == {
+        "poetry-fixture-foo": [("sampleproject", "2.0.0")],
+        "poetry-fixture-bar": [("sampleproject", "1.3.1")],
+    }
+
+
 @pytest.mark.parametrize("regenerate", [True, False])
 def test_lock_always_updates_path_dependencies(
     command_tester_factory: CommandTesterFactory,
@@ -6,7 +6,9 @@ import pytest
 
 from poetry.core.packages.dependency_group import MAIN_GROUP
 from poetry.core.packages.dependency_group import DependencyGroup
+from poetry.core.packages.package import Package
 
+from poetry.console.commands.show import ShowCommand
 from poetry.factory import Factory
 from poetry.utils._compat import tomllib
 from tests.helpers import MOCK_DEFAULT_GIT_REVISION
@@ -16,11 +18,13 @@ from tests.helpers import get_package
 
 if TYPE_CHECKING:
     from cleo.testers.command_tester import CommandTester
+    from pytest_mock import MockerFixture
 
     from poetry.poetry import Poetry
     from poetry.repositories import Repository
     from tests.helpers import TestRepository
     from tests.types import CommandTesterFactory
+    from tests.types import FixtureDirGetter
 
 
 @pytest.fixture
@@ -1031,6 +1035,57 @@ project-with-setup 0.1.1 ../project_with_setup 0.1.2 ../project_with_setup
     )
 
 
+def test_find_latest_packages_shares_provider_for_direct_origin_packages(
+    tester: CommandTester,
+    poetry: Poetry,
+    repo: TestRepository,
+    fixture_dir: FixtureDirGetter,
+    mocker: MockerFixture,
+) -> None:
+    from poetry.puzzle.provider import Provider
+
+    repo.add_package(get_package("cachy", "0.2.0"))
+    repo.add_package(get_package("cachy", "0.3.0"))
+    repo.add_package(get_package("pendulum", "2.0.0"))
+
+    demo_path = fixture_dir("distributions") / "demo-0.1.0-py2.py3-none-any.whl"
+    project_path = fixture_dir("simple_project")
+    poetry.package.add_dependency(
+        Factory.create_dependency("demo", {"path": demo_path.as_posix()})
+    )
+    poetry.package.add_dependency(
+        Factory.create_dependency("simple-project", {"path": project_path.as_posix()})
+    )
+
+    cachy = get_package("cachy", "0.2.0")
+    pendulum = get_package("pendulum", "2.0.0")
+    demo = Package("demo", "0.1.0", source_type="file", source_url=demo_path.as_posix())
+    simple_project = Package(
+        "simple-project",
+        "1.2.0",
+        source_type="directory",
+        source_url=project_path.as_posix(),
+    )
+    provider_init = mocker.spy(Provider, "__init__")
+
+    command = tester.command
+    assert isinstance(command, ShowCommand)
+    latest = {
+        package.name: found.version.text if found else None
+        for package, found in command.find_latest_packages(
+            [cachy, demo, pendulum, simple_project], poetry.package
+        )
+    }
+
+    assert latest == {
+        "cachy": "0.3.0",
+        "demo": "0.1.0",
+        "pendulum": "2.0.0",
+        "simple-project": "1.2.3",
+    }
+    assert provider_init.call_count == 1
+
+
 @pytest.mark.parametrize("project_directory", ["project_with_git_dev_dependency"])
 def test_show_outdated_git_dev_dependency(
     tester: CommandTester,
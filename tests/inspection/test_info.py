@@ -11,11 +11,13 @@ import pytest
 
 from build import BuildBackendException
 from build import ProjectBuilder
+from dulwich.repo import Repo
 from packaging.metadata import parse_email
 from pkginfo.distribution import NewMetadataVersion
 
 from poetry.inspection.info import PackageInfo
 from poetry.inspection.info import PackageInfoError
+from poetry.inspection.info import get_pep517_metadata
 from poetry.utils.env import VirtualEnv
 
 
@@ -195,6 +197,19 @@ def test_info_from_sdist_no_pkg_info(fixture_dir: FixtureDirGetter) -> None:
     assert info._source_url == path.resolve().as_posix()
 
 
+def test_info_from_sdist_no_pkg_info_is_cached(
+    mocker: MockerFixture, fixture_dir: FixtureDirGetter
+) -> None:
+    path = fixture_dir("distributions") / "demo_no_pkg_info-0.1.0.tar.gz"
+    PackageInfo.from_sdist(path)
+
+    mocker.patch.object(PackageInfo, "from_directory", side_effect=AssertionError)
+    info = PackageInfo.from_sdist(path)
+    demo_check_info(info)
+    assert info._source_type == "file"
+    assert info._source_url == path.resolve().as_posix()
+
+
 def test_info_from_wheel(demo_wheel: Path) -> None:
     info = PackageInfo.from_wheel(demo_wheel)
     demo_check_info(info)
@@ -320,10 +335,71 @@ def test_info_no_setup_pkg_info_no_deps_dynamic(fixture_dir: FixtureDirGetter) -
 def test_info_setup_simple(mocker: MockerFixture, demo_setup: Path) -> None:
     spy = mocker.spy(VirtualEnv, "run")
     info = PackageInfo.from_directory(demo_setup)
-    assert spy.call_count == 4
+    # the environment is introspected once for each installation into it
+    assert spy.call_count == 2
     demo_check_info(info, requires_dist={"package"})
 
 
+def test_info_setup_metadata_is_cached(mocker: MockerFixture, demo_setup: Path) -> None:
+    Repo.init(str(demo_setup))
+    PackageInfo.from_directory(demo_setup)
+    get_pep517_metadata.cache_clear()
+    # egg-info directories created by the build must not be used
+    for egg_info in demo_setup.glob("*.egg-info"):
+        shutil.rmtree(egg_info)
+
+    isolated_builder = mocker.patch(
+        "poetry.inspection.info.isolated_builder", side_effect=AssertionError
+    )
+    info = PackageInfo.from_directory(demo_setup)
+    demo_check_info(info, requires_dist={"package"})
+
+    # the metadata is built again if any source file changes
+    (demo_setup / "demo.py").write_text("", encoding="utf-8")
+    get_pep517_metadata.cache_clear()
+    with pytest.raises(AssertionError):
+        PackageInfo.from_directory(demo_setup)
+    assert isolated_builder.call_count == 1
+
+
+def test_info_setup_metadata_is_not_cached_outside_of_work_tree(
+    mocker: MockerFixture, demo_setup: Path
+) -> None:
+    PackageInfo.from_directory(demo_setup)
+    get_pep517_metadata.cache_clear()
+    for egg_info in demo_setup.glob("*.egg-info"):
+        shutil.rmtree(egg_info)
+
+    isolated_builder = mocker.patch(
+        "poetry.inspection.info.isolated_builder", side_effect=AssertionError
+    )
+    # setup.py might read any other file, so its metadata is built again
+    with pytest.raises(AssertionError):
+        PackageInfo.from_directory(demo_setup)
+    assert isolated_builder.call_count == 1
+
+
+def test_info_setup_metadata_of_ignored_directories_is_not_mixed_up(
+    tmp_path: Path,
+) -> None:
+    Repo.init(str(tmp_path))
+    (tmp_path / ".gitignore").write_text("vendor/\n", encoding="utf-8")
+    infos = []
+    for requirement in ("package", "other"):
+        source = tmp_path / "vendor" / requirement
+        source.mkdir(parents=True)
+        (source / "setup.py").write_text(
+            "from setuptools import setup; "
+            'setup(name="demo", '
+            'version="0.1.0", '
+            f'install_requires=["{requirement}"])',
+            encoding="utf-8",
+        )
+        infos.append(PackageInfo.from_directory(source))
+
+    assert [info.requires_dist for info in infos] == [["package"], ["other"]]
+
+
 def test_info_setup_complex(demo_setup_complex: Path) -> None:
     info = PackageInfo.from_directory(demo_setup_complex)
     demo_check_info(info, requires_dist={"package"})
@@ -5,6 +5,7 @@ import json
 import re
 import shutil
 import tempfile
+import threading
 
 from pathlib import Path
 from subprocess import CalledProcessError
@@ -19,10 +20,12 @@ from build import ProjectBuilder
 from cleo.formatters.style import Style
 from cleo.io.buffered_io import BufferedIO
 from cleo.io.outputs.output import Verbosity
+from dulwich import porcelain
 from poetry.core.packages.package import Package
 from poetry.core.packages.utils.utils import path_to_url
 
 from poetry.factory import Factory
+from poetry.installation import executor as executor_module
 from poetry.installation.chef import Chef as BaseChef
 from poetry.installation.executor import Executor
 from poetry.installation.operations import Install
@@ -36,6 +39,7 @@ from poetry.vcs.git.backend import Git
 
 
 if TYPE_CHECKING:
+    from collections.abc import Collection
     from collections.abc import Iterator
 
     from pytest_mock import MockerFixture
@@ -247,6 +251,139 @@ Package operations: 4 installs, 2 updates, 1 removal
     ]
 
 
+def test_execute_downloads_archives_of_later_groups_while_installing(
+    mocker: MockerFixture,
+    config: Config,
+    pool: RepositoryPool,
+    io: BufferedIO,
+    tmp_path: Path,
+    env: MockEnv,
+) -> None:
+    config.merge({"cache-dir": str(tmp_path), "installer": {"max-workers": 2}})
+    pytest_package = Package("pytest", "3.5.1")
+    attrs_package = Package("attrs", "17.4.0")
+    attrs_downloaded = threading.Event()
+
+    download = Executor._download
+
+    def _download(executor: Executor, operation: Install | Update) -> Path:
+        archive = download(executor, operation)
+        if operation.package is attrs_package:
+            attrs_downloaded.set()
+        return archive
+
+    def install(
+        wheel_installer: WheelInstaller, wheel: Path, sha256: str | None = None
+    ) -> None:
+        if wheel.name.startswith("pytest"):
+            # The archive of the second group must not wait for this install.
+            assert attrs_downloaded.wait(timeout=10)
+
+    mocker.patch.object(Executor, "_download", _download)
+    mocker.patch.object(WheelInstaller, "install", install)
+
+    executor = Executor(env, pool, config, io)
+    return_code = executor.execute(
+        [
+            Install(pytest_package, priority=1),
+            Install(attrs_package, priority=0),
+        ]
+    )
+
+    assert return_code == 0
+    assert executor.installations_count == 2
+
+
+def test_execute_compiles_bytecode_after_installation(
+    mocker: MockerFixture,
+    config: Config,
+    pool: RepositoryPool,
+    io: BufferedIO,
+    env: MockEnv,
+) -> None:
+    installed = []
+
+    def install(
+        wheel_installer: WheelInstaller, wheel: Path, sha256: str | None = None
+    ) -> None:
+        installed.append(wheel)
+        wheel_installer.bytecode_files.extend(
+            [Path(f"{wheel.stem}.py"), Path(f"{wheel.stem}_test.py")]
+        )
+
+    def compile_bytecode(
+        wheel_installer: WheelInstaller, files: Collection[Path]
+    ) -> None:
+        # All wheels are installed before compiling any bytecode.
+        assert len(installed) == 2
+
+    mocker.patch.object(WheelInstaller, "install", install)
+    compile_bytecode_mock = mocker.patch.object(
+        WheelInstaller, "compile_bytecode", autospec=True, side_effect=compile_bytecode
+    )
+    mocker.patch.object(Executor, "BYTECODE_BATCH_SIZE", 3)
+
+    executor = Executor(env, pool, config, io)
+    executor.enable_bytecode_compilation()
+    return_code = executor.execute(
+        [Install(Package("pytest", "3.5.1")), Install(Package("attrs", "17.4.0"))]
+    )
+
+    assert return_code == 0
+    compiled = [
+        file for call in compile_bytecode_mock.call_args_list for file in call.args[1]
+    ]
+    assert compile_bytecode_mock.call_count == 2
+    assert len(compiled) == 4
+    assert "Compiled bytecode of 4 files" in io.fetch_output()
+    assert not executor._wheel_installer.bytecode_files
+
+
+def test_execute_does_not_read_downloaded_archives_again_for_hashes(
+    mocker: MockerFixture,
+    config: Config,
+    pool: RepositoryPool,
+    io: BufferedIO,
+    tmp_path: Path,
+    env: MockEnv,
+) -> None:
+    config.merge({"cache-dir": str(tmp_path)})
+    mocker.patch.object(WheelInstaller, "install")
+    get_file_hash = mocker.spy(executor_module, "get_file_hash")
+    archive_hash = (
+        "sha256:d327df3686046c5b374a9776d9e11606f7dba6fb3db5cf5d60ebc78a31e0768e"
+    )
+
+    for _ in range(2):
+        package = Package("pytest", "3.5.1")
+        package.files = [
+            {"file": "pytest-3.5.1-py2.py3-none-any.whl", "hash": archive_hash}
+        ]
+        executor = Executor(env, pool, config, io)
+
+        assert executor.execute([Install(package)]) == 0
+        assert executor._hashes == {"pytest": archive_hash}
+
+    get_file_hash.assert_not_called()
+
+
+def test_write_before_execution_of_operation_writes_to_its_section(
+    config: Config, pool: RepositoryPool, io_decorated: BufferedIO, env: MockEnv
+) -> None:
+    executor = Executor(env, pool, config, io_decorated)
+    operation = Install(Package("clikit", "0.2.4"))
+
+    # e.g. while the archive of the operation is being fetched in advance
+    executor._write(operation, "  - Installing clikit (0.2.4): Downloading...")
+    section = executor._sections[id(operation)]
+    executor._write(operation, "  - Installing clikit (0.2.4): Installing...")
+
+    assert executor._sections[id(operation)] is section
+    output = io_decorated.fetch_output()
+    assert "Downloading..." in output
+    assert output.rstrip().endswith("Installing...")
+
+
 @pytest.mark.parametrize(
     "operations, has_warning",
     [
@@ -728,8 +865,11 @@ def test_executor_should_write_pep610_url_references_for_directories(
     wheel: Path,
     fixture_dir: FixtureDirGetter,
     mocker: MockerFixture,
+    tmp_path: Path,
 ) -> None:
-    url = (fixture_dir("git") / "github.com" / "demo" / "demo").resolve()
+    # archives of directories outside of a work tree are not cached
+    url = tmp_path / "demo"
+    shutil.copytree(fixture_dir("git") / "github.com" / "demo" / "demo", url)
     package = Package(
         "demo", "0.1.2", source_type="directory", source_url=url.as_posix()
     )
@@ -747,6 +887,52 @@ def test_executor_should_write_pep610_url_references_for_directories(
     assert not prepare_spy.spy_return.exists(), "archive not cleaned up"
 
 
+def test_executor_should_cache_archives_of_directories_by_content(
+    tmp_venv: VirtualEnv,
+    pool: RepositoryPool,
+    config: Config,
+    artifact_cache: ArtifactCache,
+    io: BufferedIO,
+    wheel: Path,
+    fixture_dir: FixtureDirGetter,
+    mocker: MockerFixture,
+    tmp_path: Path,
+) -> None:
+    url = tmp_path / "demo"
+    shutil.copytree(fixture_dir("git") / "github.com" / "demo" / "demo", url)
+    (url / ".gitignore").write_text("build/\n", encoding="utf-8")
+    porcelain.init(str(url))
+    package = Package(
+        "demo", "0.1.2", source_type="directory", source_url=url.as_posix()
+    )
+
+    chef = Chef(artifact_cache, tmp_venv, Factory.create_pool(config))
+    chef.set_directory_wheel(wheel)
+    prepare_spy = mocker.spy(chef, "prepare")
+
+    def install() -> None:
+        executor = Executor(tmp_venv, pool, config, io)
+        executor._chef = chef
+        executor.execute([Install(package)])
+
+    install()
+    assert prepare_spy.call_count == 1
+    assert prepare_spy.spy_return.exists(), "cached archive should not be deleted"
+
+    # ignored files do not change the content of the directory
+    (url / "build").mkdir()
+    (url / "build" / "artifact").touch()
+    install()
+    assert prepare_spy.call_count == 1
+    verify_installed_distribution(
+        tmp_venv, package, {"dir_info": {}, "url": url.as_uri()}
+    )
+
+    (url / "demo" / "__init__.py").write_text("changed = True\n", encoding="utf-8")
+    install()
+    assert prepare_spy.call_count == 2
+
+
 def test_executor_should_write_pep610_url_references_for_editable_directories(
     tmp_venv: VirtualEnv,
     pool: RepositoryPool,
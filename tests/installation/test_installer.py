@@ -2884,3 +2884,158 @@ def test_explicit_source_dependency_with_direct_origin_dependency(
                 source_reference="repo",
             )
         ]
+
+
+def test_run_install_skips_solving_if_nothing_changed(
+    package: ProjectPackage,
+    locker: Locker,
+    repo: Repository,
+    pool: RepositoryPool,
+    config: Config,
+    tmp_path: Path,
+    mocker: MockerFixture,
+) -> None:
+    site_packages = tmp_path / "site-packages"
+    site_packages.mkdir()
+    env = MockEnv(path=tmp_path / "venv", sys_path=[str(site_packages)])
+
+    package_a = get_package("A", "1.0")
+    repo.add_package(package_a)
+    package.add_dependency(Factory.create_dependency("A", "~1.0"))
+
+    lock_data = {
+        "package": [
+            {
+                "name": "A",
+                "version": "1.0",
+                "optional": False,
+                "platform": "*",
+                "python-versions": "*",
+                "checksum": [],
+            },
+        ],
+        "metadata": {
+            "lock-version": "2.1",
+            "python-versions": "*",
+            "content-hash": "123456789",
+            "files": {"A": []},
+        },
+    }
+    fix_lock_data(lock_data)
+    locker.set_lock_path(tmp_path).locked(True)
+    locker.mock_lock_data(lock_data)
+    locker.lock.write_text("locked")
+
+    get_installed = mocker.patch(
+        "poetry.installation.installer.Installer._get_installed",
+        return_value=CustomInstalledRepository(),
+    )
+
+    def create_installer() -> Installer:
+        return Installer(
+            NullIO(),
+            env,
+            package,
+            locker,
+            pool,
+            config,
+            executor=Executor(env, pool, config, NullIO()),
+        )
+
+    installer = create_installer()
+    assert installer.run() == 0
+    assert isinstance(installer.executor, Executor)
+    assert installer.executor.installations == [package_a]
+    assert get_installed.call_count == 1
+
+    # The installation of the root package does not invalidate the state.
+    (site_packages / "root-1.0.dist-info").mkdir()
+
+    installer = create_installer()
+    assert installer.run() == 0
+    assert isinstance(installer.executor, Executor)
+    assert installer.executor.installations == []
+    assert get_installed.call_count == 1
+
+    # A distribution that has been installed behind Poetry's back
+    # invalidates the state.
+    (site_packages / "b-1.0.dist-info").mkdir()
+
+    installer = create_installer()
+    assert installer.run() == 0
+    assert isinstance(installer.executor, Executor)
+    assert installer.executor.installations == [package_a]
+    assert get_installed.call_count == 2
+
+    # So does a change of the lock file.
+    installer = create_installer()
+    assert installer.run() == 0
+    assert get_installed.call_count == 2
+    locker.lock.write_text("locked again")
+
+    installer = create_installer()
+    assert installer.run() == 0
+    assert get_installed.call_count == 3
+
+    # And another selection of groups.
+    installer = create_installer()
+    installer.only_groups([MAIN_GROUP])
+    assert installer.run() == 0
+    assert get_installed.call_count == 4
+
+
+def test_run_install_does_not_skip_solving_with_explicit_installed_repository(
+    installer: Installer,
+    locker: Locker,
+    tmp_path: Path,
+) -> None:
+    lock_data = {
+        "package": [],
+        "metadata": {
+            "lock-version": "2.1",
+            "python-versions": "*",
+            "content-hash": "123456789",
+            "files": {},
+        },
+    }
+    fix_lock_data(lock_data)
+    locker.set_lock_path(tmp_path).locked(True)
+    locker.mock_lock_data(lock_data)
+    locker.lock.write_text("locked")
+
+    assert installer.run() == 0
+    assert not installer._install_state_file().exists()
+
+
+def test_run_install_prunes_caches_at_most_once_a_day(
+    installer: Installer,
+    locker: Locker,
+    config: Config,
+    mocker: MockerFixture,
+) -> None:
+    prune_caches = mocker.patch("poetry.installation.installer.prune_caches")
+    locker.locked(False)
+    installer.prune_caches()
+
+    assert installer.run() == 0
+    prune_caches.assert_not_called()
+
+    config.merge({"cache": {"max-age": 30}})
+
+    assert installer.run() == 0
+    assert installer.run() == 0
+    prune_caches.assert_called_once_with(config)
+
+
+def test_run_install_does_not_prune_caches_by_default(
+    installer: Installer,
+    locker: Locker,
+    config: Config,
+    mocker: MockerFixture,
+) -> None:
+    prune_caches = mocker.patch("poetry.installation.installer.prune_caches")
+    locker.locked(False)
+    config.merge({"cache": {"max-age": 30}})
+
+    assert installer.run() == 0
+    prune_caches.assert_not_called()
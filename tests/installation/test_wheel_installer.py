@@ -9,13 +9,17 @@ import pytest
 
 from poetry.core.constraints.version import parse_constraint
 
+from poetry.installation import wheel_installer
+from poetry.installation.wheel_installer import UnpackedWheelFile
 from poetry.installation.wheel_installer import WheelInstaller
 from poetry.utils.env import MockEnv
 
 
 if TYPE_CHECKING:
     from pytest import TempPathFactory
+    from pytest_mock import MockerFixture
 
+    from poetry.utils.env import VirtualEnv
     from tests.types import FixtureDirGetter
 
 
@@ -73,11 +77,95 @@ def test_enable_bytecode_compilation(
     installer = WheelInstaller(env)
     installer.enable_bytecode_compilation(compile)
     installer.install(demo_wheel)
-    cache_dir = Path(env.paths["purelib"]) / "demo" / "__pycache__"
+    source_dir = Path(env.paths["purelib"]) / "demo"
+    # Bytecode is compiled separately after installation.
+    assert not (source_dir / "__pycache__").exists()
     if compile:
-        assert cache_dir.exists()
-        assert list(cache_dir.glob("*.pyc"))
-        assert not list(cache_dir.glob("*.opt-1.pyc"))
-        assert not list(cache_dir.glob("*.opt-2.pyc"))
+        assert installer.bytecode_files == [source_dir / "__init__.py"]
     else:
-        assert not cache_dir.exists()
+        assert not installer.bytecode_files
+
+
+def test_compile_bytecode(tmp_venv: VirtualEnv, demo_wheel: Path) -> None:
+    installer = WheelInstaller(tmp_venv)
+    installer.enable_bytecode_compilation()
+    installer.install(demo_wheel)
+    installer.compile_bytecode(installer.bytecode_files)
+    cache_dir = Path(tmp_venv.paths["purelib"]) / "demo" / "__pycache__"
+    assert cache_dir.exists()
+    assert list(cache_dir.glob("*.pyc"))
+    assert not list(cache_dir.glob("*.opt-1.pyc"))
+    assert not list(cache_dir.glob("*.opt-2.pyc"))
+
+
+def test_installation_from_store_links_files(
+    tmp_path: Path, demo_wheel: Path, default_installation: Path
+) -> None:
+    store = tmp_path / "store"
+    installations = []
+    for name in ("env1", "env2"):
+        env = MockEnv(path=tmp_path / name)
+        installer = WheelInstaller(env, store=store)
+        installer.install(demo_wheel)
+        installations.append(Path(env.paths["purelib"]))
+
+    first, second = installations
+    assert (first / "demo" / "__init__.py").samefile(second / "demo" / "__init__.py")
+    assert len(list(store.glob("*/*/*/manifest.json"))) == 1
+
+    # Installation specific files are not shared.
+    dist_info = "demo-0.1.0.dist-info"
+    for name in ("INSTALLER", "RECORD"):
+        assert not (first / dist_info / name).samefile(second / dist_info / name)
+        assert (first / dist_info / name).read_text(encoding="utf-8") == (
+            default_installation / dist_info / name
+        ).read_text(encoding="utf-8")
+
+
+def test_installation_from_store_unpacks_incomplete_wheels_again(
+    tmp_path: Path, demo_wheel: Path
+) -> None:
+    store = tmp_path / "store"
+    WheelInstaller(MockEnv(path=tmp_path / "env1"), store=store).install(demo_wheel)
+    for path in store.glob("*/*/*/files/demo/__init__.py"):
+        path.unlink()
+
+    env = MockEnv(path=tmp_path / "env2")
+    WheelInstaller(env, store=store).install(demo_wheel)
+
+    assert (Path(env.paths["purelib"]) / "demo" / "__init__.py").exists()
+    assert len(list(store.glob("*/*/*/files/demo/__init__.py"))) == 1
+
+
+def test_installation_from_store_uses_known_hash(
+    tmp_path: Path, demo_wheel: Path, mocker: MockerFixture
+) -> None:
+    get_file_hash = mocker.spy(wheel_installer, "get_file_hash")
+    store = tmp_path / "store"
+    installer = WheelInstaller(MockEnv(path=tmp_path / "env"), store=store)
+
+    installer.install(demo_wheel, sha256="a" * 64)
+
+    assert get_file_hash.call_count == 0
+    assert (store / "aa" / "aa" / ("a" * 60) / "manifest.json").exists()
+
+
+def test_store_entries(tmp_path: Path, demo_wheel: Path) -> None:
+    store = tmp_path / "store"
+    WheelInstaller(MockEnv(path=tmp_path / "env"), store=store).install(demo_wheel)
+
+    (entry,) = UnpackedWheelFile.get_store_entries(store)
+
+    manifest = next(store.glob("*/*/*/manifest.json"))
+    assert entry.paths == (manifest, manifest.parent)
+    assert (
+        entry.size
+        == sum(
+            path.stat().st_size for path in manifest.parent.rglob("*") if path.is_file()
+        )
+        - manifest.stat().st_size
+    )
+
+    entry.remove()
+    assert not manifest.parent.exists()
+    assert UnpackedWheelFile.get_store_entries(store) == []
@@ -9,6 +9,7 @@ from tests.mixology.helpers import check_solver_result
 
 if TYPE_CHECKING:
     from poetry.core.packages.project_package import ProjectPackage
+    from pytest_mock import MockerFixture
 
     from poetry.repositories import Repository
     from tests.mixology.version_solver.conftest import Provider
@@ -204,3 +205,27 @@ def test_backtracking_performance_level_2(
         add_to_repo(repo, "c", str(i), deps={"b": f"<={i}"})
 
     check_solver_result(root, provider, {"a": "1", "b": str(bc_max), "c": str(bc_max)})
+
+
+def test_rejects_consecutive_versions_with_same_dependencies_at_once(
+    root: ProjectPackage,
+    provider: Provider,
+    repo: Repository,
+    mocker: MockerFixture,
+) -> None:
+    root.add_dependency(Factory.create_dependency("a", "*"))
+    root.add_dependency(Factory.create_dependency("b", "*"))
+
+    add_to_repo(repo, "a", "1", deps={"c": "1"})
+    for i in range(1, 11):
+        add_to_repo(repo, "b", f"2.{i}", deps={"c": "2"})
+    add_to_repo(repo, "b", "1", deps={"c": "1"})
+    add_to_repo(repo, "c", "1")
+    add_to_repo(repo, "c", "2")
+
+    complete_package = mocker.spy(provider, "complete_package")
+
+    check_solver_result(root, provider, {"a": "1", "b": "1", "c": "1"})
+
+    completed = [call.args[0].package for call in complete_package.call_args_list]
+    assert [str(p.version) for p in completed if p.name == "b"] == ["2.10", "1"]
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from poetry.core.constraints.version import parse_constraint
+from poetry.core.version.markers import parse_marker
+
+from poetry.puzzle.markers import get_marker_cache_stats
+from poetry.puzzle.markers import get_python_constraint
+from poetry.puzzle.markers import intersect_markers
+from poetry.puzzle.markers import invert_marker
+from poetry.puzzle.markers import union_markers
+from poetry.puzzle.markers import validate_marker
+
+
+def test_marker_operations_are_cached() -> None:
+    # use a marker that is not cached yet by other tests
+    marker = parse_marker(
+        'python_version >= "3.9" and platform_machine == "test-marker-cache"'
+    )
+    other = parse_marker('python_version < "3.12"')
+
+    stats = get_marker_cache_stats()
+    intersection = intersect_markers(marker, other)
+    assert intersect_markers(parse_marker(str(marker)), other) is intersection
+    assert intersection == marker.intersect(other)
+    assert union_markers(marker, other) == marker.union(other)
+    assert invert_marker(marker) == marker.invert()
+    assert get_python_constraint(intersection) == parse_constraint(">=3.9,<3.12")
+
+    hits, misses = get_marker_cache_stats()["intersect"]
+    assert hits - stats["intersect"][0] == 1
+    assert misses - stats["intersect"][1] == 1
+
+
+def test_validate_marker_with_unhashable_environment() -> None:
+    marker = parse_marker('python_version >= "3.9" and extra == "foo"')
+
+    assert validate_marker(
+        marker, {"python_version": "3.10", "version_info": [3, 10], "extra": {"foo"}}
+    )
+    assert not validate_marker(
+        marker, {"python_version": "3.10", "version_info": [3, 10], "extra": ["bar"]}
+    )
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import json
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from poetry.puzzle.profiler import Profiler
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_profiler_attributes_own_time_to_packages(tmp_path: Path) -> None:
+    profiler = Profiler()
+
+    with profiler.measure("solve"):
+        with (
+            profiler.measure("complete_package", "foo"),
+            profiler.measure("metadata") as frame,
+        ):
+            frame.phase = "metadata (PyPI)"
+        with profiler.measure("complete_package", "bar"):
+            pass
+        profiler.count("backtrack", "foo")
+
+    report = profiler.report()
+
+    assert set(report["phases"]) == {"solve", "complete_package", "metadata (PyPI)"}
+    assert report["phases"]["complete_package"]["count"] == 2
+    assert report["events"] == {"backtrack": 1}
+    assert report["total"] == pytest.approx(
+        sum(phase["time"] for phase in report["phases"].values()), abs=1e-5
+    )
+
+    packages = {package["name"]: package for package in report["packages"]}
+    assert set(packages) == {"foo", "bar"}
+    assert set(packages["foo"]["phases"]) == {"complete_package", "metadata (PyPI)"}
+    assert packages["foo"]["events"] == {"backtrack": 1}
+    assert profiler.report(top=1)["packages"] == report["packages"][:1]
+
+    assert [stack.rsplit(" ", 1)[0] for stack in profiler.stacks()] == [
+        "solve;complete_package:foo;metadata (PyPI):foo",
+        "solve;complete_package:foo",
+        "solve;complete_package:bar",
+        "solve",
+    ]
+
+    report_path, stacks_path = profiler.write(tmp_path)
+
+    assert json.loads(report_path.read_text(encoding="utf-8"))["events"] == {
+        "backtrack": 1
+    }
+    assert stacks_path.read_text(encoding="utf-8").count("\n") == 4
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import shutil
 
+from concurrent.futures import wait
 from pathlib import Path
 from subprocess import CalledProcessError
 from typing import TYPE_CHECKING
@@ -11,6 +12,7 @@ import pytest
 
 from cleo.io.null_io import NullIO
 from packaging.utils import canonicalize_name
+from poetry.core.constraints.version import Version
 from poetry.core.packages.dependency import Dependency
 from poetry.core.packages.directory_dependency import DirectoryDependency
 from poetry.core.packages.file_dependency import FileDependency
@@ -24,6 +26,7 @@ from poetry.inspection.info import PackageInfo
 from poetry.packages import DependencyPackage
 from poetry.puzzle.provider import IncompatibleConstraintsError
 from poetry.puzzle.provider import Provider
+from poetry.repositories.cached_repository import CachedRepository
 from poetry.repositories.exceptions import PackageNotFoundError
 from poetry.repositories.repository import Repository
 from poetry.repositories.repository_pool import Priority
@@ -36,8 +39,10 @@ from tests.helpers import get_dependency
 if TYPE_CHECKING:
     from pathlib import Path
 
+    from packaging.utils import NormalizedName
     from pytest_mock import MockerFixture
 
+    from tests.conftest import Config
     from tests.types import FixtureDirGetter
 
 
@@ -629,6 +634,28 @@ def test_complete_package_merges_same_source_and_no_source(
     }
 
 
+def test_resolve_overlapping_markers_only_visits_existing_regions(
+    provider: Provider, root: ProjectPackage, mocker: MockerFixture
+) -> None:
+    dependencies = [
+        Factory.create_dependency(
+            "foo", {"version": f"{minor}", "python": f"~3.{minor}"}
+        )
+        for minor in range(4, 16)
+    ]
+    is_relevant_marker = mocker.spy(provider, "_is_relevant_marker")
+
+    resolved = provider._resolve_overlapping_markers(root, dependencies, None)
+
+    # one region per dependency and one region without any dependency
+    assert is_relevant_marker.call_count == 13
+    assert [str(dep.constraint) for dep in resolved[:-1]] == [
+        str(minor) for minor in range(4, 16)
+    ]
+    assert [dep.marker for dep in resolved[:-1]] == [dep.marker for dep in dependencies]
+    assert resolved[-1].constraint.is_empty()
+
+
 def test_complete_package_does_not_merge_different_source_names(
     provider: Provider, root: ProjectPackage
 ) -> None:
@@ -889,3 +916,134 @@ def test_source_dependency_is_not_satisfied_by_incompatible_direct_origin(
     dep.source_name = repository.name
 
     assert provider.search_for(dep) == [repo_package]
+
+
+def test_search_for_prefetches_metadata_of_candidates(
+    root: ProjectPackage, config: Config, mocker: MockerFixture
+) -> None:
+    class MockCachedRepository(CachedRepository):
+        def _get_release_info(
+            self, name: NormalizedName, version: Version
+        ) -> dict[str, Any]:
+            return PackageInfo(
+                name=name,
+                version=str(version),
+                cache_version=str(self.CACHE_VERSION),
+            ).asdict()
+
+    repository = MockCachedRepository("repo", config=config)
+    for version in ("1", "2", "3"):
+        repository.add_package(Package("foo", version))
+    get_release_info = mocker.spy(repository, "_get_release_info")
+    pool = RepositoryPool([repository])
+    provider = Provider(root, pool, NullIO())
+
+    dependency = Dependency("foo", ">=1")
+    provider.search_for(dependency)
+    get_release_info.assert_not_called()
+
+    with provider.prefetching():
+        packages = provider.search_for(dependency)
+        # searching again does not fetch the same metadata again
+        provider.search_for(dependency)
+        provider.complete_package(packages[0])
+        # pending prefetches are cancelled when leaving the context
+        wait(provider._prefetched.values())
+
+    assert sorted(call.args for call in get_release_info.call_args_list) == [
+        ("foo", Version.parse("2")),
+        ("foo", Version.parse("3")),
+    ]
+    assert not provider._prefetched
+
+
+def test_prefetching_is_disabled_without_cached_repositories(
+    provider: Provider, repository: Repository
+) -> None:
+    repository.add_package(Package("foo", "1"))
+
+    with provider.prefetching():
+        provider.search_for(Dependency("foo", ">=1"))
+        assert not provider._prefetched
+
+
+def test_incompatibilities_for_covers_consecutive_versions_with_same_requirements(
+    root: ProjectPackage, config: Config, mocker: MockerFixture
+) -> None:
+    class MockCachedRepository(CachedRepository):
+        def _get_release_info(
+            self, name: NormalizedName, version: Version
+        ) -> dict[str, Any]:
+            requires_dist = ["bar>=2"] if version == Version.parse("1") else ["bar>=1"]
+            return PackageInfo(
+                name=name,
+                version=str(version),
+                requires_dist=requires_dist,
+                cache_version=str(self.CACHE_VERSION),
+            ).asdict()
+
+    repository = MockCachedRepository("repo", config=config)
+    for version in ("1", "2", "3", "4"):
+        repository.add_package(Package("foo", version))
+    get_release_info = mocker.spy(repository, "_get_release_info")
+    provider = Provider(root, RepositoryPool([repository]), NullIO())
+
+    dependency = Dependency("foo", "4")
+    package = provider.complete_package(
+        DependencyPackage(dependency, Package("foo", "4"))
+    )
+
+    # the metadata of other releases is not fetched just to widen the range
+    (incompatibility,) = provider.incompatibilities_for(package)
+    assert str(incompatibility.terms[0].constraint) == "4"
+    assert [call.args for call in get_release_info.call_args_list] == [
+        ("foo", Version.parse("4"))
+    ]
+
+    with provider.prefetching():
+        provider.incompatibilities_for(package)
+        wait(provider._prefetched.values())
+        (incompatibility,) = provider.incompatibilities_for(package)
+    assert str(incompatibility.terms[0].constraint) == ">=2,<=4"
+
+
+@pytest.mark.parametrize(
+    "package, source_name, expected",
+    [
+        (Package("foo", "1"), None, "repo"),
+        (Package("foo", "1"), "explicit", "explicit"),
+        (
+            Package("foo", "1", source_type="legacy", source_reference="mirror"),
+            None,
+            "mirror",
+        ),
+        (
+            Package(
+                "foo",
+                "1",
+                source_type="git",
+                source_url="https://github.com/demo/foo.git",
+            ),
+            None,
+            "git",
+        ),
+    ],
+)
+def test_get_repository_name(
+    provider: Provider, package: Package, source_name: str | None, expected: str
+) -> None:
+    dependency = Dependency("foo", "*")
+    dependency.source_name = source_name
+
+    name = provider._get_repository_name(DependencyPackage(dependency, package))
+
+    assert name == expected
+
+
+def test_get_repository_name_is_unknown_for_several_repositories(
+    provider: Provider, pool: RepositoryPool
+) -> None:
+    pool.add_repository(Repository("other"))
+    package = DependencyPackage(Dependency("foo", "*"), Package("foo", "1"))
+
+    assert provider._get_repository_name(package) == "unknown"
@@ -1413,6 +1413,61 @@ def test_solver_duplicate_dependencies_different_constraints(
     )
 
 
+def test_solver_reuses_search_results_and_completed_packages_for_overrides(
+    solver: Solver,
+    repo: Repository,
+    package: ProjectPackage,
+    mocker: MockerFixture,
+) -> None:
+    package.add_dependency(Factory.create_dependency("A", "*"))
+    package.add_dependency(Factory.create_dependency("C", "*"))
+
+    package_a = get_package("A", "1.0")
+    package_a.add_dependency(
+        Factory.create_dependency("B", {"version": "^1.0", "python": "<3.4"})
+    )
+    package_a.add_dependency(
+        Factory.create_dependency("B", {"version": "^2.0", "python": ">=3.4"})
+    )
+    package_c = get_package("C", "1.0")
+    package_c.add_dependency(Factory.create_dependency("D", "*"))
+
+    package_b10 = get_package("B", "1.0")
+    package_b20 = get_package("B", "2.0")
+    package_d = get_package("D", "1.0")
+
+    for p in (package_a, package_b10, package_b20, package_c, package_d):
+        repo.add_package(p)
+
+    find_packages = mocker.spy(repo, "find_packages")
+    get_package_ = mocker.spy(repo, "package")
+
+    transaction = solver.solve()
+
+    check_solver_result(
+        transaction,
+        [
+            {"job": "install", "package": package_b10},
+            {"job": "install", "package": package_b20},
+            {"job": "install", "package": package_d},
+            {"job": "install", "package": package_a},
+            {"job": "install", "package": package_c},
+        ],
+    )
+    assert len(solver._overrides) == 2
+    # C and D are not affected by the overrides,
+    # so they are only searched for and completed once.
+    searched = [
+        call.args[0].name
+        for call in find_packages.call_args_list
+        if not call.args[0].allows_prereleases()
+    ]
+    completed = [call.args[0].lower() for call in get_package_.call_args_list]
+    for name in ("c", "d"):
+        assert searched.count(name) == 1
+        assert completed.count(name) == 1
+
+
 def test_solver_duplicate_dependencies_different_constraints_same_requirements(
     solver: Solver, repo: Repository, package: ProjectPackage
 ) -> None:
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from typing import Any
+
+import pytest
+
+from packaging.utils import canonicalize_name
+from poetry.core.constraints.version import Version
+
+from poetry.repositories.cached_repository import CachedRepository
+
+
+if TYPE_CHECKING:
+    from packaging.utils import NormalizedName
+
+    from tests.conftest import Config
+
+
+class MockCachedRepository(CachedRepository):
+    def __init__(self, config: Config, disable_cache: bool = False) -> None:
+        super().__init__("foo", disable_cache=disable_cache, config=config)
+        self.calls = 0
+
+    def _get_release_info(
+        self, name: NormalizedName, version: Version
+    ) -> dict[str, Any]:
+        self.calls += 1
+        return {
+            "name": name,
+            "version": str(version),
+            "summary": "",
+            "requires_dist": ['bar (>=1.0) ; python_version >= "3.8"'],
+            "requires_python": ">=3.8",
+            "files": [],
+            "yanked": False,
+            "_cache_version": str(self.CACHE_VERSION),
+        }
+
+
+@pytest.mark.parametrize("disable_cache", [False, True])
+def test_get_release_info_is_kept_in_memory(
+    config: Config, disable_cache: bool
+) -> None:
+    repo = MockCachedRepository(config, disable_cache)
+    name = canonicalize_name("foo")
+    version = Version.parse("1.0")
+
+    info = repo.get_release_info(name, version)
+    assert info.name == "foo"
+    assert info.cache_version == str(repo.CACHE_VERSION)
+
+    repo._release_cache.forget(f"{name}:{version}")
+    info = repo.get_release_info(name, version)
+    assert info.name == "foo"
+    assert info.cache_version == str(repo.CACHE_VERSION)
+
+    assert repo.calls == (2 if disable_cache else 1)
+
+
+def test_package_returns_independent_dependencies(config: Config) -> None:
+    repo = MockCachedRepository(config)
+    version = Version.parse("1.0")
+
+    package1 = repo.package("foo", version)
+    package2 = repo.package("foo", version)
+
+    assert package1.requires == package2.requires
+    assert package1.requires[0] is not package2.requires[0]
+
+    package1.requires[0].transitive_marker = package1.requires[0].marker.invert()
+    assert package2.requires[0].transitive_marker == package2.requires[0].marker
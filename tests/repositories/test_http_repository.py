@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import contextlib
 import shutil
+import threading
 
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -13,6 +14,7 @@ import pytest
 from packaging.metadata import parse_email
 from poetry.core.packages.utils.link import Link
 
+from poetry.inspection.info import PackageInfo
 from poetry.inspection.info import PackageInfoError
 from poetry.inspection.lazy_wheel import HTTPRangeRequestUnsupportedError
 from poetry.repositories.http_repository import HTTPRepository
@@ -243,3 +245,90 @@ def test_calculate_sha256_defaults_to_sha256_on_md5_errors(
         calculated_hash
         == "sha256:e216b70f013c47b82a72540d34347632c5bfe59fd54f5fe5d51f6a68b19aaf84"
     )
+
+
+def test_get_info_from_links_fetches_py2_and_py3_wheels_concurrently(
+    mocker: MockerFixture,
+) -> None:
+    # Both fetches must be in progress at the same time to pass the barrier.
+    barrier = threading.Barrier(2, timeout=5)
+
+    def get_info(link: Link) -> PackageInfo:
+        barrier.wait()
+        if "py2" in link.filename:
+            return PackageInfo(requires_dist=["futures"], requires_python="~2.7")
+        return PackageInfo(requires_dist=["attrs"], requires_python=">=3.6")
+
+    mocker.patch.object(
+        MockRepository, "_get_info_from_metadata_or_wheel", side_effect=get_info
+    )
+    repo = MockRepository()
+
+    info = repo._get_info_from_links(
+        [
+            Link("https://foo.com/isort-4.3.4-py2-none-any.whl"),
+            Link("https://foo.com/isort-4.3.4-py3-none-any.whl"),
+        ],
+        ignore_yanked=True,
+    )
+
+    assert info.requires_python == ">=2.7,<2.8 || >=3.6"
+    assert info.requires_dist == [
+        'attrs ; python_version >= "3"',
+        'futures ; python_version == "2.7"',
+    ]
+
+
+def test_links_to_data_calculates_missing_hashes_concurrently(
+    mocker: MockerFixture,
+) -> None:
+    links = [
+        Link("https://foo.com/demo-0.1.0-py3-none-any.whl"),
+        Link("https://foo.com/demo-0.1.0.tar.gz"),
+        Link("https://foo.com/demo-0.1.0-cp38-cp38-any.whl", hashes={"sha256": "abc"}),
+    ]
+    # Both downloads must be in progress at the same time to pass the barrier.
+    barrier = threading.Barrier(2, timeout=5)
+
+    def calculate_sha256(link: Link) -> str:
+        barrier.wait()
+        return f"sha256:{link.filename}"
+
+    mocker.patch.object(
+        MockRepository, "calculate_sha256", side_effect=calculate_sha256
+    )
+    mocker.patch.object(
+        MockRepository,
+        "_get_info_from_links",
+        return_value=PackageInfo(requires_dist=["attrs"]),
+    )
+    repo = MockRepository()
+
+    data = repo._links_to_data(links, PackageInfo(name="demo", version="0.1.0"))
+
+    assert data["files"] == [
+        {"file": links[0].filename, "hash": f"sha256:{links[0].filename}"},
+        {"file": links[1].filename, "hash": f"sha256:{links[1].filename}"},
+        {"file": links[2].filename, "hash": "sha256:abc"},
+    ]
+    assert data["requires_dist"] == ["attrs"]
+
+
+def test_links_to_data_does_not_use_pool_if_hashes_are_known(
+    mocker: MockerFixture,
+) -> None:
+    links = [
+        Link("https://foo.com/demo-0.1.0-py3-none-any.whl", hashes={"sha256": "abc"})
+    ]
+    mocker.patch.object(
+        MockRepository,
+        "_get_info_from_links",
+        return_value=PackageInfo(requires_dist=["attrs"]),
+    )
+    repo = MockRepository()
+    submit = mocker.patch.object(repo._executor, "submit")
+
+    data = repo._links_to_data(links, PackageInfo(name="demo", version="0.1.0"))
+
+    assert data["files"] == [{"file": links[0].filename, "hash": "sha256:abc"}]
+    submit.assert_not_called()
@@ -513,3 +513,57 @@ def test_pipx_shared_lib_site_packages(
     # that the package does not seem to be a valid Python package.
     assert caplog.messages == []
     assert cleo_package.source_type is None
+
+
+def test_load_uses_index_of_unchanged_distributions(
+    tmp_path: Path, mocker: MockerFixture, poetry: Poetry, site_purelib: Path
+) -> None:
+    venv_path = tmp_path / "venv"
+    EnvManager(poetry).build_venv(path=venv_path)
+    env = VirtualEnv(venv_path)
+    for dist_info in {
+        "cleo-0.7.6.dist-info",
+        "standard-1.2.3.dist-info",
+        "directory_pep_610-1.2.3.dist-info",
+    }:
+        shutil.copytree(site_purelib / dist_info, env.purelib / dist_info)
+
+    repository = InstalledRepository.load(env, with_dependencies=True)
+
+    assert (venv_path / InstalledRepository.INDEX_FILE).exists()
+
+    create_package = mocker.spy(InstalledRepository, "create_package_from_distribution")
+    cached_repository = InstalledRepository.load(env, with_dependencies=True)
+
+    assert create_package.call_count == 0
+    assert [
+        (p.name, p.version, p.source_type, p.source_url, p.develop, p.requires)
+        for p in cached_repository.packages
+    ] == [
+        (p.name, p.version, p.source_type, p.source_url, p.develop, p.requires)
+        for p in repository.packages
+    ]
+
+    (env.purelib / "standard-1.2.3.dist-info" / "INSTALLER").write_text(
+        "pip", encoding="utf-8"
+    )
+    InstalledRepository.load(env)
+
+    assert create_package.call_count == 1
+    assert create_package.call_args.args[0].metadata["name"] == "standard"
+
+    # Files that are modified in place invalidate the index, too.
+    for i, path in enumerate(
+        [
+            env.purelib / "cleo-0.7.6.dist-info" / "METADATA",
+            env.purelib / "directory_pep_610-1.2.3.dist-info" / "direct_url.json",
+            env.purelib / "standard.pth",
+        ],
+        start=2,
+    ):
+        path.touch()
+        mtime = path.stat().st_mtime + 1
+        os.utime(path, (mtime, mtime))
+        InstalledRepository.load(env)
+
+        assert create_package.call_count == i
@@ -261,6 +261,33 @@ def test_venv_has_correct_paths(tmp_venv: VirtualEnv) -> None:
     )
 
 
+def test_venv_snapshot_is_cached_on_disk(
+    tmp_venv: VirtualEnv, mocker: MockerFixture
+) -> None:
+    expected_sys_path = tmp_venv.sys_path
+    expected_marker_env = tmp_venv.marker_env
+    assert (tmp_venv.path / VirtualEnv.SNAPSHOT_FILE).exists()
+    assert not list(tmp_venv.path.glob(f"{VirtualEnv.SNAPSHOT_FILE}.*"))
+
+    check_output = mocker.spy(subprocess, "check_output")
+    venv = VirtualEnv(tmp_venv.path)
+
+    assert venv.base == tmp_venv.base
+    assert venv.sys_path == expected_sys_path
+    assert venv.marker_env == expected_marker_env
+    assert venv.paths == tmp_venv.paths
+    assert venv.supported_tags == tmp_venv.supported_tags
+    check_output.assert_not_called()
+
+    # Installing distributions may change sys.path.
+    (venv.path / "foo").mkdir()
+    (venv.purelib / "foo.pth").write_text(
+        str(venv.path / "foo") + "\n", encoding="utf-8"
+    )
+    assert str(venv.path / "foo") in venv.sys_path
+    assert check_output.call_count == 1
+
+
 @pytest.mark.parametrize("with_system_site_packages", [True, False])
 def test_env_system_packages(
     tmp_path: Path, poetry: Poetry, with_system_site_packages: bool
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 import logging
 import os
 import sys
@@ -14,7 +15,7 @@ import tomlkit
 from poetry.core.constraints.version import Version
 
 from poetry.toml.file import TOMLFile
-from poetry.utils.env import GET_BASE_PREFIX
+from poetry.utils.env import GET_ENVIRONMENT_SNAPSHOT
 from poetry.utils.env import GET_PYTHON_VERSION_ONELINER
 from poetry.utils.env import EnvManager
 from poetry.utils.env import IncorrectEnvError
@@ -45,12 +46,28 @@ def build_venv(path: Path | str, **__: Any) -> None:
     os.mkdir(str(path))
 
 
+def snapshot_output(version: Version = VERSION_3_7_1) -> str:
+    return json.dumps(
+        {
+            "base_prefix": sys.base_prefix,
+            "marker_env": {
+                "version_info": [version.major, version.minor, version.patch]
+            },
+            "paths": {},
+            "sys_path": [],
+        }
+    )
+
+
 def check_output_wrapper(
     version: Version = VERSION_3_7_1,
 ) -> Callable[[list[str], Any, Any], str]:
     def check_output(cmd: list[str], *args: Any, **kwargs: Any) -> str:
         # cmd is a list, like ["python", "-c", "do stuff"]
         python_cmd = cmd[-1]
+        if python_cmd == GET_ENVIRONMENT_SNAPSHOT:
+            return snapshot_output(version)
+
         if "print(json.dumps(env))" in python_cmd:
             return (
                 f'{{"version_info": [{version.major}, {version.minor},'
@@ -966,12 +983,12 @@ def test_create_venv_tries_to_find_a_compatible_python_executable_using_specific
     mocker.patch(
         "subprocess.check_output",
         side_effect=[
-            sys.base_prefix,
+            snapshot_output(),
             "/usr/bin/python3",
             "3.5.3",
             "/usr/bin/python3.9",
             "3.9.0",
-            sys.base_prefix,
+            snapshot_output(),
         ],
     )
     m = mocker.patch(
@@ -999,7 +1016,7 @@ def test_create_venv_fails_if_no_compatible_python_version_could_be_found(
 
     mocker.patch(
         "subprocess.check_output",
-        side_effect=[sys.base_prefix, "/usr/bin/python", "3.9.0"],
+        side_effect=[snapshot_output(), "/usr/bin/python", "3.9.0"],
     )
     m = mocker.patch(
         "poetry.utils.env.EnvManager.build_venv", side_effect=lambda *args, **kwargs: ""
@@ -1027,7 +1044,7 @@ def test_create_venv_does_not_try_to_find_compatible_versions_with_executable(
 
     poetry.package.python_versions = "^4.8"
 
-    mocker.patch("subprocess.check_output", side_effect=[sys.base_prefix, "3.8.0"])
+    mocker.patch("subprocess.check_output", side_effect=[snapshot_output(), "3.8.0"])
     m = mocker.patch(
         "poetry.utils.env.EnvManager.build_venv", side_effect=lambda *args, **kwargs: ""
     )
@@ -1214,8 +1231,8 @@ def test_create_venv_accepts_fallback_version_w_nonzero_patchlevel(
                 return "3.5.12"
             return "3.7.1"
 
-        if GET_BASE_PREFIX in cmd:
-            return sys.base_prefix
+        if GET_ENVIRONMENT_SNAPSHOT in cmd:
+            return snapshot_output()
 
         return "/usr/bin/python3.5"
 
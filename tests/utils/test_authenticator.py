@@ -2,9 +2,12 @@ from __future__ import annotations
 
 import base64
 import logging
+import os
 import re
+import time
 import uuid
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import TYPE_CHECKING
 from typing import Any
@@ -14,10 +17,13 @@ import pytest
 import requests
 
 from cleo.io.null_io import NullIO
+from filelock import FileLock
+from filelock import Timeout
 from keyring.credentials import SimpleCredential
 
 from poetry.utils.authenticator import Authenticator
 from poetry.utils.authenticator import RepositoryCertificateConfig
+from poetry.utils.cache import prune_caches
 
 
 if TYPE_CHECKING:
@@ -252,6 +258,85 @@ def test_authenticator_request_retries_on_exception(
     assert sleep.call_count == 2
 
 
+def test_authenticator_coalesces_concurrent_requests_of_the_same_url(
+    config: Config, http: type[httpretty.httpretty]
+) -> None:
+    uri = f"https://foo.bar/simple/{uuid.uuid4()!s}/"
+    seen: list[str] = []
+
+    def callback(
+        request: requests.Request, uri: str, response_headers: dict[str, str]
+    ) -> list[int | dict[str, str] | str]:
+        seen.append(uri)
+        # give the other requests the chance to be sent in the meantime
+        time.sleep(0.2)
+        response_headers["Cache-Control"] = "max-age=600"
+        response_headers["ETag"] = '"foo"'
+        return [200, response_headers, "content"]
+
+    http.register_uri(httpretty.GET, uri, body=callback)
+
+    # separate authenticators share the cache like separate processes
+    authenticators = [Authenticator(config, NullIO()) for _ in range(4)]
+    with ThreadPoolExecutor(max_workers=len(authenticators)) as executor:
+        responses = list(
+            executor.map(lambda a: a.request("get", uri).text, authenticators)
+        )
+
+    assert responses == ["content"] * len(authenticators)
+    assert len(seen) == 1
+
+
+def test_authenticator_releases_lock_while_backing_off(
+    mocker: MockerFixture, config: Config, http: type[httpretty.httpretty]
+) -> None:
+    uri = f"https://foo.bar/simple/{uuid.uuid4()!s}/"
+    statuses = [503, 200]
+    http.register_uri(
+        httpretty.GET,
+        uri,
+        responses=[httpretty.Response(body="", status=status) for status in statuses],
+    )
+    locked_while_sleeping: list[bool] = []
+
+    def sleep(delay: float) -> None:
+        (lock_path,) = config.repository_cache_directory.glob("*/_http/_locks/*.lock")
+        try:
+            with FileLock(lock_path, timeout=0):
+                locked_while_sleeping.append(False)
+        except Timeout:
+            locked_while_sleeping.append(True)
+
+    mocker.patch("time.sleep", side_effect=sleep)
+
+    authenticator = Authenticator(config, NullIO())
+    response = authenticator.request("get", uri)
+
+    assert response.status_code == 200
+    assert locked_while_sleeping == [False]
+
+
+def test_authenticator_lock_files_are_pruned(
+    config: Config, http: type[httpretty.httpretty]
+) -> None:
+    uris = [f"https://foo.bar/simple/{uuid.uuid4()!s}/" for _ in range(2)]
+    for uri in uris:
+        http.register_uri(httpretty.GET, uri, body="content")
+
+    authenticator = Authenticator(config, NullIO())
+    authenticator.request("get", uris[0])
+    (old_lock,) = config.repository_cache_directory.glob("*/_http/_locks/*.lock")
+    last_used = time.time() - 10 * 24 * 60 * 60
+    os.utime(old_lock, (last_used, last_used))
+    authenticator.request("get", uris[1])
+
+    prune_caches(config, max_age=7)
+
+    locks = list(config.repository_cache_directory.glob("*/_http/_locks/*.lock"))
+    assert len(locks) == 1
+    assert old_lock not in locks
+
+
 @pytest.mark.filterwarnings("ignore::pytest.PytestUnhandledThreadExceptionWarning")
 def test_authenticator_request_raises_exception_when_attempts_exhausted(
     mocker: MockerFixture, config: Config, http: type[httpretty.httpretty]
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
 import concurrent.futures
+import json
+import os
 import shutil
+import time
 import traceback
 
 from pathlib import Path
@@ -10,11 +13,17 @@ from typing import TypeVar
 
 import pytest
 
+from dulwich.repo import Repo
+from filelock import FileLock
 from packaging.tags import Tag
 from poetry.core.packages.utils.link import Link
 
+from poetry.utils.cache import LAST_USED_RESOLUTION
 from poetry.utils.cache import ArtifactCache
+from poetry.utils.cache import CacheEntry
 from poetry.utils.cache import FileCache
+from poetry.utils.cache import prune_cache_entries
+from poetry.utils.cache import prune_caches
 from poetry.utils.env import MockEnv
 
 
@@ -58,6 +67,21 @@ def test_cache_get_put_has(repository_cache_dir: Path) -> None:
     assert not cache.has("key3")
 
 
+def test_cache_put_is_atomic(
+    poetry_file_cache: FileCache[Any], mocker: MockerFixture
+) -> None:
+    poetry_file_cache.put("key", "value")
+
+    # Until the new item is complete, readers still see the previous one.
+    mocker.patch("pathlib.Path.replace", side_effect=OSError)
+    with pytest.raises(OSError):
+        poetry_file_cache.put("key", "other value")
+
+    assert poetry_file_cache.get("key") == "value"
+    # the incomplete item is not left behind
+    assert len(list(poetry_file_cache.path.rglob(".*"))) == 0
+
+
 def test_cache_forget(repository_cache_dir: Path) -> None:
     cache: FileCache[Any] = FileCache(repository_cache_dir / "cache")
     cache.put("key1", "value")
@@ -191,6 +215,34 @@ def test_get_cache_directory_for_link(tmp_path: Path) -> None:
     assert directory == expected
 
 
+def test_get_cache_directory_for_directory(tmp_path: Path) -> None:
+    cache = ArtifactCache(cache_dir=tmp_path / "cache")
+    root = tmp_path / "root"
+    root.mkdir()
+    Repo.init(str(root))
+    (root / ".gitignore").write_text("vendor/\n", encoding="utf-8")
+    projects = [root / "a", root / "b", root / "vendor" / "a", root / "vendor" / "b"]
+    for project in projects:
+        project.mkdir(parents=True)
+        (project / "pyproject.toml").write_text(project.name, encoding="utf-8")
+    (root / "empty").mkdir()
+
+    # directories with the same content at different locations are not mixed up
+    assert cache.get_cache_directory_for_directory(projects[0]) is not None
+    assert cache.get_cache_directory_for_directory(
+        projects[0]
+    ) != cache.get_cache_directory_for_directory(projects[1])
+    (projects[1] / "pyproject.toml").write_text("a", encoding="utf-8")
+    assert cache.get_cache_directory_for_directory(
+        projects[0]
+    ) != cache.get_cache_directory_for_directory(projects[1])
+
+    # ignored and empty directories cannot be identified by their content
+    assert cache.get_cache_directory_for_directory(projects[2]) is None
+    assert cache.get_cache_directory_for_directory(projects[3]) is None
+    assert cache.get_cache_directory_for_directory(root / "empty") is None
+
+
 @pytest.mark.parametrize("subdirectory", [None, "subdir"])
 def test_get_cache_directory_for_git(tmp_path: Path, subdirectory: str | None) -> None:
     cache = ArtifactCache(cache_dir=tmp_path)
@@ -367,3 +419,140 @@ def test_get_cached_archive_for_git() -> None:
     cache = ArtifactCache(cache_dir=Path())
     archive = cache.get_cached_archive_for_git("url", "ref", "subdirectory", MockEnv())
     assert archive is None
+
+
+def test_record_archive_hash(tmp_path: Path) -> None:
+    cache = ArtifactCache(cache_dir=tmp_path)
+    cache_dir = cache.get_cache_directory_for_link(
+        Link("https://files.pythonhosted.org/demo-0.1.0.tar.gz")
+    )
+    cache_dir.mkdir(parents=True)
+    archive = cache_dir / "demo-0.1.0.tar.gz"
+    archive.write_bytes(b"content")
+
+    assert cache.get_archive_hash(archive, "sha256") is None
+
+    cache.record_archive_hash(archive, "sha256", "1234")
+    cache.record_archive_hash(archive, "md5", "abcd")
+
+    assert cache.get_archive_hash(archive, "sha256") == "1234"
+    assert cache.get_archive_hash(archive, "md5") == "abcd"
+    assert cache.get_archive_hash(archive, "sha512") is None
+
+    # A modified archive must be hashed again.
+    archive.write_bytes(b"modified content")
+    assert cache.get_archive_hash(archive, "sha256") is None
+
+
+def test_record_archive_hash_ignores_archives_outside_of_cache(
+    tmp_path: Path,
+) -> None:
+    cache = ArtifactCache(cache_dir=tmp_path / "cache")
+    archive = tmp_path / "demo-0.1.0.tar.gz"
+    archive.write_bytes(b"content")
+
+    cache.record_archive_hash(archive, "sha256", "1234")
+
+    assert cache.get_archive_hash(archive, "sha256") is None
+    assert not list(tmp_path.glob("*.json"))
+
+
+def test_cached_archives_are_indexed(
+    tmp_path: Path, fixture_dir: FixtureDirGetter, mocker: MockerFixture
+) -> None:
+    env = MockEnv(supported_tags=[Tag("py3", "none", "any")])
+    cache = ArtifactCache(cache_dir=tmp_path)
+    link = Link("https://files.pythonhosted.org/demo-0.1.0.tar.gz")
+    cache_dir = cache.get_cache_directory_for_link(link)
+    cache_dir.mkdir(parents=True)
+    distributions = fixture_dir("distributions")
+    shutil.copy(distributions / "demo-0.1.0.tar.gz", cache_dir)
+    find_archives = mocker.spy(ArtifactCache, "_find_archives")
+
+    assert cache.get_cached_archive_for_link(link, strict=False, env=env) == (
+        cache_dir / "demo-0.1.0.tar.gz"
+    )
+    assert find_archives.call_count == 1
+
+    # Lookups in the same or in another process use the index.
+    for artifact_cache in (cache, ArtifactCache(cache_dir=tmp_path)):
+        assert artifact_cache.get_cached_archive_for_link(
+            link, strict=True, env=env
+        ) == (cache_dir / "demo-0.1.0.tar.gz")
+    assert find_archives.call_count == 1
+
+    # The index is updated when archives are added.
+    shutil.copy(distributions / "demo-0.1.0-py2.py3-none-any.whl", cache_dir)
+    assert cache.get_cached_archive_for_link(link, strict=False, env=env) == (
+        cache_dir / "demo-0.1.0-py2.py3-none-any.whl"
+    )
+    index = json.loads(cache_dir.with_name(f"{cache_dir.name}.json").read_text())
+    assert index["archives"]["demo-0.1.0-py2.py3-none-any.whl"]["tags"] == [
+        "py2-none-any",
+        "py3-none-any",
+    ]
+
+
+def test_prune_cache_entries(tmp_path: Path) -> None:
+    now = time.time()
+    entries = []
+    for i, days in enumerate([10, 5, 3, 1]):
+        path = tmp_path / f"entry{i}.json"
+        path.write_bytes(b"x" * 100)
+        entries.append(CacheEntry((path,), 100, now - days * 24 * 60 * 60))
+
+    removed = prune_cache_entries(entries, max_age=7 * 24 * 60 * 60)
+    assert removed == entries[:1]
+
+    removed = prune_cache_entries(entries[1:], max_size=150)
+    assert removed == entries[1:3]
+
+    assert [path.name for path in tmp_path.glob("entry*")] == ["entry3.json"]
+
+
+def test_prune_caches_skips_if_caches_are_pruned_concurrently(
+    config: Config, poetry_file_cache: FileCache[Any]
+) -> None:
+    config.merge({"cache": {"max-size": 0}})
+    poetry_file_cache.put("key", "value")
+    lock = FileLock(Path(config.get("cache-dir")) / ".prune.lock")
+
+    with lock:
+        assert prune_caches(config) == []
+    assert poetry_file_cache.has("key")
+
+    assert len(prune_caches(config)) == 1
+    assert not poetry_file_cache.has("key")
+
+
+def test_file_cache_tracks_last_use(repository_cache_dir: Path) -> None:
+    cache: FileCache[str] = FileCache(path=repository_cache_dir)
+    cache.put("foo", "bar")
+    (entry,) = cache.get_entries()
+    last_used = time.time() - 2 * LAST_USED_RESOLUTION
+    os.utime(entry.paths[0], (last_used, last_used))
+
+    assert cache.get("foo") == "bar"
+
+    (entry,) = cache.get_entries()
+    assert entry.last_used > last_used + LAST_USED_RESOLUTION
+
+
+def test_artifact_cache_tracks_last_use(tmp_path: Path) -> None:
+    cache = ArtifactCache(cache_dir=tmp_path)
+    link = Link("https://files.pythonhosted.org/demo-0.1.0.tar.gz")
+    cache_dir = cache.get_cache_directory_for_link(link)
+    cache_dir.mkdir(parents=True)
+    (cache_dir / "demo-0.1.0.tar.gz").write_bytes(b"content")
+
+    (entry,) = cache.get_entries()
+    assert entry.paths == (cache_dir, cache_dir.with_name(f"{cache_dir.name}.json"))
+    assert entry.size == len(b"content")
+
+    assert cache.get_cached_archive_for_link(link, strict=True)
+
+    (used_entry,) = ArtifactCache(cache_dir=tmp_path).get_entries()
+    assert used_entry.last_used >= entry.last_used
+
+    used_entry.remove()
+    assert not list(tmp_path.glob("*/*/*/*"))
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import base64
 import re
+import threading
+import time
 
 from typing import TYPE_CHECKING
 from typing import Any
@@ -16,6 +18,7 @@ from poetry.utils.helpers import HTTPRangeRequestSupportedError
 from poetry.utils.helpers import download_file
 from poetry.utils.helpers import get_file_hash
 from poetry.utils.helpers import get_highest_priority_hash_type
+from poetry.utils.helpers import synchronized_lru_cache
 
 
 if TYPE_CHECKING:
@@ -183,6 +186,39 @@ def test_download_file_recover_from_error(
     assert http.last_request().headers["Range"] == f"bytes={file_length // 2}-"
 
 
+def test_downloader_computes_hash_while_downloading(
+    http: type[httpretty], fixture_dir: FixtureDirGetter, tmp_path: Path
+) -> None:
+    file_path = fixture_dir("distributions") / "demo-0.1.0.tar.gz"
+    url = "https://foo.com/demo-0.1.0.tar.gz"
+    http.register_uri(http.GET, url, body=file_path.read_bytes())
+    dest = tmp_path / "demo-0.1.0.tar.gz"
+
+    downloader = Downloader(url, dest, hash_name="sha256")
+    for _ in downloader.download_with_progress(downloader.chunk_size):
+        pass
+
+    expect_sha_256 = "9fa123ad707a5c6c944743bf3e11a0e80d86cb518d3cf25320866ca3ef43e2ad"
+    assert downloader.hash == expect_sha_256
+    assert get_file_hash(dest) == expect_sha_256
+
+
+@pytest.mark.parametrize(
+    ("content_length", "expected"),
+    [(0, 4096), (100_000, 4096), (10_000_000, 100_000), (1_000_000_000, 1048576)],
+)
+def test_downloader_chunk_size(
+    http: type[httpretty], tmp_path: Path, content_length: int, expected: int
+) -> None:
+    url = "https://foo.com/demo-0.1.0.tar.gz"
+    http.register_uri(http.GET, url, body=b"")
+
+    downloader = Downloader(url, tmp_path / "demo-0.1.0.tar.gz")
+    downloader.total_size = content_length
+
+    assert downloader.chunk_size == expected
+
+
 def test_download_file_fail_when_no_range(
     http: type[httpretty], fixture_dir: FixtureDirGetter, tmp_path: Path
 ) -> None:
@@ -299,3 +335,26 @@ def test_downloader_uses_authenticator_by_default(
     request = http.last_request()
     basic_auth = base64.b64encode(b"bar:baz").decode()
     assert request.headers["Authorization"] == f"Basic {basic_auth}"
+
+
+def test_synchronized_lru_cache_calls_function_once_for_concurrent_calls() -> None:
+    calls: list[str] = []
+
+    def get(name: str) -> str:
+        calls.append(name)
+        time.sleep(0.05)
+        return name.upper()
+
+    cached_get = synchronized_lru_cache(get)
+    results: list[str] = []
+    threads = [
+        threading.Thread(target=lambda: results.append(cached_get("foo")))
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == ["FOO"] * 4
+    assert calls == ["foo"]
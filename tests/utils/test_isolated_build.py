@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 import shutil
 import sys
 
@@ -13,7 +14,9 @@ from poetry.puzzle.exceptions import SolverProblemError
 from poetry.puzzle.provider import IncompatibleConstraintsError
 from poetry.repositories import RepositoryPool
 from poetry.repositories.installed_repository import InstalledRepository
+from poetry.utils.cache import prune_cache_entries
 from poetry.utils.env import ephemeral_environment
+from poetry.utils.isolated_build import BuildEnvironmentCache
 from poetry.utils.isolated_build import IsolatedBuildInstallError
 from poetry.utils.isolated_build import IsolatedEnv
 from poetry.utils.isolated_build import isolated_builder
@@ -25,6 +28,7 @@ if TYPE_CHECKING:
 
     from pytest_mock import MockerFixture
 
+    from poetry.config.config import Config
     from poetry.repositories.pypi_repository import PyPiRepository
     from tests.types import FixtureDirGetter
 
@@ -95,3 +99,102 @@ def test_isolated_builder_outside_poetry_project_context(
             builder.metadata_path(destination)
     except RuntimeError:
         pytest.fail("Isolated builder did not fallback to default repository pool")
+
+
+def test_isolated_builder_reuses_build_environments(
+    tmp_working_directory: Path,
+    fixture_dir: FixtureDirGetter,
+    mocker: MockerFixture,
+    config: Config,
+) -> None:
+    source = tmp_working_directory / "source"
+    shutil.copytree(fixture_dir("project_with_setup"), source)
+    spy = mocker.spy(IsolatedEnv, "install")
+
+    with isolated_builder(source, "wheel") as builder:
+        builder.metadata_path(tmp_working_directory / "first")
+
+    # The additional requirements of the build
+    # are installed into the same environment.
+    install_count = spy.call_count
+    assert install_count == 2
+    cache = BuildEnvironmentCache(config.build_environments_cache_directory)
+    assert len(cache.get_entries()) == 1
+
+    with isolated_builder(source, "wheel") as builder:
+        builder.metadata_path(tmp_working_directory / "second")
+
+    assert spy.call_count == install_count
+    assert len(cache.get_entries()) == 1
+
+
+def test_build_environment_cache_uses_environments_exclusively(
+    tmp_path: Path, pool: RepositoryPool, mocker: MockerFixture
+) -> None:
+    mocker.patch.object(IsolatedEnv, "install")
+    cache = BuildEnvironmentCache(tmp_path / "build-environments")
+    python = Path(sys.executable)
+
+    with cache.use(python, {"a"}, pool) as env:
+        # Concurrent builds get another environment.
+        with cache.use(python, {"a"}, pool) as other_env:
+            assert other_env.path != env.path
+
+        # Environments in use are not removed.
+        entries = cache.get_entries()
+        assert len(entries) == 2
+        assert prune_cache_entries(entries, max_age=0) == [
+            entry for entry in entries if entry.paths[0] != env.path.parent
+        ]
+        assert env.path.exists()
+
+    with cache.use(python, {"a"}, pool) as other_env:
+        assert other_env.path == env.path
+
+
+def test_build_environment_cache_synchronizes_additional_requirements(
+    tmp_path: Path, pool: RepositoryPool, config: Config, mocker: MockerFixture
+) -> None:
+    install = mocker.patch.object(IsolatedEnv, "install")
+    cache = BuildEnvironmentCache(tmp_path / "build-environments")
+    python = Path(sys.executable)
+
+    with cache.use(python, {"a"}, pool, config) as env:
+        assert env._config is config
+        install.reset_mock()
+
+        cache.install(env, {"x"})
+        install.assert_called_once_with(["a", "x"], synchronize=True)
+
+        # nothing is installed if the environment has exactly these requirements
+        cache.install(env, {"x"})
+        install.assert_called_once()
+
+        # requirements of a previous build are removed for the next one
+        cache.install(env, [])
+        assert install.call_args == mocker.call(["a"], synchronize=True)
+
+
+def test_build_environment_cache_removes_least_recently_used_environments(
+    tmp_path: Path, pool: RepositoryPool, mocker: MockerFixture
+) -> None:
+    mocker.patch.object(BuildEnvironmentCache, "MAX_ENVIRONMENTS", 2)
+    mocker.patch.object(IsolatedEnv, "install")
+    cache = BuildEnvironmentCache(tmp_path / "build-environments")
+    python = Path(sys.executable)
+
+    with cache.use(python, {"a"}, pool) as env:
+        first = env.path
+    with cache.use(python, {"b"}, pool):
+        pass
+    # using the first environment again makes the second one the least recently used
+    index = first.parent / BuildEnvironmentCache.INDEX_FILE
+    os.utime(index, (index.stat().st_atime, index.stat().st_mtime + 10))
+    with cache.use(python, {"a"}, pool) as env:
+        assert env.path == first
+    with cache.use(python, {"c"}, pool):
+        pass
+
+    entries = cache.get_entries()
+    assert len(entries) == 2
+    assert first.parent in {entry.paths[0] for entry in entries}
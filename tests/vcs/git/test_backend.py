@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+from pathlib import Path
 from typing import TYPE_CHECKING
 from unittest.mock import MagicMock
 
 import pytest
 
+from dulwich import porcelain
+from dulwich.index import IndexEntry
+from dulwich.objects import S_IFGITLINK
 from dulwich.repo import Repo
 
 from poetry.vcs.git.backend import Git
@@ -14,7 +18,7 @@ from poetry.vcs.git.backend import urlpathjoin
 
 
 if TYPE_CHECKING:
-    from pathlib import Path
+    from pytest_mock import MockerFixture
 
     from tests.vcs.git.git_fixture import TempRepoFixture
 
@@ -107,3 +111,146 @@ def test_short_sha_not_in_head(tmp_path: Path, temp_repo: TempRepoFixture) -> No
 
     target_dir = source_root_dir / "clone-test"
     assert (target_dir / ".git").is_dir()
+
+
+@pytest.mark.skip_git_mock
+def test_clone_uses_shared_mirror(
+    tmp_path: Path, temp_repo: TempRepoFixture, mocker: MockerFixture
+) -> None:
+    url = temp_repo.path.as_uri()
+    spy = mocker.spy(Git, "_fetch_remote_refs")
+
+    Git.clone(url=url, source_root=tmp_path / "clones-1", name="clone-test")
+    assert spy.call_count == 1
+
+    # fresh refs of the mirror are used without fetching them again
+    repo = Git.clone(url=url, source_root=tmp_path / "clones-2", name="clone-test")
+    assert spy.call_count == 1
+    assert Git.get_revision(repo) == temp_repo.head_commit
+
+    # revisions in the mirror are cloned without fetching, even if it is not fresh
+    mocker.patch.object(Git, "MIRROR_MAX_AGE", 0)
+    repo = Git.clone(
+        url=url,
+        source_root=tmp_path / "clones-3",
+        name="clone-test",
+        revision=temp_repo.middle_commit,
+    )
+    assert spy.call_count == 1
+    assert Git.get_revision(repo) == temp_repo.middle_commit
+
+    # branches are fetched again if the mirror is not fresh
+    (temp_repo.path / "new").write_text("new", encoding="utf-8")
+    temp_repo.repo.stage(["new"])
+    new_commit = temp_repo.repo.do_commit(
+        committer=b"User <user@example.com>",
+        author=b"User <user@example.com>",
+        message=b"new",
+        no_verify=True,
+    )
+    repo = Git.clone(url=url, source_root=tmp_path / "clones-4", name="clone-test")
+    assert spy.call_count == 2
+    assert Git.get_revision(repo) == new_commit.decode()
+    assert len(list(Git.get_mirror_root().glob("*.git"))) == 1
+
+
+@pytest.mark.skip_git_mock
+def test_mirror_entries_are_not_removed_while_locked(
+    tmp_path: Path, temp_repo: TempRepoFixture
+) -> None:
+    url = temp_repo.path.as_uri()
+    Git.clone(url=url, source_root=tmp_path / "clones", name="clone-test")
+
+    (entry,) = Git.get_mirror_entries(Git.get_mirror_root())
+    assert entry.paths == (Git._get_mirror_path(url),)
+    assert entry.size > 0
+
+    with Git._lock_mirror(url):
+        assert not entry.remove()
+    assert entry.paths[0].exists()
+
+    assert entry.remove()
+    assert not entry.paths[0].exists()
+
+    # a removed mirror is fetched again
+    repo = Git.clone(url=url, source_root=tmp_path / "clones-2", name="clone-test")
+    assert Git.get_revision(repo) == temp_repo.head_commit
+
+
+def _create_repo(path: Path, submodules: dict[str, Repo] | None = None) -> Repo:
+    repo = Repo.init(str(path), mkdir=True)
+    (path / "file").write_text(path.name, encoding="utf-8")
+    repo.stage(["file"])
+
+    for name, submodule in (submodules or {}).items():
+        porcelain.submodule_add(repo, Path(submodule.path).as_uri(), path=name)  # type: ignore[no-untyped-call]
+        repo.stage([".gitmodules"])
+        index = repo.open_index()
+        index[name.encode()] = IndexEntry(
+            ctime=0,
+            mtime=0,
+            dev=0,
+            ino=0,
+            mode=S_IFGITLINK,
+            uid=0,
+            gid=0,
+            size=0,
+            sha=submodule.head(),
+        )
+        index.write()
+
+    repo.do_commit(
+        committer=b"User <user@example.com>",
+        author=b"User <user@example.com>",
+        message=b"init",
+        no_verify=True,
+    )
+    return repo
+
+
+@pytest.mark.skip_git_mock
+def test_clone_submodules_recursively(tmp_path: Path, mocker: MockerFixture) -> None:
+    nested = _create_repo(tmp_path / "nested")
+    first = _create_repo(tmp_path / "first", {"nested": nested})
+    second = _create_repo(tmp_path / "second")
+    parent = _create_repo(tmp_path / "parent", {"first": first, "libs/second": second})
+    spy = mocker.spy(Git, "_clone_submodule")
+
+    repo = Git.clone(
+        url=Path(parent.path).as_uri(), source_root=tmp_path / "clones", name="clone"
+    )
+
+    target = Path(repo.path)
+    assert (target / "first" / "file").read_text(encoding="utf-8") == "first"
+    assert (target / "first" / "nested" / "file").read_text(
+        encoding="utf-8"
+    ) == "nested"
+    assert (target / "libs" / "second" / "file").read_text(encoding="utf-8") == "second"
+    assert spy.call_count == 3
+
+
+def test_get_source_files(tmp_path: Path) -> None:
+    assert Git.get_source_files(tmp_path) is None
+
+    Repo.init(str(tmp_path))
+    (tmp_path / ".gitignore").write_text("build/\n*.pyc\n", encoding="utf-8")
+    (tmp_path / "package").mkdir()
+    (tmp_path / "package" / "__init__.py").touch()
+    (tmp_path / "package" / "__init__.pyc").touch()
+    (tmp_path / "build").mkdir()
+    (tmp_path / "build" / "artifact").touch()
+
+    assert Git.get_source_files(tmp_path / "package") == [
+        tmp_path / "package" / "__init__.py"
+    ]
+    assert Git.get_source_files(tmp_path) == [
+        tmp_path / ".gitignore",
+        tmp_path / "package" / "__init__.py",
+    ]
+
+    # ignored and empty directories do not have source files
+    (tmp_path / "build" / "package").mkdir()
+    (tmp_path / "build" / "package" / "__init__.py").touch()
+    (tmp_path / "empty").mkdir()
+    assert Git.get_source_files(tmp_path / "build" / "package") is None
+    assert Git.get_source_files(tmp_path / "empty") is None